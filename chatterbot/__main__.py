@@ -5,4 +5,18 @@ if __name__ == '__main__':
     import chatterbot
 
     if '--version' in sys.argv:
-        print(chatterbot.__version__)
\ No newline at end of file
+        print(chatterbot.__version__)
+
+    if '--backfill' in sys.argv:
+        # Load the chat bot from a configuration file so that the annotators
+        # used by its logic adapters are registered with the storage adapter
+        config_file_path = sys.argv[sys.argv.index('--backfill') + 1]
+
+        chatbot = chatterbot.ChatBot.from_config(config_file_path)
+        chatbot.storage.backfill()
+
+    if '--migrate' in sys.argv:
+        config_file_path = sys.argv[sys.argv.index('--migrate') + 1]
+
+        chatbot = chatterbot.ChatBot.from_config(config_file_path)
+        chatbot.storage.migrate()
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 from .logic_adapter import LogicAdapter
+from chatterbot.conversation import Statement
+from chatterbot.utils.module_loading import import_module
 
 
 class BaseMatchAdapter(LogicAdapter):
@@ -8,6 +10,34 @@ class BaseMatchAdapter(LogicAdapter):
     ClosestMeaning adapters.
     """
 
+    def __init__(self, **kwargs):
+        super(BaseMatchAdapter, self).__init__(**kwargs)
+
+        # An index class used to shortlist statements before comparing them
+        self.candidate_index = kwargs.get('candidate_index')
+        if isinstance(self.candidate_index, str):
+            self.candidate_index = import_module(self.candidate_index)
+
+        # The maximum number of statements selected from the index
+        self.candidate_limit = kwargs.get('candidate_limit', 100)
+
+    def set_context(self, context):
+        """
+        Set the context and register the comparison function's
+        annotator and the candidate index, if one is being used,
+        with the storage adapter.
+        """
+        super(BaseMatchAdapter, self).set_context(context)
+
+        if self.has_storage_context:
+            # Save data used by the comparison function when statements are updated
+            annotate = getattr(self.compare_statements, 'annotate', None)
+            if annotate:
+                self.context.storage.add_annotator(annotate)
+
+            if self.candidate_index:
+                self.context.storage.add_index(self.candidate_index)
+
     @property
     def has_storage_context(self):
         """
@@ -15,14 +45,64 @@ class BaseMatchAdapter(LogicAdapter):
         """
         return self.context and self.context.storage
 
+    def get_candidates(self, input_statement):
+        """
+        Return the statements with known responses that the input
+        statement will be compared to. When a candidate index is set,
+        only the statements ranked highest by the index are returned.
+        Otherwise the statements may be read from the database as
+        they are iterated over.
+        """
+        if self.candidate_index:
+            statement_list = self.context.storage.search_index(
+                self.candidate_index,
+                input_statement,
+                self.candidate_limit
+            )
+
+            if statement_list:
+                return statement_list
+
+        # Only the extra data that the comparison function reads needs to be loaded
+        return self.context.storage.iter_response_statements(
+            getattr(self.compare_statements, 'extra_data_keys', None)
+        )
+
     def get(self, input_statement):
         """
         Takes a statement string and a list of statement strings.
         Returns the closest matching statement from the list.
         """
-        statement_list = self.context.storage.get_response_statements()
+        statements = self.get_candidates(input_statement)
 
-        if not statement_list:
+        closest_match = input_statement
+        max_confidence = 0
+        has_candidates = False
+
+        # Use the comparison function's batch method if it has one
+        compare_batch = getattr(self.compare_statements, 'batch', None)
+
+        if compare_batch:
+            statement_list = list(statements)
+            has_candidates = bool(statement_list)
+
+            if has_candidates:
+                confidence, index = compare_batch(input_statement, statement_list)
+
+                if index is not None:
+                    max_confidence = confidence
+                    closest_match = statement_list[index]
+        else:
+            # Find the closest matching known statement
+            for statement in statements:
+                has_candidates = True
+                confidence = self.compare_statements(input_statement, statement)
+
+                if confidence > max_confidence:
+                    max_confidence = confidence
+                    closest_match = statement
+
+        if not has_candidates:
             if self.has_storage_context:
                 # Use a randomly picked statement
                 self.logger.info(
@@ -33,17 +113,6 @@ class BaseMatchAdapter(LogicAdapter):
             else:
                 raise self.EmptyDatasetException()
 
-        closest_match = input_statement
-        max_confidence = 0
-
-        # Find the closest matching known statement
-        for statement in statement_list:
-            confidence = self.compare_statements(input_statement, statement)
-
-            if confidence > max_confidence:
-                max_confidence = confidence
-                closest_match = statement
-
         return max_confidence, closest_match
 
     def can_process(self, statement):
@@ -61,8 +130,12 @@ class BaseMatchAdapter(LogicAdapter):
             input_statement.text, closest_match.text
         ))
 
-        # Save any updates made to the statement by the logic adapter
-        self.context.storage.update(closest_match)
+        # Save the data that the comparison function added to the statement.
+        # Its responses are not written back, so that responses learned since
+        # it was read, by other threads or processes, are not overwritten.
+        self.context.storage.bulk_update([
+            Statement(closest_match.text, extra_data=dict(closest_match.extra_data))
+        ])
 
         # Get all statements that are in response to the closest match
         response_list = self.context.storage.filter(
@@ -44,6 +44,12 @@ class LogicAdapter(Adapter):
             get_first_response
         )
 
+        # Responses may be reused for the same input if the chat bot caches responses
+        self.cache_responses = True
+
+        # The number of seconds to wait for a response when adapters run in threads
+        self.process_timeout = kwargs.get('process_timeout')
+
     def can_process(self, statement):
         """
         A preliminary check that is called to determine if a
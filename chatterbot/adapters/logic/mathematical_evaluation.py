@@ -1,5 +1,6 @@
 from chatterbot.adapters.logic import LogicAdapter
 from chatterbot.conversation import Statement
+from chatterbot.utils.cache import LRUCache
 import re
 import os
 import json
@@ -27,6 +28,10 @@ class MathematicalEvaluation(LogicAdapter):
         language = kwargs.get('math_words_language', 'english')
         self.math_words = self.get_language_data(language)
 
+        # The result of evaluating each recent input, so that an input that
+        # was evaluated by can_process is not evaluated again by process
+        self.results = LRUCache(maxsize=100)
+
     def get_language_data(self, language):
         """
         Load language-specific data
@@ -66,6 +71,22 @@ class MathematicalEvaluation(LogicAdapter):
         """
         input_text = statement.text
 
+        result = self.results.get(input_text)
+
+        if result is None:
+            result = self.evaluate(input_text)
+            self.results.set(input_text, result)
+
+        confidence, expression = result
+
+        return confidence, Statement(expression)
+
+    def evaluate(self, input_text):
+        """
+        Returns a confidence of 1 and the solved expression if the input
+        text contains an expression that can be evaluated, otherwise a
+        confidence of 0 and the expression that was found.
+        """
         # Getting the mathematical terms within the input statement
         expression = str(self.simplify_chunks(self.normalize(input_text)))
 
@@ -74,9 +95,9 @@ class MathematicalEvaluation(LogicAdapter):
             expression += "= " + str(eval(expression))
 
             # return a confidence of 1 if the expression could be evaluated
-            return 1, Statement(expression)
+            return 1, expression
         except:
-            return 0, Statement(expression)
+            return 0, expression
 
     def simplify_chunks(self, input_text):
         """
@@ -15,37 +15,54 @@ class MultiLogicAdapter(LogicAdapter):
 
         self.adapters = []
 
+        # The number of threads used to run the adapters at the same time
+        self.threads = kwargs.get('logic_adapter_threads', 0)
+
+        self.pool = None
+
+        # The unfinished calls of adapters that did not respond in time,
+        # which still hold one of the threads in the pool
+        self.unfinished = {}
+
+        # Stop running adapters once one selects a response with this confidence
+        self.confidence_threshold = kwargs.get('confidence_threshold')
+
+        # The average number of seconds that each adapter has taken to run
+        self.costs = {}
+
     def process(self, statement):
         """
         Returns the outout of a selection of logic adapters
         for a given input statement.
 
+        :param statement: The input statement to be processed.
+        """
+        confidence, result, adapters = self.get_result(statement)
+
+        return confidence, result
+
+    def get_result(self, statement):
+        """
+        Returns the confidence and the response selected for a given input
+        statement, along with a list of the logic adapters that selected
+        the response.
+
         :param statement: The input statement to be processed.
         """
         results = []
         result = None
         max_confidence = -1
 
-        for adapter in self.adapters:
-            if adapter.can_process(statement):
-                confidence, output = adapter.process(statement)
-                results.append((confidence, output, ))
+        for adapter, output in self.get_adapter_results(statement):
+            if output is None:
+                continue
 
-                self.logger.info(
-                    u'{} selected "{}" as a response with a confidence of {}'.format(
-                         str(adapter.__class__), output.text, confidence
-                    )
-                )
+            confidence, output = output
+            results.append((confidence, output, adapter, ))
 
-                if confidence > max_confidence:
-                    result = output
-                    max_confidence = confidence
-            else:
-                self.logger.info(
-                    u'Not processing the statement using {}'.format(
-                        str(adapter.__class__)
-                    )
-                )
+            if confidence > max_confidence:
+                result = output
+                max_confidence = confidence
 
         # If multiple adapters agree on the same statement,
         # then that statement is more likely to be the correct response
@@ -57,7 +74,197 @@ class MultiLogicAdapter(LogicAdapter):
                 result = most_common[0][0]
                 max_confidence = self.get_greatest_confidence(result, results)
 
-        return max_confidence, result
+        adapters = [option[2] for option in results if option[1] == result]
+
+        return max_confidence, result, adapters
+
+    def get_adapter_results(self, statement):
+        """
+        Returns a list of each adapter paired with the confidence and the
+        response that it selected, in the order that the adapters were added.
+        The result is None for adapters that cannot process the statement,
+        for adapters that did not finish before their process_timeout, and
+        for adapters that are still running from a previous statement.
+
+        If a confidence threshold is set and the adapters are not run in
+        threads, the adapters with the lowest cost are run first, and no
+        more adapters are run once a response has a confidence of at least
+        the threshold. The order that the adapters were run in only decides
+        which of them are run, so that ties between responses do not depend
+        on how long each adapter has taken.
+
+        :param statement: The input statement to be processed.
+        """
+        if not self.threads:
+            results = []
+
+            for adapter in self.get_scheduled_adapters():
+                result = self.process_adapter(adapter, statement)
+                results.append((adapter, result, ))
+
+                if self.confidence_threshold is not None and result is not None:
+                    if result[0] >= self.confidence_threshold:
+                        break
+
+            order = dict((adapter, index) for index, adapter in enumerate(self.adapters))
+            results.sort(key=lambda item: order[item[0]])
+
+            return results
+
+        from multiprocessing import TimeoutError
+        from time import time
+
+        pool = self.get_pool()
+        started = time()
+
+        # The query that filters generated is only set for the current thread
+        base_query = self.context.storage.base_query
+
+        pending = []
+
+        for adapter in self.adapters:
+            unfinished_result = self.unfinished.get(adapter)
+
+            # An adapter is not run again until its previous call has
+            # finished, so a slow adapter cannot use up every thread
+            if unfinished_result is not None and not unfinished_result.ready():
+                self.logger.warning(
+                    u'{} is skipped until its previous call has finished'.format(
+                        str(adapter.__class__)
+                    )
+                )
+                pending.append((adapter, None, ))
+                continue
+
+            self.unfinished.pop(adapter, None)
+
+            pending.append((adapter, pool.apply_async(
+                self.process_adapter_with_query, (adapter, statement, base_query, )
+            ), ))
+
+        results = []
+
+        for adapter, pending_result in pending:
+            if pending_result is None:
+                results.append((adapter, None, ))
+                continue
+
+            timeout = None
+
+            # The timeout is counted from when processing the statement started
+            if adapter.process_timeout is not None:
+                timeout = max(0, started + adapter.process_timeout - time())
+
+            try:
+                results.append((adapter, pending_result.get(timeout), ))
+            except TimeoutError:
+                self.logger.warning(
+                    u'{} did not select a response within {} seconds'.format(
+                        str(adapter.__class__), adapter.process_timeout
+                    )
+                )
+                self.unfinished[adapter] = pending_result
+                results.append((adapter, None, ))
+
+        return results
+
+    def get_scheduled_adapters(self):
+        """
+        Returns the adapters in the order that they should be run. When a
+        confidence threshold is set, adapters are ordered by their average
+        cost, and adapters that have not been run yet are run first, in the
+        order that they were added, so that their cost can be measured.
+        """
+        if self.confidence_threshold is None:
+            return list(self.adapters)
+
+        order = dict((adapter, index) for index, adapter in enumerate(self.adapters))
+
+        return sorted(
+            self.adapters,
+            key=lambda adapter: (self.costs.get(adapter, 0), order[adapter], )
+        )
+
+    def record_cost(self, adapter, seconds, weight=0.2):
+        """
+        Update the average number of seconds that an adapter takes to run.
+        Recent runs are given more weight, so that the average follows
+        changes such as the database growing.
+        """
+        if adapter in self.costs:
+            self.costs[adapter] += weight * (seconds - self.costs[adapter])
+        else:
+            self.costs[adapter] = seconds
+
+    def process_adapter(self, adapter, statement):
+        """
+        Returns the confidence and the response selected by an adapter,
+        or None if the adapter cannot process the statement.
+        """
+        from time import time
+
+        started = time()
+
+        try:
+            return self.run_adapter(adapter, statement)
+        finally:
+            self.record_cost(adapter, time() - started)
+
+    def process_adapter_with_query(self, adapter, statement, base_query):
+        """
+        Process the statement with an adapter using the given base query.
+        This is used to run adapters in other threads with the query that
+        the chat bot's filters generated, which is restored afterwards.
+        """
+        storage = self.context.storage
+        previous_query = storage.base_query
+        storage.base_query = base_query
+
+        try:
+            return self.process_adapter(adapter, statement)
+        finally:
+            storage.base_query = previous_query
+
+    def run_adapter(self, adapter, statement):
+        if not adapter.can_process(statement):
+            self.logger.info(
+                u'Not processing the statement using {}'.format(
+                    str(adapter.__class__)
+                )
+            )
+            return None
+
+        confidence, output = adapter.process(statement)
+
+        self.logger.info(
+            u'{} selected "{}" as a response with a confidence of {}'.format(
+                 str(adapter.__class__), output.text, confidence
+            )
+        )
+
+        return confidence, output
+
+    def get_pool(self):
+        """
+        Returns the pool of threads used to run the adapters,
+        creating it the first time it is needed.
+        """
+        from multiprocessing.pool import ThreadPool
+
+        if self.pool is None:
+            self.pool = ThreadPool(self.threads)
+
+        return self.pool
+
+    def close(self):
+        """
+        Stop the threads used to run the adapters.
+        """
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool = None
+
+        self.unfinished = {}
 
     def get_greatest_confidence(self, statement, options):
         """
@@ -25,6 +25,9 @@ class TimeLogicAdapter(LogicAdapter):
 
         self.classifier = NaiveBayesClassifier(training_data)
 
+        # The response changes as time passes
+        self.cache_responses = False
+
     def process(self, statement):
         now = datetime.now()
 
@@ -2,3 +2,5 @@ from .storage_adapter import StorageAdapter
 from .django_storage import DjangoStorageAdapter
 from .jsonfile import JsonFileStorageAdapter
 from .mongodb import MongoDatabaseAdapter
+from .jsonlog import JsonLogStorageAdapter
+from .sqlite import SqliteStorageAdapter
@@ -14,6 +14,22 @@ class DjangoStorageAdapter(StorageAdapter):
         from chatterbot.ext.django_chatterbot.models import Statement as StatementModel
         return StatementModel.objects.count()
 
+    def get_statement_queryset(self):
+        """
+        Return a queryset of statements that loads the responses
+        of the selected statements with one additional query.
+        """
+        from chatterbot.ext.django_chatterbot.models import Statement as StatementModel
+        from chatterbot.ext.django_chatterbot.models import Response as ResponseModel
+        from django.db.models import Prefetch
+
+        return StatementModel.objects.prefetch_related(
+            Prefetch(
+                'in_response_to',
+                queryset=ResponseModel.objects.select_related('response').order_by('id')
+            )
+        )
+
     def model_to_object(self, statement_model):
         """
         Convert a Django model object into a ChatterBot Statement object.
@@ -34,7 +50,7 @@ class DjangoStorageAdapter(StorageAdapter):
     def find(self, statement_text):
         from chatterbot.ext.django_chatterbot.models import Statement as StatementModel
         try:
-            statement = StatementModel.objects.get(
+            statement = self.get_statement_queryset().get(
                 text=statement_text
             )
             return self.model_to_object(statement)
@@ -46,8 +62,6 @@ class DjangoStorageAdapter(StorageAdapter):
         Returns a list of statements in the database
         that match the parameters specified.
         """
-        from chatterbot.ext.django_chatterbot.models import Statement as StatementModel
-
         kwargs_copy = kwargs.copy()
 
         for kwarg in kwargs_copy:
@@ -67,7 +81,7 @@ class DjangoStorageAdapter(StorageAdapter):
             else:
                 kwargs['in_response_to'] = None
 
-        statement_objects = StatementModel.objects.filter(**kwargs)
+        statement_objects = self.get_statement_queryset().filter(**kwargs)
 
         results = []
 
@@ -77,37 +91,239 @@ class DjangoStorageAdapter(StorageAdapter):
         return results
 
     def update(self, statement, **kwargs):
+        """
+        Save the statement and its responses. The number of queries
+        used does not depend on the number of responses.
+        """
         from chatterbot.ext.django_chatterbot.models import Statement as StatementModel
         from chatterbot.ext.django_chatterbot.models import Response as ResponseModel
+        from django.db.models import Case, When, Value, IntegerField
+        from django.db import transaction
+
         # Do not alter the database unless writing is enabled
         if not self.read_only:
-            django_statement, created = StatementModel.objects.get_or_create(
-                text=statement.text,
-                extra_data=json.dumps(statement.extra_data)
-            )
+            self.annotate(statement)
 
+            extra_data = json.dumps(statement.extra_data)
+
+            texts = [statement.text]
             for response in statement.in_response_to:
-                response_statement, created = StatementModel.objects.get_or_create(
-                    text=response.text
+                if response.text not in texts:
+                    texts.append(response.text)
+
+            with transaction.atomic():
+                statement_ids = dict(
+                    StatementModel.objects.filter(text__in=texts).values_list('text', 'id')
                 )
-                response_object, created = django_statement.in_response_to.get_or_create(
-                    statement=statement,
-                    response=response_statement
+
+                # Make sure that an entry for the statement and each response exists
+                missing_texts = [text for text in texts if text not in statement_ids]
+                if missing_texts:
+                    StatementModel.objects.bulk_create([
+                        StatementModel(
+                            text=text,
+                            extra_data=extra_data if text == statement.text else '{}'
+                        )
+                        for text in missing_texts
+                    ])
+                    statement_ids.update(
+                        StatementModel.objects.filter(
+                            text__in=missing_texts
+                        ).values_list('text', 'id')
+                    )
+
+                statement_id = statement_ids[statement.text]
+
+                if statement.text not in missing_texts:
+                    StatementModel.objects.filter(id=statement_id).update(
+                        extra_data=extra_data
+                    )
+
+                occurrences = {}
+                for response in statement.in_response_to:
+                    occurrences[statement_ids[response.text]] = response.occurrence
+
+                existing_responses = dict(
+                    ResponseModel.objects.filter(
+                        statement_id=statement_id,
+                        response_id__in=list(occurrences.keys())
+                    ).values_list('response_id', 'id')
                 )
-                response_object.occurrence = response.occurrence
-                response_object.save()
 
-            django_statement.save()
+                ResponseModel.objects.bulk_create([
+                    ResponseModel(
+                        statement_id=statement_id,
+                        response_id=response_id,
+                        occurrence=occurrence
+                    )
+                    for response_id, occurrence in occurrences.items()
+                    if response_id not in existing_responses
+                ])
+
+                # Set the occurrence of every existing response in one query
+                if existing_responses:
+                    ResponseModel.objects.filter(
+                        id__in=list(existing_responses.values())
+                    ).update(occurrence=Case(
+                        *[
+                            When(id=response_object_id, then=Value(occurrences[response_id]))
+                            for response_id, response_object_id in existing_responses.items()
+                        ],
+                        output_field=IntegerField()
+                    ))
+
+            self.index_statement(statement)
 
         return statement
 
-    def get_random(self):
+    def bulk_update(self, statements, **kwargs):
+        """
+        Save a list of statements in a single transaction, adding the
+        occurrence of each response to the saved occurrence.
+        """
+        from chatterbot.ext.django_chatterbot.models import Statement as StatementModel
+        from chatterbot.ext.django_chatterbot.models import Response as ResponseModel
+        from django.db.models import Case, When, Value, F, IntegerField, TextField
+        from django.db import transaction
+        from collections import OrderedDict
+
+        # Do not alter the database unless writing is enabled
+        if self.read_only:
+            return
+
+        # Keep the number of parameters in each query within database limits
+        chunk_size = 500
+
+        # Statements are created in the order that they are given
+        texts = OrderedDict()
+        extra_data = {}
+        occurrences = {}
+
+        for statement in statements:
+            self.annotate(statement)
+
+            texts[statement.text] = None
+            extra_data.setdefault(statement.text, {}).update(statement.extra_data)
+
+            for response in statement.in_response_to:
+                texts[response.text] = None
+                key = (statement.text, response.text, )
+                occurrences[key] = occurrences.get(key, 0) + response.occurrence
+
+        texts = list(texts)
+
+        with transaction.atomic():
+            saved = {}
+            for start in range(0, len(texts), chunk_size):
+                saved.update(
+                    (text, (statement_id, data, ))
+                    for statement_id, text, data in StatementModel.objects.filter(
+                        text__in=texts[start:start + chunk_size]
+                    ).values_list('id', 'text', 'extra_data')
+                )
+
+            # Make sure that an entry for each statement and response exists
+            missing_texts = [text for text in texts if text not in saved]
+            StatementModel.objects.bulk_create([
+                StatementModel(text=text, extra_data=json.dumps(extra_data.get(text, {})))
+                for text in missing_texts
+            ], batch_size=chunk_size)
+
+            statement_ids = dict((text, saved[text][0]) for text in saved)
+            for start in range(0, len(missing_texts), chunk_size):
+                statement_ids.update(
+                    StatementModel.objects.filter(
+                        text__in=missing_texts[start:start + chunk_size]
+                    ).values_list('text', 'id')
+                )
+
+            # Merge the extra data of statements that were already saved
+            updated_extra_data = []
+            for text in saved:
+                if extra_data.get(text):
+                    data = json.loads(saved[text][1])
+                    data.update(extra_data[text])
+                    updated_extra_data.append((saved[text][0], json.dumps(data), ))
+
+            for start in range(0, len(updated_extra_data), chunk_size):
+                chunk = updated_extra_data[start:start + chunk_size]
+                StatementModel.objects.filter(
+                    id__in=[statement_id for statement_id, data in chunk]
+                ).update(extra_data=Case(
+                    *[When(id=statement_id, then=Value(data)) for statement_id, data in chunk],
+                    output_field=TextField()
+                ))
+
+            increments = dict(
+                ((statement_ids[text], statement_ids[response_text], ), occurrence)
+                for (text, response_text), occurrence in occurrences.items()
+            )
+
+            statement_id_list = list(set(key[0] for key in increments))
+            existing_responses = {}
+            for start in range(0, len(statement_id_list), chunk_size):
+                for response_object_id, statement_id, response_id in ResponseModel.objects.filter(
+                    statement_id__in=statement_id_list[start:start + chunk_size]
+                ).values_list('id', 'statement_id', 'response_id'):
+                    key = (statement_id, response_id, )
+                    if key in increments:
+                        existing_responses[key] = response_object_id
+
+            ResponseModel.objects.bulk_create([
+                ResponseModel(
+                    statement_id=statement_id,
+                    response_id=response_id,
+                    occurrence=occurrence
+                )
+                for (statement_id, response_id), occurrence in increments.items()
+                if (statement_id, response_id, ) not in existing_responses
+            ], batch_size=chunk_size)
+
+            # Add the increments to the existing responses
+            existing = list(existing_responses.items())
+            for start in range(0, len(existing), chunk_size):
+                chunk = existing[start:start + chunk_size]
+                ResponseModel.objects.filter(
+                    id__in=[response_object_id for key, response_object_id in chunk]
+                ).update(occurrence=Case(
+                    *[
+                        When(id=response_object_id, then=F('occurrence') + Value(increments[key]))
+                        for key, response_object_id in chunk
+                    ],
+                    output_field=IntegerField()
+                ))
+
+        for statement in statements:
+            self.index_statement(statement)
+
+    def get_random_statements(self, count):
         """
-        Returns a random statement from the database
+        Return a list of up to `count` random statements. For each statement a
+        random id between the lowest and highest ids is chosen, and the first
+        statement with an id at least that large is selected using the primary
+        key, instead of ordering the whole table randomly.
         """
         from chatterbot.ext.django_chatterbot.models import Statement as StatementModel
-        statement = StatementModel.objects.order_by('?').first()
-        return self.model_to_object(statement)
+        from django.db.models import Min, Max
+        from random import randint
+
+        bounds = StatementModel.objects.aggregate(lowest=Min('id'), highest=Max('id'))
+
+        if bounds['highest'] is None:
+            return []
+
+        statement_ids = set()
+
+        for _ in range(0, count):
+            statement_ids.update(
+                StatementModel.objects.filter(
+                    id__gte=randint(bounds['lowest'], bounds['highest'])
+                ).order_by('id').values_list('id', flat=True)[:1]
+            )
+
+        statements = self.get_statement_queryset().filter(id__in=statement_ids)
+
+        return [self.model_to_object(statement) for statement in statements]
 
     def remove(self, statement_text):
         """
@@ -127,6 +343,56 @@ class DjangoStorageAdapter(StorageAdapter):
         responses.delete()
         statements.delete()
 
+        self.unindex_statement(statement_text)
+
+    def get_response_statements(self):
+        """
+        Return only statements that are in response to another statement.
+        The statements and their responses are selected with a fixed
+        number of queries, regardless of the number of statements.
+        """
+        from chatterbot.ext.django_chatterbot.models import Response as ResponseModel
+
+        statement_objects = self.get_statement_queryset().filter(
+            id__in=ResponseModel.objects.values('response_id')
+        )
+
+        return [
+            self.model_to_object(statement_object)
+            for statement_object in statement_objects
+        ]
+
+    def count_response_statements(self):
+        """
+        Return the number of statements that are in response to another
+        statement, counted by the database.
+        """
+        from chatterbot.ext.django_chatterbot.models import Response as ResponseModel
+
+        return ResponseModel.objects.values('response_id').distinct().count()
+
+    def find_response_statements(self, texts):
+        """
+        Return the statements with the texts that are in response to another
+        statement, in the order that the texts are given. The statements and
+        their responses are selected with a fixed number of queries.
+        """
+        from chatterbot.ext.django_chatterbot.models import Response as ResponseModel
+
+        texts = list(texts)
+
+        statement_objects = self.get_statement_queryset().filter(
+            text__in=texts,
+            id__in=ResponseModel.objects.values('response_id')
+        )
+
+        statements = dict(
+            (statement_object.text, self.model_to_object(statement_object), )
+            for statement_object in statement_objects
+        )
+
+        return [statements[text] for text in texts if text in statements]
+
     def drop(self):
         """
         Remove all data from the database.
@@ -135,4 +401,6 @@ class DjangoStorageAdapter(StorageAdapter):
         from chatterbot.ext.django_chatterbot.models import Response as ResponseModel        
 
         StatementModel.objects.all().delete()
-        ResponseModel.objects.all().delete()
\ No newline at end of file
+        ResponseModel.objects.all().delete()
+
+        self.clear_indexes()
\ No newline at end of file
@@ -1,5 +1,6 @@
 from chatterbot.adapters.storage import StorageAdapter
 from chatterbot.conversation import Statement, Response
+from chatterbot.utils.sampling import RandomKeys
 from jsondb import Database
 import warnings
 
@@ -24,6 +25,14 @@ class JsonFileStorageAdapter(StorageAdapter):
 
         self.adapter_supports_queries = False
 
+        # The number of statements in response to each statement text,
+        # counted when first needed and then kept up to date on each change
+        self.response_counts = None
+
+        # The text of each statement, that random statements are chosen from,
+        # read when first needed and then kept up to date on each change
+        self.random_keys = None
+
     def _keys(self):
         # The value has to be cast as a list for Python 3 compatibility
         return list(self.database[0].keys())
@@ -47,11 +56,19 @@ class JsonFileStorageAdapter(StorageAdapter):
         Removes any responses from statements if the response text matches the
         input text.
         """
-        for statement in self.filter(in_response_to__contains=statement_text):
-            statement.remove_response(statement_text)
-            self.update(statement)
+        with self.lock:
+            for statement in self.filter(in_response_to__contains=statement_text):
+                statement.remove_response(statement_text)
+                self.update(statement)
+
+            if self.response_counts is not None:
+                self._adjust_response_counts(self.database.data(key=statement_text), -1)
+
+            if self.random_keys is not None:
+                self.random_keys.remove(statement_text)
 
-        self.database.delete(statement_text)
+            self.database.delete(statement_text)
+            self.unindex_statement(statement_text)
 
     def deserialize_responses(self, response_list):
         """
@@ -130,31 +147,158 @@ class JsonFileStorageAdapter(StorageAdapter):
         return results
 
     def update(self, statement, **kwargs):
-        # Do not alter the database unless writing is enabled
-        if not self.read_only:
-            data = statement.serialize()
+        with self.lock:
+            # Do not alter the database unless writing is enabled
+            if not self.read_only:
+                self.annotate(statement)
 
-            # Remove the text key from the data
-            del(data['text'])
-            self.database.data(key=statement.text, value=data)
+                data = statement.serialize()
+
+                # Remove the text key from the data
+                del(data['text'])
+
+                if self.response_counts is not None:
+                    self._adjust_response_counts(self.database.data(key=statement.text), -1)
+                    self._adjust_response_counts(data, 1)
+
+                self.database.data(key=statement.text, value=data)
+
+                if self.random_keys is not None:
+                    self.random_keys.add(statement.text)
+
+                # Make sure that an entry for each response exists
+                for response_statement in statement.in_response_to:
+                    response = self.find(response_statement.text)
+                    if not response:
+                        response = Statement(response_statement.text)
+                        self.update(response)
+
+                self.index_statement(statement)
+
+            return statement
+
+    def bulk_update(self, statements, **kwargs):
+        """
+        Save a list of statements, adding the occurrence of each response
+        to the saved occurrence. The file is read and written once.
+        """
+        with self.lock:
+            # Do not alter the database unless writing is enabled
+            if self.read_only:
+                return
+
+            content = self.database.data()
+
+            for statement in statements:
+                self.annotate(statement)
+
+                saved = content.get(statement.text)
+                if saved is not None:
+                    saved = dict(saved, text=statement.text)
+
+                data = self.merge_statement_data(saved, statement)
+
+                # Remove the text key from the data
+                del(data['text'])
 
-            # Make sure that an entry for each response exists
-            for response_statement in statement.in_response_to:
-                response = self.find(response_statement.text)
-                if not response:
-                    response = Statement(response_statement.text)
-                    self.update(response)
+                if self.response_counts is not None:
+                    self._adjust_response_counts(content.get(statement.text), -1)
+                    self._adjust_response_counts(data, 1)
 
-        return statement
+                content[statement.text] = data
 
-    def get_random(self):
-        from random import choice
+                # Make sure that an entry for each response exists
+                for response in statement.in_response_to:
+                    if response.text not in content:
+                        content[response.text] = {'in_response_to': [], 'extra_data': {}}
 
-        if self.count() < 1:
-            raise self.EmptyDatabaseException()
+            self.database.write_data(self.database.path, content)
+
+            if self.random_keys is not None:
+                for statement in statements:
+                    self.random_keys.add(statement.text)
+                    for response in statement.in_response_to:
+                        self.random_keys.add(response.text)
+
+            for statement in statements:
+                self.index_statement(statement)
+
+    def _adjust_response_counts(self, values, amount):
+        """
+        Add the amount to the count of each response in the statement data.
+        """
+        if not values:
+            return
 
-        statement = choice(self._keys())
-        return self.find(statement)
+        for response in values['in_response_to']:
+            count = self.response_counts.get(response['text'], 0) + amount
+
+            if count > 0:
+                self.response_counts[response['text']] = count
+            else:
+                self.response_counts.pop(response['text'], None)
+
+    def get_response_statements(self):
+        """
+        Return only statements that are in response to another statement.
+        The statements that have responses are found by reading the database
+        once, and are then tracked as statements are updated and removed.
+        """
+        with self.lock:
+            return self._get_statements(self._get_response_counts())
+
+    def find_response_statements(self, texts):
+        """
+        Return the statements with the texts that are in response to
+        another statement, in the order that the texts are given.
+        """
+        with self.lock:
+            response_counts = self._get_response_counts()
+
+            return self._get_statements(
+                [text for text in texts if text in response_counts]
+            )
+
+    def _get_statements(self, texts):
+        """
+        Return the saved statements with the texts, in the order
+        given. The database file is read once for all of them.
+        """
+        content = self.database.data()
+        statements = []
+
+        for text in texts:
+            values = content.get(text)
+            if values:
+                statements.append(self.json_to_object(dict(values, text=text)))
+
+        return statements
+
+    def _get_response_counts(self):
+        """
+        Return the number of statements in response to each statement,
+        reading the database the first time the counts are needed.
+        """
+        if self.response_counts is None:
+            self.response_counts = {}
+            for values in self.database.data().values():
+                self._adjust_response_counts(values, 1)
+
+        return self.response_counts
+
+    def get_random_statements(self, count):
+        """
+        Return a list of random statements. The text of the statements is
+        read once, and is then kept up to date as statements are saved
+        and removed.
+        """
+        with self.lock:
+            if self.random_keys is None:
+                self.random_keys = RandomKeys(self._keys())
+
+            texts = self.random_keys.sample(count)
+
+        return [self.find(text) for text in texts]
 
     def drop(self):
         """
@@ -165,5 +309,10 @@ class JsonFileStorageAdapter(StorageAdapter):
         if os.path.exists(self.database.path):
             os.remove(self.database.path)
 
+        self.response_counts = None
+        self.random_keys = None
+
+        self.clear_indexes()
+
     class UnsuitableForProductionWarning(Warning):
         pass
@@ -0,0 +1,353 @@
+from chatterbot.adapters.storage import StorageAdapter
+from chatterbot.conversation import Statement, Response
+from chatterbot.utils.sampling import RandomKeys
+import json
+import io
+import os
+
+
+class JsonLogStorageAdapter(StorageAdapter):
+    """
+    This adapter allows ChatterBot to store conversation data in a file.
+
+    Statements are kept in memory, along with an index of the statements
+    that are in response to each statement. Each change is appended to the
+    file as a single line of JSON, so saving a statement never rewrites the
+    existing data. The file is read once when the adapter is created and is
+    compacted when it contains many more lines than there are statements.
+    Changes made from several threads at once are saved one at a time.
+    """
+
+    def __init__(self, **kwargs):
+        super(JsonLogStorageAdapter, self).__init__(**kwargs)
+
+        self.path = self.kwargs.get('database', 'database.jsonl')
+
+        # The log is only rewritten once it holds at least this many lines
+        self.compaction_threshold = self.kwargs.get('compaction_threshold', 1000)
+
+        # Flush each line to the disk before returning from a write
+        self.sync_writes = self.kwargs.get('sync_writes', False)
+
+        self.adapter_supports_queries = False
+
+        # The serialized data of each statement, keyed by the statement text
+        self.statements = {}
+
+        # The text of the statements in response to each statement text
+        self.responders = {}
+
+        # The text of each statement, that random statements are chosen from
+        self.random_keys = RandomKeys()
+
+        self.log_file = None
+        self.log_length = 0
+
+        self.load()
+
+    def load(self):
+        """
+        Read the statements saved in the log file into memory.
+        """
+        self.statements = {}
+        self.responders = {}
+        self.random_keys = RandomKeys()
+        self.log_length = 0
+
+        if not os.path.exists(self.path):
+            return
+
+        with io.open(self.path, 'r', encoding='utf-8') as log_file:
+            for line in log_file:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # A line may be incomplete if a write was interrupted
+                    self.logger.warning(
+                        u'Skipping an unreadable line in {}'.format(self.path)
+                    )
+                    continue
+
+                self.log_length += 1
+
+                if record.get('removed'):
+                    self._delete(record['text'])
+                else:
+                    self._store(record)
+
+    def _store(self, data):
+        text = data['text']
+
+        self._delete(text)
+        self.statements[text] = data
+        self.random_keys.add(text)
+
+        for response in data['in_response_to']:
+            self.responders.setdefault(response['text'], set()).add(text)
+
+    def _delete(self, text):
+        data = self.statements.pop(text, None)
+
+        if data is None:
+            return
+
+        self.random_keys.remove(text)
+
+        for response in data['in_response_to']:
+            responders = self.responders.get(response['text'])
+            if responders is not None:
+                responders.discard(text)
+                if not responders:
+                    del self.responders[response['text']]
+
+    def _write(self, *records):
+        if self.log_file is None:
+            self.log_file = io.open(self.path, 'a', encoding='utf-8')
+
+        self.log_file.write(u''.join(
+            u'{}\n'.format(json.dumps(record)) for record in records
+        ))
+        self.log_file.flush()
+
+        if self.sync_writes:
+            os.fsync(self.log_file.fileno())
+
+        self.log_length += len(records)
+
+        if self.log_length > max(self.compaction_threshold, 2 * len(self.statements)):
+            self.compact()
+
+    def compact(self):
+        """
+        Rewrite the log file so that it contains a single
+        line for each statement that currently exists.
+        """
+        with self.lock:
+            self.close()
+
+            temporary_path = self.path + '.compact'
+
+            with io.open(temporary_path, 'w', encoding='utf-8') as log_file:
+                for data in self.statements.values():
+                    log_file.write(u'{}\n'.format(json.dumps(data)))
+
+                log_file.flush()
+                os.fsync(log_file.fileno())
+
+            # Replace the old log in a single step so it is never left incomplete
+            if hasattr(os, 'replace'):
+                os.replace(temporary_path, self.path)
+            else:
+                os.rename(temporary_path, self.path)
+
+            self.log_length = len(self.statements)
+
+    def close(self):
+        """
+        Close the log file if it is open.
+        """
+        if self.log_file is not None:
+            self.log_file.close()
+            self.log_file = None
+
+    def count(self):
+        return len(self.statements)
+
+    def find(self, statement_text):
+        data = self.statements.get(statement_text)
+
+        if data is None:
+            return None
+
+        return self.json_to_object(data)
+
+    def remove(self, statement_text):
+        """
+        Removes the statement that matches the input text.
+        Removes any responses from statements if the response text matches the
+        input text.
+        """
+        with self.lock:
+            for statement in self.filter(in_response_to__contains=statement_text):
+                statement.remove_response(statement_text)
+                self.update(statement)
+
+            if statement_text in self.statements:
+                self._delete(statement_text)
+                self._write({'text': statement_text, 'removed': True})
+
+            self.unindex_statement(statement_text)
+
+    def json_to_object(self, statement_data):
+        """
+        Return a statement created from its serialized data.
+        """
+        in_response_to = [
+            Response(response['text'], occurrence=response['occurrence'])
+            for response in statement_data['in_response_to']
+        ]
+
+        return Statement(
+            statement_data['text'],
+            in_response_to=in_response_to,
+            extra_data=dict(statement_data.get('extra_data', {}))
+        )
+
+    def _all_kwargs_match_values(self, kwarguments, values):
+        for kwarg in kwarguments:
+            value = kwarguments[kwarg]
+
+            if kwarg == 'in_response_to__contains':
+                response_texts = [response['text'] for response in values['in_response_to']]
+                if value not in response_texts:
+                    return False
+
+            elif kwarg == 'in_response_to':
+                response_texts = [response['text'] for response in values['in_response_to']]
+                if response_texts != [getattr(response, 'text', response) for response in value]:
+                    return False
+
+            elif kwarg in values:
+                if values[kwarg] != value:
+                    return False
+
+        return True
+
+    def filter(self, **kwargs):
+        """
+        Returns a list of statements in the database
+        that match the parameters specified.
+        """
+        with self.lock:
+            if 'text' in kwargs:
+                texts = [kwargs['text']] if kwargs['text'] in self.statements else []
+            elif 'in_response_to__contains' in kwargs:
+                texts = self.responders.get(kwargs['in_response_to__contains'], ())
+            else:
+                texts = self.statements.keys()
+
+            results = []
+
+            for text in texts:
+                values = self.statements[text]
+
+                if self._all_kwargs_match_values(kwargs, values):
+                    results.append(self.json_to_object(values))
+
+            return results
+
+    def update(self, statement, **kwargs):
+        force = kwargs.get('force', False)
+
+        with self.lock:
+            # Do not alter the database unless writing is enabled
+            if force or not self.read_only:
+                self.annotate(statement)
+
+                data = statement.serialize()
+
+                # Don't keep a reference to the statement's extra data
+                data['extra_data'] = dict(data['extra_data'])
+
+                self._store(data)
+                self._write(data)
+
+                # Make sure that an entry for each response exists
+                for response in statement.in_response_to:
+                    if response.text not in self.statements:
+                        self.update(Statement(response.text), force=force)
+
+                self.index_statement(statement)
+
+            return statement
+
+    def bulk_update(self, statements, **kwargs):
+        """
+        Save a list of statements, adding the occurrence of each
+        response to the saved occurrence. The changes are added
+        to the log with a single write.
+        """
+        force = kwargs.get('force', False)
+
+        if not force and self.read_only:
+            return
+
+        with self.lock:
+            records = []
+
+            for statement in statements:
+                self.annotate(statement)
+
+                data = self.merge_statement_data(
+                    self.statements.get(statement.text), statement
+                )
+                self._store(data)
+                records.append(data)
+
+                # Make sure that an entry for each response exists
+                for response in statement.in_response_to:
+                    if response.text not in self.statements:
+                        response_data = {
+                            'text': response.text,
+                            'in_response_to': [],
+                            'extra_data': {}
+                        }
+                        self._store(response_data)
+                        records.append(response_data)
+
+            if records:
+                self._write(*records)
+
+            for statement in statements:
+                self.index_statement(statement)
+
+    def get_random_statements(self, count):
+        """
+        Return a list of random statements, chosen from
+        the text of the statements held in memory.
+        """
+        with self.lock:
+            return [
+                self.json_to_object(self.statements[text])
+                for text in self.random_keys.sample(count)
+            ]
+
+    def get_response_statements(self):
+        """
+        Return only statements that are in response to another statement.
+        """
+        with self.lock:
+            return [
+                self.json_to_object(self.statements[text])
+                for text in self.responders
+                if text in self.statements
+            ]
+
+    def find_response_statements(self, texts):
+        """
+        Return the statements with the texts that are in response to
+        another statement, in the order that the texts are given.
+        """
+        with self.lock:
+            return [
+                self.json_to_object(self.statements[text])
+                for text in texts
+                if text in self.responders and text in self.statements
+            ]
+
+    def drop(self):
+        """
+        Remove the log file and all statements held in memory.
+        """
+        with self.lock:
+            self.close()
+
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+            self.statements = {}
+            self.responders = {}
+            self.random_keys.clear()
+            self.log_length = 0
+
+            self.clear_indexes()
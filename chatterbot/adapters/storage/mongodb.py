@@ -1,6 +1,274 @@
 from chatterbot.adapters.storage import StorageAdapter
-from chatterbot.conversation import Statement, Response
+from chatterbot.conversation import Statement, LazyStatement, Response
 from pymongo import MongoClient
+from threading import Lock
+
+
+# Fields of statement documents that are maintained by the adapter
+INTERNAL_FIELDS = ('_id', 'responder_count', )
+
+
+def get_responder_count_operations(previous_data, data):
+    """
+    Return the operations that update the responder count of each response
+    that was added to or removed from a statement. The responder count of a
+    statement is the number of statements that are in response to it.
+
+    :param previous_data: The statement's document before it was changed, or None.
+    :param data: The statement's data after it was changed.
+    """
+    from pymongo import UpdateOne
+
+    previous_texts = set(
+        response['text'] for response in (previous_data or {}).get('in_response_to', [])
+    )
+    texts = [response['text'] for response in data.get('in_response_to', [])]
+
+    operations = []
+
+    for text in texts:
+        if text not in previous_texts:
+            # Make sure that an entry for the response exists
+            operations.append(UpdateOne(
+                {'text': text},
+                {
+                    '$inc': {'responder_count': 1},
+                    '$setOnInsert': {'in_response_to': [], 'extra_data': {}}
+                },
+                upsert=True
+            ))
+
+    for text in previous_texts.difference(texts):
+        operations.append(UpdateOne(
+            {'text': text},
+            {'$inc': {'responder_count': -1}}
+        ))
+
+    return operations
+
+
+def get_occurrences(statements):
+    """
+    Return the extra data of each statement and the occurrence to add for
+    each of its responses, in the order that the statements are given.
+    The occurrences are keyed by the statement's text and the response's text.
+    """
+    from collections import OrderedDict
+
+    extra_data = OrderedDict()
+    occurrences = OrderedDict()
+
+    for statement in statements:
+        extra_data.setdefault(statement.text, {}).update(statement.extra_data)
+
+        for response in statement.in_response_to:
+            key = (statement.text, response.text, )
+            occurrences[key] = occurrences.get(key, 0) + response.occurrence
+
+    return extra_data, occurrences
+
+
+def get_occurrence_operations(extra_data, occurrences, new_responses):
+    """
+    Return the operations that save statements by adding the occurrence of
+    each response to the saved occurrence. Only the changed values are
+    written, so the saved responses are not read or written again.
+
+    The operations must be run in three steps, in the order returned:
+    saving each statement and its extra data, adding each new response
+    with an occurrence of zero, and then adding each occurrence.
+
+    :param extra_data: The extra data of each statement, from get_occurrences.
+    :param occurrences: The occurrences to add, from get_occurrences.
+    :param new_responses: The keys of the occurrences whose responses are not saved yet.
+    """
+    from pymongo import UpdateOne
+
+    statement_operations = []
+
+    for text, data in extra_data.items():
+        if data:
+            # Each value is set on its own so that other extra data is kept
+            update = {
+                '$set': dict(('extra_data.' + key, value) for key, value in data.items()),
+                '$setOnInsert': {'in_response_to': []}
+            }
+        else:
+            update = {'$setOnInsert': {'in_response_to': [], 'extra_data': {}}}
+
+        statement_operations.append(UpdateOne({'text': text}, update, upsert=True))
+
+    # A response is only added if another process has not already added it
+    response_operations = [
+        UpdateOne(
+            {'text': text, 'in_response_to.text': {'$ne': response_text}},
+            {'$push': {'in_response_to': {'text': response_text, 'occurrence': 0}}}
+        )
+        for text, response_text in new_responses
+    ]
+
+    increment_operations = [
+        UpdateOne(
+            {'text': text, 'in_response_to.text': response_text},
+            {'$inc': {'in_response_to.$.occurrence': occurrence}}
+        )
+        for (text, response_text), occurrence in occurrences.items()
+    ]
+
+    return statement_operations, response_operations, increment_operations
+
+
+def get_new_responder_operations(new_responses):
+    """
+    Return the operations that add one to the responder
+    count of a response for each statement it was added to.
+    """
+    from pymongo import UpdateOne
+    from collections import Counter
+
+    responder_counts = Counter(response_text for text, response_text in new_responses)
+
+    return [
+        UpdateOne(
+            {'text': response_text},
+            {
+                '$inc': {'responder_count': count},
+                '$setOnInsert': {'in_response_to': [], 'extra_data': {}}
+            },
+            upsert=True
+        )
+        for response_text, count in responder_counts.items()
+    ]
+
+
+def get_responder_count_pipeline(texts=None):
+    """
+    Return the aggregation pipeline that counts the statements
+    in response to each statement, or only to the statements
+    with the given texts.
+    """
+    pipeline = []
+
+    if texts is not None:
+        pipeline.append({'$match': {'in_response_to.text': {'$in': texts}}})
+
+    pipeline.append({'$unwind': '$in_response_to'})
+
+    if texts is not None:
+        pipeline.append({'$match': {'in_response_to.text': {'$in': texts}}})
+
+    pipeline.append(
+        {'$group': {'_id': '$in_response_to.text', 'count': {'$sum': 1}}}
+    )
+
+    return pipeline
+
+
+def get_saved_responses_query(texts):
+    """
+    Return the query and the projection that read only the texts of
+    the saved responses of the statements with the given texts.
+    """
+    return (
+        {'text': {'$in': list(texts)}},
+        {'_id': False, 'text': True, 'in_response_to.text': True},
+    )
+
+
+def get_new_responses(occurrences, documents):
+    """
+    Return the keys of the occurrences whose responses are not saved,
+    given the documents read with get_saved_responses_query.
+    """
+    saved_responses = set()
+
+    for document in documents:
+        for response in document.get('in_response_to', []):
+            saved_responses.add((document['text'], response['text'], ))
+
+    return [key for key in occurrences if key not in saved_responses]
+
+
+def get_learned_responder_operations(result, response_operations, new_responses):
+    """
+    Return the operations that count the statements that new responses were
+    added to, along with a list of the texts of the responses whose
+    responders must be counted again with get_responder_count_pipeline.
+
+    :param result: The result of running the response operations, or None.
+    :param response_operations: The response operations from get_occurrence_operations.
+    :param new_responses: The keys of the occurrences whose responses were not saved.
+    """
+    if result is not None and result.modified_count == len(response_operations):
+        return get_new_responder_operations(new_responses), []
+
+    # Some of the responses were added by another process
+    # at the same time, so their responders are counted again
+    return [], list(set(response_text for text, response_text in new_responses))
+
+
+def iter_responder_count_operations(responder_counts, texts=None):
+    """
+    Yield the operations that save the responder counts returned by the
+    get_responder_count_pipeline aggregation. The count of each of the
+    given texts that no statement is in response to is set to zero.
+    """
+    from pymongo import UpdateOne
+
+    uncounted = set(texts or [])
+
+    for result in responder_counts:
+        uncounted.discard(result['_id'])
+
+        yield UpdateOne(
+            {'text': result['_id']},
+            {
+                '$set': {'responder_count': result['count']},
+                '$setOnInsert': {'in_response_to': [], 'extra_data': {}}
+            },
+            upsert=True
+        )
+
+    for text in uncounted:
+        yield UpdateOne(
+            {'text': text},
+            {'$set': {'responder_count': 0}}
+        )
+
+
+# The clients that are shared by the adapters of this process
+clients = {}
+
+# The collections that this process has created indexes for
+indexed_collections = set()
+
+registry_lock = Lock()
+
+
+def get_client(database_uri, **options):
+    """
+    Return the MongoClient of this process that connects to the uri with
+    the options, creating it the first time that it is requested. Each
+    client holds its own pool of connections, so adapters that share a
+    client share its connections.
+    """
+    key = (database_uri, tuple(sorted(options.items())), )
+
+    with registry_lock:
+        if key not in clients:
+            clients[key] = MongoClient(database_uri, **options)
+
+        return clients[key]
+
+
+def get_collection_name(tenant=None):
+    """
+    Return the name of the collection that holds the statements of a tenant.
+    """
+    if tenant is None:
+        return 'statements'
+
+    return '{}.statements'.format(tenant)
 
 
 class Query(object):
@@ -28,25 +296,29 @@ class Query(object):
     def statement_text_not_in(self, statements):
         query = self.query.copy()
 
-        if 'text' not in query:
-            query['text'] = {}
+        # Copy the nested values so that the original query is not changed
+        query['text'] = dict(query.get('text', {}))
+        query['text']['$nin'] = query['text'].get('$nin', []) + list(statements)
 
-        if '$nin' not in query['text']:
-            query['text']['$nin'] = []
+        return Query(query)
 
-        query['text']['$nin'].extend(statements)
+    def statement_text_in(self, statements):
+        query = self.query.copy()
+
+        # Copy the nested values so that the original query is not changed
+        query['text'] = dict(query.get('text', {}))
+        query['text']['$in'] = list(statements)
 
         return Query(query)
 
     def statement_response_list_contains(self, statement_text):
         query = self.query.copy()
 
-        if 'in_response_to' not in query:
-            query['in_response_to'] = {}
-
-        if '$elemMatch' not in query['in_response_to']:
-            query['in_response_to']['$elemMatch'] = {}
-
+        # Copy the nested values so that the original query is not changed
+        query['in_response_to'] = dict(query.get('in_response_to', {}))
+        query['in_response_to']['$elemMatch'] = dict(
+            query['in_response_to'].get('$elemMatch', {})
+        )
         query['in_response_to']['$elemMatch']['text'] = statement_text
 
         return Query(query)
@@ -75,19 +347,61 @@ class MongoDatabaseAdapter(StorageAdapter):
             "database_uri", "mongodb://localhost:27017/"
         )
 
-        # Use the default host and port
-        self.client = MongoClient(self.database_uri)
+        self.tenant = self.kwargs.get('tenant')
+
+        client_options = {}
+
+        if 'max_pool_size' in self.kwargs:
+            client_options['maxPoolSize'] = self.kwargs['max_pool_size']
+
+        if 'min_pool_size' in self.kwargs:
+            client_options['minPoolSize'] = self.kwargs['min_pool_size']
+
+        # Adapters that connect to the same uri share a client
+        self.client = get_client(self.database_uri, **client_options)
 
         # Specify the name of the database
         self.database = self.client[self.database_name]
 
         # The mongo collection of statement documents
-        self.statements = self.database['statements']
+        self.collection = self.database[get_collection_name(self.tenant)]
 
-        # Set a requirement for the text attribute to be unique
-        self.statements.create_index('text', unique=True)
+        self.index_key = (
+            self.database_uri, self.database_name, self.collection.name,
+        )
+
+        self.default_base_query = Query()
+
+    @property
+    def statements(self):
+        """
+        The collection of statement documents. The collection's
+        indexes are created the first time that it is used.
+        """
+        if self.index_key not in indexed_collections:
+            self.create_indexes()
 
-        self.base_query = Query()
+        return self.collection
+
+    def create_indexes(self):
+        """
+        Create the indexes of the statement collection, unless
+        they were already created by this process.
+        """
+        with registry_lock:
+            if self.index_key in indexed_collections:
+                return
+
+            # Set a requirement for the text attribute to be unique
+            self.collection.create_index('text', unique=True)
+
+            # Only statements with responders are included in the index
+            self.collection.create_index(
+                'responder_count',
+                partialFilterExpression={'responder_count': {'$gt': 0}}
+            )
+
+            indexed_collections.add(self.index_key)
 
     def count(self):
         return self.statements.count()
@@ -100,14 +414,7 @@ class MongoDatabaseAdapter(StorageAdapter):
         if not values:
             return None
 
-        del(values['text'])
-
-        # Build the objects for the response list
-        values['in_response_to'] = self.deserialize_responses(
-            values['in_response_to']
-        )
-
-        return Statement(statement_text, **values)
+        return self.mongo_to_object(values)
 
     def deserialize_responses(self, response_list):
         """
@@ -134,6 +441,9 @@ class MongoDatabaseAdapter(StorageAdapter):
         statement_text = statement_data['text']
         del(statement_data['text'])
 
+        for field in INTERNAL_FIELDS:
+            statement_data.pop(field, None)
+
         statement_data['in_response_to'] = self.deserialize_responses(
             statement_data['in_response_to']
         )
@@ -166,67 +476,106 @@ class MongoDatabaseAdapter(StorageAdapter):
 
         matches = self.statements.find(query.value())
 
-        results = []
-
-        for match in list(matches):
-            results.append(self.mongo_to_object(match))
-
-        return results
+        return [self.mongo_to_object(match) for match in matches]
 
     def update(self, statement, **kwargs):
-        from pymongo import UpdateOne
-        from pymongo.errors import BulkWriteError
-
+        """
+        Save a statement, replacing its saved responses and extra data.
+        Use bulk_update to add the occurrence of a response that was learned.
+        """
         force = kwargs.get('force', False)
         # Do not alter the database unless writing is enabled
         if force or not self.read_only:
-            data = statement.serialize()
+            self.annotate(statement)
 
-            operations = []
+            data = statement.serialize()
 
-            update_operation = UpdateOne(
+            # The previous responses are returned by the same operation that
+            # saves the statement, so other changes cannot happen in between
+            previous_data = self.statements.find_one_and_update(
                 {'text': statement.text},
                 {'$set': data},
+                projection={'_id': False, 'in_response_to.text': True},
                 upsert=True
             )
-            operations.append(update_operation)
-
-            # Make sure that an entry for each response is saved
-            for response_dict in data.get('in_response_to', []):
-                response_text = response_dict.get('text')
 
-                # $setOnInsert does nothing if the document is not created
-                update_operation = UpdateOne(
-                    {'text': response_text},
-                    {'$set': response_dict},
-                    upsert=True
-                )
-                operations.append(update_operation)
+            self.write(get_responder_count_operations(previous_data, data))
 
-            try:
-                self.statements.bulk_write(operations, ordered=False)
-            except BulkWriteError as bwe:
-                # Log the details of a bulk write error
-                self.logger.error(str(bwe.details))
+            self.index_statement(statement)
 
         return statement
 
-    def get_random(self):
+    def bulk_update(self, statements, **kwargs):
         """
-        Returns a random statement from the database
+        Save a list of statements, adding the occurrence of each response
+        to the saved occurrence. The occurrences are added by the database
+        with $inc, so responses that are learned by several processes at
+        once are all counted, and the saved responses are not written again.
         """
-        from random import randint
+        force = kwargs.get('force', False)
 
-        count = self.count()
+        # Do not alter the database unless writing is enabled
+        if not force and self.read_only:
+            return
 
-        if count < 1:
-            raise self.EmptyDatabaseException()
+        for statement in statements:
+            self.annotate(statement)
 
-        random_integer = randint(0, count - 1)
+        extra_data, occurrences = get_occurrences(statements)
 
-        statements = self.statements.find().limit(1).skip(random_integer)
+        # Only the texts of the saved responses are read
+        query, projection = get_saved_responses_query(extra_data)
+        new_responses = get_new_responses(
+            occurrences, self.statements.find(query, projection)
+        )
 
-        return self.mongo_to_object(list(statements)[0])
+        statement_operations, response_operations, increment_operations = (
+            get_occurrence_operations(extra_data, occurrences, new_responses)
+        )
+
+        # Ordered so that new statements are inserted in the order given
+        self.write(statement_operations, ordered=True)
+
+        result = self.write(response_operations)
+
+        responder_operations, recount = get_learned_responder_operations(
+            result, response_operations, new_responses
+        )
+
+        self.write(increment_operations + responder_operations)
+
+        if recount:
+            self.count_responders(recount)
+
+        for statement in statements:
+            self.index_statement(statement)
+
+    def write(self, operations, ordered=False):
+        """
+        Run a list of write operations with one bulk write,
+        and return its result. The details of an error are
+        logged, and None is returned.
+        """
+        from pymongo.errors import BulkWriteError
+
+        if not operations:
+            return None
+
+        try:
+            return self.statements.bulk_write(operations, ordered=ordered)
+        except BulkWriteError as bwe:
+            # Log the details of a bulk write error
+            self.logger.error(str(bwe.details))
+
+    def get_random_statements(self, count):
+        """
+        Return a list of random statements. The statements are selected by
+        the database with a $sample stage, which does not need to count or
+        skip over the documents in the collection.
+        """
+        documents = self.statements.aggregate([{'$sample': {'size': count}}])
+
+        return [self.mongo_to_object(document) for document in documents]
 
     def remove(self, statement_text):
         """
@@ -238,7 +587,18 @@ class MongoDatabaseAdapter(StorageAdapter):
             statement.remove_response(statement_text)
             self.update(statement)
 
-        self.statements.delete_one({'text': statement_text})
+        removed_data = self.statements.find_one_and_delete(
+            {'text': statement_text},
+            projection={'_id': False, 'in_response_to.text': True}
+        )
+
+        # The statement is no longer in response to its responses
+        operations = get_responder_count_operations(removed_data, {})
+
+        if operations:
+            self.statements.bulk_write(operations, ordered=False)
+
+        self.unindex_statement(statement_text)
 
     def get_response_statements(self):
         """
@@ -247,27 +607,125 @@ class MongoDatabaseAdapter(StorageAdapter):
         in_response_to field. Otherwise, the logic adapter may find a closest
         matching statement that does not have a known response.
         """
-        response_query = self.statements.distinct('in_response_to.text')
+        statement_query = self.statements.find(self.get_response_statements_query())
 
-        _statement_query = {
-            'text': {
-                '$in': response_query
-            }
-        }
+        return [self.mongo_to_object(statement) for statement in statement_query]
 
-        _statement_query.update(self.base_query.value())
+    def count_response_statements(self):
+        """
+        Return the number of statements that are in response to another
+        statement, counted with the index of the responder_count field.
+        """
+        return self.statements.count({'responder_count': {'$gt': 0}})
 
-        statement_query = self.statements.find(_statement_query)
+    def find_response_statements(self, texts):
+        """
+        Return the statements with the texts that are in response to
+        another statement, in the order that the texts are given.
+        The statements are read with one query.
+        """
+        texts = list(texts)
 
-        statement_objects = []
+        query = self.base_query.statement_text_in(texts).raw(
+            {'responder_count': {'$gt': 0}}
+        )
 
-        for statement in list(statement_query):
-            statement_objects.append(self.mongo_to_object(statement))
+        statements = dict(
+            (document['text'], self.mongo_to_object(document), )
+            for document in self.statements.find(query.value())
+        )
+
+        return [statements[text] for text in texts if text in statements]
+
+    def get_response_statements_query(self):
+        """
+        Return the query that selects the statements with responders,
+        which is answered with the index of the responder_count field.
+        """
+        statement_query = {'responder_count': {'$gt': 0}}
 
-        return statement_objects
+        statement_query.update(self.base_query.value())
+
+        return statement_query
+
+    def migrate(self):
+        """
+        Save the responder count of each statement, counting the
+        statements in response to it. Statements saved before the
+        responder count was kept must be migrated before they are
+        found by get_response_statements.
+
+        The counts are set without locking the collection, so the
+        chat bot should not be used while the migration runs.
+        """
+        self.statements.update_many({}, {'$set': {'responder_count': 0}})
+
+        self.count_responders()
+
+    def count_responders(self, texts=None):
+        """
+        Count the statements in response to each statement, or only
+        to the statements with the given texts, and save the counts.
+        """
+        responder_counts = self.statements.aggregate(
+            get_responder_count_pipeline(texts), allowDiskUse=True
+        )
+
+        operations = []
+
+        for operation in iter_responder_count_operations(responder_counts, texts):
+            operations.append(operation)
+
+            if len(operations) >= 1000:
+                self.statements.bulk_write(operations, ordered=False)
+                operations = []
+
+        if operations:
+            self.statements.bulk_write(operations, ordered=False)
+
+    def iter_response_statements(self, extra_data_keys=None, batch_size=1000):
+        """
+        Iterate over the statements that are in response to another statement.
+        Only the text and the listed keys of the extra data of each statement
+        are read, in batches of documents as the iteration continues. The
+        responses and the rest of the extra data of a statement are read
+        the first time they are used.
+        """
+        projection = {'_id': False, 'text': True}
+
+        if extra_data_keys is None:
+            projection['extra_data'] = True
+        else:
+            for key in extra_data_keys:
+                projection['extra_data.' + key] = True
+
+        documents = self.statements.find(
+            self.get_response_statements_query(), projection
+        ).batch_size(batch_size)
+
+        for document in documents:
+            yield LazyStatement(
+                document['text'],
+                self.find,
+                extra_data=document.get('extra_data', {})
+            )
 
     def drop(self):
         """
-        Remove the database.
+        Remove the database. If the adapter has a tenant,
+        only the tenant's statements are removed.
         """
-        self.client.drop_database(self.database_name)
+        with registry_lock:
+            if self.tenant is None:
+                self.client.drop_database(self.database_name)
+
+                # The indexes of each collection in the database were removed
+                for key in list(indexed_collections):
+                    if key[:2] == self.index_key[:2]:
+                        indexed_collections.discard(key)
+            else:
+                self.collection.drop()
+
+                indexed_collections.discard(self.index_key)
+
+        self.clear_indexes()
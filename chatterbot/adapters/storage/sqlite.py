@@ -0,0 +1,487 @@
+from chatterbot.adapters.storage import StorageAdapter
+from chatterbot.conversation import Statement, Response
+from collections import OrderedDict
+from contextlib import contextmanager
+import sqlite3
+import json
+import os
+
+
+SCHEMA = (
+    '''
+    CREATE TABLE IF NOT EXISTS statement (
+        id INTEGER PRIMARY KEY,
+        text TEXT NOT NULL UNIQUE,
+        extra_data TEXT NOT NULL DEFAULT '{}'
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS response (
+        id INTEGER PRIMARY KEY,
+        statement_id INTEGER NOT NULL REFERENCES statement (id) ON DELETE CASCADE,
+        response_id INTEGER NOT NULL REFERENCES statement (id) ON DELETE CASCADE,
+        occurrence INTEGER NOT NULL DEFAULT 1,
+        UNIQUE (statement_id, response_id)
+    )
+    ''',
+    'CREATE INDEX IF NOT EXISTS response_response_id ON response (response_id)',
+)
+
+# SQLite limits the number of parameters that a single query can have
+MAX_QUERY_PARAMETERS = 900
+
+
+class Query(object):
+
+    def __init__(self, excluded_text=None):
+        self.excluded_text = excluded_text or []
+
+    def statement_text_not_in(self, statements):
+        return Query(self.excluded_text + list(statements))
+
+    def clauses(self):
+        """
+        Return the conditions of the query, and the parameters they use.
+        """
+        clauses = []
+        parameters = []
+
+        if self.excluded_text:
+            clauses.append('statement.text NOT IN ({})'.format(
+                ', '.join('?' for _ in self.excluded_text)
+            ))
+            parameters.extend(self.excluded_text)
+
+        return clauses, parameters
+
+
+class SqliteStorageAdapter(StorageAdapter):
+    """
+    The SqliteStorageAdapter allows ChatterBot to store
+    statements in a SQLite database file.
+    """
+
+    def __init__(self, **kwargs):
+        super(SqliteStorageAdapter, self).__init__(**kwargs)
+
+        self.database_path = self.kwargs.get('database', 'database.sqlite3')
+
+        # The connection is opened when it is first used
+        self._connection = None
+
+        self.transaction_depth = 0
+
+        self.default_base_query = Query()
+
+        # Create the database file and its tables
+        self.connect()
+
+    @property
+    def connection(self):
+        """
+        The connection to the database, which is shared by every thread.
+        The connection is opened again if it was closed by drop.
+        """
+        if self._connection is None:
+            self.connect()
+
+        return self._connection
+
+    def connect(self):
+        """
+        Open the connection to the database, creating the
+        database's tables if they do not exist.
+        """
+        with self.lock:
+            if self._connection is not None:
+                return
+
+            connection = sqlite3.connect(
+                self.database_path,
+                isolation_level=None,
+                check_same_thread=False
+            )
+
+            # Write-ahead logging allows reads to continue while a write is in progress
+            connection.execute('PRAGMA journal_mode = WAL')
+            connection.execute('PRAGMA synchronous = NORMAL')
+            connection.execute('PRAGMA foreign_keys = ON')
+
+            for statement in SCHEMA:
+                connection.execute(statement)
+
+            self._connection = connection
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group each change made within the context into a single transaction.
+        Wrapping many updates in a transaction saves them much faster than
+        committing each update separately.
+
+        .. code-block:: python
+
+           with storage.transaction():
+               for statement in statements:
+                   storage.update(statement)
+        """
+        # The connection is shared, so other threads wait for the transaction to end
+        with self.lock:
+            if self.transaction_depth == 0:
+                self.connection.execute('BEGIN')
+
+            self.transaction_depth += 1
+
+            try:
+                yield self.connection
+            except Exception:
+                self.transaction_depth -= 1
+                if self.transaction_depth == 0:
+                    self.connection.execute('ROLLBACK')
+                raise
+            else:
+                self.transaction_depth -= 1
+                if self.transaction_depth == 0:
+                    self.connection.execute('COMMIT')
+
+    def select(self, clauses=None, parameters=None):
+        """
+        Return the statements matching the conditions and the base query.
+        """
+        base_clauses, base_parameters = self.base_query.clauses()
+
+        clauses = list(clauses or []) + base_clauses
+        parameters = list(parameters or []) + base_parameters
+
+        sql = 'SELECT statement.id, statement.text, statement.extra_data FROM statement'
+
+        if clauses:
+            sql += ' WHERE ' + ' AND '.join(clauses)
+
+        sql += ' ORDER BY statement.id'
+
+        # Reads wait for transactions in other threads to end
+        with self.lock:
+            rows = self.connection.execute(sql, parameters).fetchall()
+
+            return self.rows_to_objects(rows)
+
+    def rows_to_objects(self, rows):
+        """
+        Return a statement for each row, with the responses of each statement.
+        """
+        responses = {}
+        ids = [row[0] for row in rows]
+
+        for start in range(0, len(ids), MAX_QUERY_PARAMETERS):
+            chunk = ids[start:start + MAX_QUERY_PARAMETERS]
+
+            response_rows = self.connection.execute(
+                'SELECT response.statement_id, statement.text, response.occurrence '
+                'FROM response JOIN statement ON statement.id = response.response_id '
+                'WHERE response.statement_id IN ({}) ORDER BY response.id'.format(
+                    ', '.join('?' for _ in chunk)
+                ),
+                chunk
+            )
+
+            for statement_id, text, occurrence in response_rows:
+                responses.setdefault(statement_id, []).append(
+                    Response(text, occurrence=occurrence)
+                )
+
+        return [
+            Statement(
+                text,
+                in_response_to=responses.get(statement_id, []),
+                extra_data=json.loads(extra_data)
+            )
+            for statement_id, text, extra_data in rows
+        ]
+
+    def get_statement_id(self, text, create=False):
+        """
+        Return the id of the statement with the text. If create
+        is True, the statement is saved if it does not exist.
+        """
+        if create:
+            self.connection.execute(
+                'INSERT OR IGNORE INTO statement (text) VALUES (?)', (text, )
+            )
+
+        row = self.connection.execute(
+            'SELECT id FROM statement WHERE text = ?', (text, )
+        ).fetchone()
+
+        return row[0] if row else None
+
+    def count(self):
+        with self.lock:
+            return self.connection.execute('SELECT COUNT(*) FROM statement').fetchone()[0]
+
+    def find(self, statement_text):
+        results = self.select(['statement.text = ?'], [statement_text])
+
+        if not results:
+            return None
+
+        return results[0]
+
+    def filter(self, **kwargs):
+        """
+        Returns a list of statements in the database
+        that match the parameters specified.
+        """
+        clauses = []
+        parameters = []
+
+        if 'text' in kwargs:
+            clauses.append('statement.text = ?')
+            parameters.append(kwargs['text'])
+
+        if 'in_response_to' in kwargs:
+            response_texts = [response.text for response in kwargs['in_response_to']]
+
+            clauses.append(
+                '(SELECT COUNT(*) FROM response WHERE response.statement_id = statement.id) = ?'
+            )
+            parameters.append(len(response_texts))
+
+            for text in response_texts:
+                clauses.append(
+                    'EXISTS (SELECT 1 FROM response JOIN statement AS other '
+                    'ON other.id = response.response_id '
+                    'WHERE response.statement_id = statement.id AND other.text = ?)'
+                )
+                parameters.append(text)
+
+        if 'in_response_to__contains' in kwargs:
+            clauses.append(
+                'statement.id IN (SELECT response.statement_id FROM response '
+                'JOIN statement AS other ON other.id = response.response_id '
+                'WHERE other.text = ?)'
+            )
+            parameters.append(kwargs['in_response_to__contains'])
+
+        return self.select(clauses, parameters)
+
+    def update(self, statement, **kwargs):
+        force = kwargs.get('force', False)
+
+        # Do not alter the database unless writing is enabled
+        if force or not self.read_only:
+            self.annotate(statement)
+
+            with self.transaction():
+                statement_id = self.get_statement_id(statement.text, create=True)
+
+                self.connection.execute(
+                    'UPDATE statement SET extra_data = ? WHERE id = ?',
+                    (json.dumps(statement.extra_data), statement_id, )
+                )
+
+                self.connection.execute(
+                    'DELETE FROM response WHERE statement_id = ?', (statement_id, )
+                )
+
+                # Make sure that an entry for each response exists
+                self.connection.executemany(
+                    'INSERT INTO response (statement_id, response_id, occurrence) VALUES (?, ?, ?)',
+                    [
+                        (
+                            statement_id,
+                            self.get_statement_id(response.text, create=True),
+                            response.occurrence,
+                        )
+                        for response in statement.in_response_to
+                    ]
+                )
+
+            self.index_statement(statement)
+
+        return statement
+
+    def bulk_update(self, statements, **kwargs):
+        """
+        Save a list of statements in a single transaction, adding the
+        occurrence of each response to the saved occurrence.
+        """
+        force = kwargs.get('force', False)
+
+        if not force and self.read_only:
+            return
+
+        for statement in statements:
+            self.annotate(statement)
+
+        # Statements are created in the order that they are given
+        texts = OrderedDict()
+        for statement in statements:
+            texts[statement.text] = None
+            for response in statement.in_response_to:
+                texts[response.text] = None
+
+        with self.transaction():
+            self.connection.executemany(
+                'INSERT OR IGNORE INTO statement (text) VALUES (?)',
+                [(text, ) for text in texts]
+            )
+
+            statement_ids = {}
+            extra_data = {}
+            texts = list(texts)
+
+            for start in range(0, len(texts), MAX_QUERY_PARAMETERS):
+                chunk = texts[start:start + MAX_QUERY_PARAMETERS]
+
+                rows = self.connection.execute(
+                    'SELECT id, text, extra_data FROM statement WHERE text IN ({})'.format(
+                        ', '.join('?' for _ in chunk)
+                    ),
+                    chunk
+                )
+
+                for statement_id, text, data in rows:
+                    statement_ids[text] = statement_id
+                    extra_data[text] = data
+
+            updated_extra_data = []
+            responses = []
+
+            for statement in statements:
+                statement_id = statement_ids[statement.text]
+
+                if statement.extra_data:
+                    data = json.loads(extra_data[statement.text])
+                    data.update(statement.extra_data)
+                    extra_data[statement.text] = json.dumps(data)
+                    updated_extra_data.append((extra_data[statement.text], statement_id, ))
+
+                for response in statement.in_response_to:
+                    responses.append(
+                        (statement_id, statement_ids[response.text], response.occurrence, )
+                    )
+
+            self.connection.executemany(
+                'UPDATE statement SET extra_data = ? WHERE id = ?', updated_extra_data
+            )
+
+            self.connection.executemany(
+                'INSERT OR IGNORE INTO response (statement_id, response_id, occurrence) '
+                'VALUES (?, ?, 0)',
+                [(statement_id, response_id, ) for statement_id, response_id, _ in responses]
+            )
+
+            self.connection.executemany(
+                'UPDATE response SET occurrence = occurrence + ? '
+                'WHERE statement_id = ? AND response_id = ?',
+                [
+                    (occurrence, statement_id, response_id, )
+                    for statement_id, response_id, occurrence in responses
+                ]
+            )
+
+        for statement in statements:
+            self.index_statement(statement)
+
+    def remove(self, statement_text):
+        """
+        Removes the statement that matches the input text.
+        Removes any responses from statements if the response text matches the
+        input text.
+        """
+        with self.transaction():
+            # Responses to and from the statement are removed by the foreign keys
+            self.connection.execute(
+                'DELETE FROM statement WHERE text = ?', (statement_text, )
+            )
+
+        self.unindex_statement(statement_text)
+
+    def get_random_statements(self, count):
+        """
+        Return a list of up to `count` random statements. For each statement a
+        random id between the lowest and highest ids is chosen, and the first
+        statement with an id at least that large is found using the primary
+        key, so the table is never scanned. A statement that follows a gap
+        left by removed statements is more likely to be selected.
+        """
+        from random import randint
+
+        with self.lock:
+            lowest, highest = self.connection.execute(
+                'SELECT MIN(id), MAX(id) FROM statement'
+            ).fetchone()
+
+            if highest is None:
+                return []
+
+            rows = OrderedDict()
+
+            for _ in range(0, count):
+                row = self.connection.execute(
+                    'SELECT id, text, extra_data FROM statement '
+                    'WHERE id >= ? ORDER BY id LIMIT 1',
+                    (randint(lowest, highest), )
+                ).fetchone()
+                rows[row[0]] = row
+
+            return self.rows_to_objects(list(rows.values()))
+
+    def get_response_statements(self):
+        """
+        Return only statements that are in response to another statement.
+        A statement must exist which lists the closest matching statement in the
+        in_response_to field. Otherwise, the logic adapter may find a closest
+        matching statement that does not have a known response.
+        """
+        return self.select([
+            'EXISTS (SELECT 1 FROM response WHERE response.response_id = statement.id)'
+        ])
+
+    def count_response_statements(self):
+        """
+        Return the number of statements that are in response to another
+        statement, counted with the index of the response table.
+        """
+        with self.lock:
+            return self.connection.execute(
+                'SELECT COUNT(DISTINCT response_id) FROM response'
+            ).fetchone()[0]
+
+    def find_response_statements(self, texts):
+        """
+        Return the statements with the texts that are in response to another
+        statement, in the order that the texts are given. The statements are
+        selected with one query for each chunk of texts.
+        """
+        texts = list(texts)
+        statements = {}
+
+        for start in range(0, len(texts), MAX_QUERY_PARAMETERS):
+            chunk = texts[start:start + MAX_QUERY_PARAMETERS]
+
+            for statement in self.select([
+                'statement.text IN ({})'.format(', '.join('?' for _ in chunk)),
+                'EXISTS (SELECT 1 FROM response WHERE response.response_id = statement.id)'
+            ], chunk):
+                statements[statement.text] = statement
+
+        return [statements[text] for text in texts if text in statements]
+
+    def drop(self):
+        """
+        Remove the database. The database is created
+        again the next time that the adapter is used.
+        """
+        with self.lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+            for suffix in ('', '-wal', '-shm', ):
+                path = self.database_path + suffix
+                if os.path.exists(path):
+                    os.remove(path)
+
+        self.clear_indexes()
@@ -1,4 +1,6 @@
 from chatterbot.adapters import Adapter
+from chatterbot.conversation import Statement, Response
+import threading
 
 
 class StorageAdapter(Adapter):
@@ -14,13 +16,78 @@ class StorageAdapter(Adapter):
         self.read_only = kwargs.get('read_only', False)
         self.adapter_supports_queries = True
 
-    def generate_base_query(self, chatterbot):
+        # Indexes of response statements, keyed by the index class
+        self.indexes = {}
+
+        # Functions that add data to a statement before it is saved
+        self.annotators = []
+
+        # Objects that are notified when a statement is saved or removed
+        self.listeners = []
+
+        # Held while data that is shared between threads is being changed
+        self.lock = threading.RLock()
+
+        # The query used when no filters have been applied in a thread
+        self.default_base_query = None
+
+        # Each thread has its own base query
+        self.query_state = threading.local()
+
+        # Random statements selected ahead of time, if a pool size is set
+        self.random_statement_pool = None
+
+        random_statement_pool_size = kwargs.get('random_statement_pool_size', 0)
+        if random_statement_pool_size:
+            from chatterbot.utils.sampling import RandomStatementPool
+
+            self.random_statement_pool = RandomStatementPool(
+                self, size=random_statement_pool_size
+            )
+            self.add_listener(self.random_statement_pool)
+
+    @property
+    def base_query(self):
+        """
+        The query that statements returned by the adapter must match.
+        The base query is set by the chat bot's filters when a response is
+        generated, and each thread has its own base query so that responses
+        generated at the same time do not affect each other.
+        """
+        return getattr(self.query_state, 'base_query', self.default_base_query)
+
+    @base_query.setter
+    def base_query(self, query):
+        self.query_state.base_query = query
+
+    def generate_base_query(self, chatterbot, session_id=None):
         """
         Create a base query for the storage adapter.
         """
+        from chatterbot.filters import accepts_session_id
+
         if self.adapter_supports_queries:
+            # Start from the default query, not the query of a previous response
+            self.base_query = self.default_base_query
+
             for filter_instance in chatterbot.filters:
-                self.base_query = filter_instance.filter_selection(chatterbot)
+                if accepts_session_id(filter_instance):
+                    self.base_query = filter_instance.filter_selection(chatterbot, session_id)
+                else:
+                    self.base_query = filter_instance.filter_selection(chatterbot)
+
+    def get_base_query_key(self):
+        """
+        Return a string that identifies the current base query, so that
+        results found with one base query can be told apart from results
+        found with another.
+        """
+        base_query = self.base_query
+
+        if base_query is None:
+            return None
+
+        return repr(sorted(vars(base_query).items()))
 
     def count(self):
         """
@@ -59,9 +126,86 @@ class StorageAdapter(Adapter):
         """
         raise self.AdapterMethodNotImplementedError()
 
+    def bulk_update(self, statements, **kwargs):
+        """
+        Save a list of statements. Unlike update, the occurrence of each
+        response is added to the occurrence that is already saved for the
+        response, and saved responses that are not in the list are kept.
+
+        This method may be overridden by a child class to save
+        the statements with fewer operations on the database.
+        """
+        force = kwargs.get('force', False)
+
+        for statement in statements:
+            data = self.merge_statement_data(
+                self.find(statement.text), statement
+            )
+
+            self.update(Statement(
+                data['text'],
+                in_response_to=[
+                    Response(response['text'], occurrence=response['occurrence'])
+                    for response in data['in_response_to']
+                ],
+                extra_data=data['extra_data']
+            ), force=force)
+
+    def merge_statement_data(self, saved, statement):
+        """
+        Return the serialized data of a statement, with the occurrence of
+        each of its responses added to that of the saved statement.
+
+        :param saved: The saved statement, or its serialized data, or None.
+        :param statement: The statement to add to the saved statement.
+        """
+        if saved is None:
+            saved = {'in_response_to': [], 'extra_data': {}}
+        elif isinstance(saved, Statement):
+            saved = saved.serialize()
+
+        responses = [response.copy() for response in saved['in_response_to']]
+        positions = dict(
+            (response['text'], index) for index, response in enumerate(responses)
+        )
+
+        for response in statement.in_response_to:
+            if response.text in positions:
+                responses[positions[response.text]]['occurrence'] += response.occurrence
+            else:
+                positions[response.text] = len(responses)
+                responses.append(response.serialize())
+
+        extra_data = dict(saved.get('extra_data', {}))
+        extra_data.update(statement.extra_data)
+
+        return {
+            'text': statement.text,
+            'in_response_to': responses,
+            'extra_data': extra_data
+        }
+
     def get_random(self):
         """
-        Returns a random statement from the database
+        Returns a random statement from the database.
+        If the adapter has a pool of random statements,
+        the statement is taken from the pool.
+        """
+        if self.random_statement_pool is not None:
+            return self.random_statement_pool.get()
+
+        statements = self.get_random_statements(1)
+
+        if not statements:
+            raise self.EmptyDatabaseException()
+
+        return statements[0]
+
+    def get_random_statements(self, count):
+        """
+        Return a list of up to `count` random statements from the database.
+        The same statement may be returned more than once. An empty list is
+        returned if the database has no statements.
         """
         raise self.AdapterMethodNotImplementedError()
 
@@ -71,6 +215,190 @@ class StorageAdapter(Adapter):
         """
         raise self.AdapterMethodNotImplementedError()
 
+    def add_annotator(self, annotator):
+        """
+        Register a function that will be called with each statement before
+        it is saved. Annotators can store data that is expensive to calculate
+        in the statement's extra_data so that it is not recalculated each
+        time the statement is compared to an input.
+        """
+        if annotator not in self.annotators:
+            self.annotators.append(annotator)
+
+    def annotate(self, statement):
+        """
+        Call each of the registered annotators with the statement.
+        """
+        for annotator in self.annotators:
+            annotator(statement)
+
+    def add_index(self, index_class):
+        """
+        Register an index that will be kept up to date as statements are
+        saved to and removed from the database. The index is filled with
+        the statements that already have known responses when it is added.
+
+        :param index_class: A subclass of StatementIndex.
+        :returns: The instance of the index being maintained.
+        """
+        with self.lock:
+            if index_class not in self.indexes:
+                index = index_class()
+                index.populate(self.iter_all_response_statements(index.extra_data_keys))
+                self.indexes[index_class] = index
+
+            return self.indexes[index_class]
+
+    def refresh_index(self, index):
+        """
+        Bring an index up to date if other processes have saved or removed
+        statements since it was filled. An index holds every statement that
+        is in response to another statement, so it is out of date when the
+        number of those statements in the database is different.
+        """
+        count = self.count_response_statements()
+
+        if count is None or count == len(index):
+            return
+
+        with self.lock:
+            index.refresh(self.iter_all_response_statements(index.extra_data_keys))
+
+    def iter_all_response_statements(self, extra_data_keys=None):
+        """
+        Yield the statements that are in response to another statement,
+        read without the filters of the current base query.
+        """
+        base_query = self.base_query
+        self.base_query = self.default_base_query
+
+        try:
+            for statement in self.iter_response_statements(extra_data_keys):
+                yield statement
+        finally:
+            self.base_query = base_query
+
+    def add_listener(self, listener):
+        """
+        Register an object to be notified after each statement is saved or
+        removed, such as a cache that holds data based on saved statements.
+        The listener's statement_updated method is called with each saved
+        statement, and its statement_removed method is called with the text
+        of each removed statement.
+        """
+        if listener not in self.listeners:
+            self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        """
+        Stop notifying a registered listener of changes.
+        """
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def index_statement(self, statement):
+        """
+        Update each index after a statement has been saved. Every response
+        in the statement's in_response_to list is a statement with a known
+        response, which makes it a candidate for future matches.
+        """
+        for index in self.indexes.values():
+            for response in statement.in_response_to:
+                index.add(response.text)
+
+        for listener in self.listeners:
+            listener.statement_updated(statement)
+
+    def unindex_statement(self, statement_text):
+        """
+        Remove a statement from each index after it has been removed.
+        """
+        for index in self.indexes.values():
+            index.remove(statement_text)
+
+        for listener in self.listeners:
+            listener.statement_removed(statement_text)
+
+    def search_index(self, index_class, statement, limit=100):
+        """
+        Return up to `limit` statements with known responses that the
+        index ranks as the most likely matches for the input statement.
+        The statements are read from the database with one query.
+        """
+        index = self.add_index(index_class)
+        self.refresh_index(index)
+
+        texts = index.search(statement.text, limit)
+        results = self.find_response_statements(texts)
+
+        # Without a filter, a text is only missing once the statement has
+        # been removed or no longer has a response, so it is taken out of
+        # the index. Adapters that apply the base query may also leave out
+        # statements that the chat bot's filters exclude.
+        if self.base_query is self.default_base_query and len(results) < len(texts):
+            found = set(result.text for result in results)
+
+            for text in texts:
+                if text not in found:
+                    index.remove(text)
+
+        return results
+
+    def count_response_statements(self):
+        """
+        Return the number of statements that are in response to another
+        statement, without the filters of the base query, or None if the
+        adapter cannot count them without reading every statement. The
+        count is used to find out when other processes have changed the
+        statements that an index holds.
+
+        This method may be overridden by a child class.
+        """
+        return None
+
+    def find_response_statements(self, texts):
+        """
+        Return the statements with the texts that are in response to
+        another statement, in the order that the texts are given.
+
+        This method may be overridden by a child class to read all
+        of the statements with a single query.
+        """
+        results = []
+
+        for text in texts:
+            match = self.find(text)
+
+            if match and self.filter(in_response_to__contains=text):
+                results.append(match)
+
+        return results
+
+    def clear_indexes(self):
+        """
+        Remove every statement from each index and from the pool of
+        random statements, after all statements have been removed
+        from the database.
+        """
+        for index in self.indexes.values():
+            index.clear()
+
+        if self.random_statement_pool is not None:
+            self.random_statement_pool.clear()
+
+    def backfill(self):
+        """
+        Save every statement in the database so that the data added by each
+        registered annotator is stored for statements that were saved before
+        the annotator was used. Each index is then rebuilt.
+        """
+        for statement in self.filter():
+            self.update(statement, force=True)
+
+        for index in self.indexes.values():
+            index.clear()
+            index.populate(self.iter_response_statements(index.extra_data_keys))
+
     def get_response_statements(self):
         """
         Return only statements that are in response to another statement.
@@ -84,18 +412,36 @@ class StorageAdapter(Adapter):
         statement_list = self.filter()
 
         responses = set()
-        to_remove = list()
         for statement in statement_list:
             for response in statement.in_response_to:
                 responses.add(response.text)
-        for statement in statement_list:
-            if statement.text not in responses:
-                to_remove.append(statement)
 
-        for statement in to_remove:
-            statement_list.remove(statement)
+        return [
+            statement for statement in statement_list if statement.text in responses
+        ]
 
-        return statement_list
+    def migrate(self):
+        """
+        Update the data saved by an earlier version of the adapter to the
+        format that the adapter uses now. This method may be overridden
+        by a child class that changes the format of its data.
+        """
+        pass
+
+    def iter_response_statements(self, extra_data_keys=None):
+        """
+        Return an iterable of the statements that are in response to another
+        statement, to be compared with an input statement. Only the text and
+        the listed keys of the extra data of each statement will be used, so
+        an adapter may read the rest of each statement once it is needed.
+
+        This method may be overridden by a child class to read the
+        statements from the database as they are iterated over.
+
+        :param extra_data_keys: The keys of the extra data that will be used,
+                                or None if any of the extra data may be used.
+        """
+        return self.get_response_statements()
 
     class EmptyDatabaseException(Exception):
 
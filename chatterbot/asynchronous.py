@@ -0,0 +1,436 @@
+"""
+Support for using ChatterBot from asyncio coroutines.
+
+This module requires Python 3.5 or later. It is only imported when one of
+its features is used, such as :meth:`chatterbot.ChatBot.aget_response`.
+"""
+import asyncio
+from functools import partial
+from chatterbot.adapters import Adapter
+from chatterbot.conversation import Statement, Response
+
+
+def run_in_executor(function, *args, **kwargs):
+    """
+    Run a blocking function in the event loop's default executor, and
+    return a future for its result. The coroutine awaiting the result does
+    not hold a thread while the function runs.
+    """
+    loop = asyncio.get_event_loop()
+
+    return loop.run_in_executor(None, partial(function, *args, **kwargs))
+
+
+def get_async_storage(chatbot):
+    """
+    Return the chat bot's asynchronous storage adapter. If one was not
+    set, the chat bot's storage adapter is used from the executor.
+    """
+    if chatbot.async_storage is None:
+        chatbot.async_storage = ThreadedStorageAdapter(storage=chatbot.storage)
+        chatbot.async_storage.set_context(chatbot)
+
+    return chatbot.async_storage
+
+
+async def process_input_statement(chatbot, input_item):
+    """
+    Return the statement for an input value, using the saved
+    statement with the same text if one exists.
+
+    Input adapters can provide an ``aprocess_input`` coroutine.
+    Otherwise the adapter's process_input method is run in the executor.
+    """
+    if hasattr(chatbot.input, 'aprocess_input'):
+        input_statement = await chatbot.input.aprocess_input(input_item)
+    else:
+        input_statement = await run_in_executor(chatbot.input.process_input, input_item)
+
+    chatbot.logger.info(u'Recieved input statement: {}'.format(input_statement.text))
+
+    existing_statement = await get_async_storage(chatbot).find(input_statement.text)
+
+    if existing_statement:
+        return existing_statement
+
+    return input_statement
+
+
+async def process_response(chatbot, response, confidence):
+    """
+    Return the response processed by the output adapter.
+
+    Output adapters can provide an ``aprocess_response`` coroutine.
+    Otherwise the adapter's process_response method is run in the executor.
+    """
+    if hasattr(chatbot.output, 'aprocess_response'):
+        return await chatbot.output.aprocess_response(response, confidence)
+
+    return await run_in_executor(chatbot.output.process_response, response, confidence)
+
+
+async def get_response(chatbot, input_item, session_id=None):
+    """
+    Return the chat bot's response to the input, without blocking the event
+    loop. Selecting a response uses the logic adapters, which compare
+    statements and read from the chat bot's storage adapter, so it is run
+    in the executor.
+    """
+    input_statement = await process_input_statement(chatbot, input_item)
+
+    statement, response, confidence = await run_in_executor(
+        chatbot.generate_response, input_statement, session_id
+    )
+
+    # Learn that the user's input was a valid response to the chat bot's previous output
+    previous_statement = chatbot.add_previous_response(statement, session_id)
+    await get_async_storage(chatbot).bulk_update([
+        chatbot.get_learned_statement(statement, previous_statement)
+    ])
+
+    chatbot.add_to_conversation(statement, response, session_id)
+
+    return await process_response(chatbot, response, confidence)
+
+
+class AsyncStorageAdapter(Adapter):
+    """
+    The interface that storage adapters used from coroutines implement.
+    Each method is a coroutine that returns the same results as the
+    method of the same name on a StorageAdapter.
+    """
+
+    def __init__(self, **kwargs):
+        super(AsyncStorageAdapter, self).__init__(**kwargs)
+
+        self.kwargs = kwargs
+        self.read_only = kwargs.get('read_only', False)
+
+    async def count(self):
+        raise self.AdapterMethodNotImplementedError()
+
+    async def find(self, statement_text):
+        raise self.AdapterMethodNotImplementedError()
+
+    async def filter(self, **kwargs):
+        raise self.AdapterMethodNotImplementedError()
+
+    async def update(self, statement, **kwargs):
+        raise self.AdapterMethodNotImplementedError()
+
+    async def bulk_update(self, statements, **kwargs):
+        """
+        Save a list of statements, adding the occurrence of each response
+        to the saved occurrence.
+
+        This method may be overridden by a child class to save
+        the statements with fewer operations on the database.
+        """
+        force = kwargs.get('force', False)
+
+        for statement in statements:
+            saved = await self.find(statement.text)
+            data = self.context.storage.merge_statement_data(saved, statement)
+
+            await self.update(Statement(
+                data['text'],
+                in_response_to=[
+                    Response(response['text'], occurrence=response['occurrence'])
+                    for response in data['in_response_to']
+                ],
+                extra_data=data['extra_data']
+            ), force=force)
+
+    async def remove(self, statement_text):
+        raise self.AdapterMethodNotImplementedError()
+
+    async def get_random(self):
+        raise self.AdapterMethodNotImplementedError()
+
+    async def get_response_statements(self):
+        raise self.AdapterMethodNotImplementedError()
+
+    async def drop(self):
+        raise self.AdapterMethodNotImplementedError()
+
+
+class ThreadedStorageAdapter(AsyncStorageAdapter):
+    """
+    Use a storage adapter from coroutines by running each
+    of its methods in the event loop's default executor.
+    """
+
+    def __init__(self, storage=None, **kwargs):
+        super(ThreadedStorageAdapter, self).__init__(**kwargs)
+
+        self.storage = storage
+
+    def set_context(self, context):
+        super(ThreadedStorageAdapter, self).set_context(context)
+
+        if self.storage is None:
+            self.storage = context.storage
+
+    async def count(self):
+        return await run_in_executor(self.storage.count)
+
+    async def find(self, statement_text):
+        return await run_in_executor(self.storage.find, statement_text)
+
+    async def filter(self, **kwargs):
+        return await run_in_executor(self.storage.filter, **kwargs)
+
+    async def update(self, statement, **kwargs):
+        return await run_in_executor(self.storage.update, statement, **kwargs)
+
+    async def bulk_update(self, statements, **kwargs):
+        return await run_in_executor(self.storage.bulk_update, statements, **kwargs)
+
+    async def remove(self, statement_text):
+        return await run_in_executor(self.storage.remove, statement_text)
+
+    async def get_random(self):
+        return await run_in_executor(self.storage.get_random)
+
+    async def get_response_statements(self):
+        return await run_in_executor(self.storage.get_response_statements)
+
+    async def drop(self):
+        return await run_in_executor(self.storage.drop)
+
+
+class MotorStorageAdapter(AsyncStorageAdapter):
+    """
+    Store statements in MongoDB using the Motor asyncio driver. Statements
+    are stored in the same format as the MongoDatabaseAdapter uses, so the
+    two adapters can share a database.
+
+    The annotators, indexes and listeners registered with the chat bot's
+    storage adapter are used for the statements saved by this adapter.
+    """
+
+    def __init__(self, **kwargs):
+        super(MotorStorageAdapter, self).__init__(**kwargs)
+        from motor.motor_asyncio import AsyncIOMotorClient
+
+        self.database_name = self.kwargs.get(
+            'database', 'chatterbot-database'
+        )
+        self.database_uri = self.kwargs.get(
+            'database_uri', 'mongodb://localhost:27017/'
+        )
+
+        from chatterbot.adapters.storage.mongodb import get_collection_name, Query
+
+        self.tenant = self.kwargs.get('tenant')
+
+        client_options = {}
+
+        if 'max_pool_size' in self.kwargs:
+            client_options['maxPoolSize'] = self.kwargs['max_pool_size']
+
+        if 'min_pool_size' in self.kwargs:
+            client_options['minPoolSize'] = self.kwargs['min_pool_size']
+
+        self.client = AsyncIOMotorClient(self.database_uri, **client_options)
+
+        self.database = self.client[self.database_name]
+
+        # The mongo collection of statement documents
+        self.statements = self.database[get_collection_name(self.tenant)]
+
+        # The query that statements are read with, as with the MongoDatabaseAdapter
+        self.base_query = Query()
+
+    def mongo_to_object(self, statement_data):
+        """
+        Return a Statement object when given data returned from Mongo DB.
+        """
+        return Statement(
+            statement_data['text'],
+            in_response_to=[
+                Response(response['text'], occurrence=response.get('occurrence', 1))
+                for response in statement_data.get('in_response_to', [])
+            ],
+            extra_data=statement_data.get('extra_data', {})
+        )
+
+    async def count(self):
+        return await self.statements.count_documents({})
+
+    async def find(self, statement_text):
+        query = self.base_query.statement_text_equals(statement_text)
+
+        values = await self.statements.find_one(query.value())
+
+        if not values:
+            return None
+
+        return self.mongo_to_object(values)
+
+    async def filter(self, **kwargs):
+        query = self.base_query
+
+        if 'in_response_to' in kwargs:
+            query = query.statement_response_list_equals([
+                {'text': response.text} for response in kwargs.pop('in_response_to')
+            ])
+
+        if 'in_response_to__contains' in kwargs:
+            query = query.statement_response_list_contains(
+                kwargs.pop('in_response_to__contains')
+            )
+
+        query = query.raw(kwargs)
+
+        matches = await self.statements.find(query.value()).to_list(length=None)
+
+        return [self.mongo_to_object(match) for match in matches]
+
+    async def update(self, statement, **kwargs):
+        from chatterbot.adapters.storage.mongodb import get_responder_count_operations
+
+        force = kwargs.get('force', False)
+
+        # Do not alter the database unless writing is enabled
+        if force or not self.read_only:
+            storage = self.context.storage if self.context else None
+
+            if storage is not None:
+                await run_in_executor(storage.annotate, statement)
+
+            data = statement.serialize()
+
+            previous_data = await self.statements.find_one_and_update(
+                {'text': statement.text},
+                {'$set': data},
+                projection={'_id': False, 'in_response_to.text': True},
+                upsert=True
+            )
+
+            # Count each new response, saving an entry for it if one does not exist
+            operations = get_responder_count_operations(previous_data, data)
+
+            if operations:
+                await self.statements.bulk_write(operations, ordered=False)
+
+            if storage is not None:
+                storage.index_statement(statement)
+
+        return statement
+
+    async def bulk_update(self, statements, **kwargs):
+        """
+        Save a list of statements, adding the occurrence of each response to
+        the saved occurrence with $inc, as the MongoDatabaseAdapter does.
+        """
+        from chatterbot.adapters.storage import mongodb
+
+        force = kwargs.get('force', False)
+
+        # Do not alter the database unless writing is enabled
+        if not force and self.read_only:
+            return
+
+        storage = self.context.storage if self.context else None
+
+        if storage is not None:
+            for statement in statements:
+                await run_in_executor(storage.annotate, statement)
+
+        extra_data, occurrences = mongodb.get_occurrences(statements)
+
+        query, projection = mongodb.get_saved_responses_query(extra_data)
+        documents = await self.statements.find(query, projection).to_list(length=None)
+        new_responses = mongodb.get_new_responses(occurrences, documents)
+
+        statement_operations, response_operations, increment_operations = (
+            mongodb.get_occurrence_operations(extra_data, occurrences, new_responses)
+        )
+
+        if statement_operations:
+            await self.statements.bulk_write(statement_operations, ordered=True)
+
+        result = None
+
+        if response_operations:
+            result = await self.statements.bulk_write(response_operations, ordered=False)
+
+        responder_operations, recount = mongodb.get_learned_responder_operations(
+            result, response_operations, new_responses
+        )
+
+        if increment_operations or responder_operations:
+            await self.statements.bulk_write(
+                increment_operations + responder_operations, ordered=False
+            )
+
+        if recount:
+            await self.count_responders(recount)
+
+        if storage is not None:
+            for statement in statements:
+                storage.index_statement(statement)
+
+    async def remove(self, statement_text):
+        from chatterbot.adapters.storage.mongodb import get_responder_count_operations
+
+        await self.statements.update_many(
+            {'in_response_to.text': statement_text},
+            {'$pull': {'in_response_to': {'text': statement_text}}}
+        )
+
+        removed_data = await self.statements.find_one_and_delete(
+            {'text': statement_text},
+            projection={'_id': False, 'in_response_to.text': True}
+        )
+
+        operations = get_responder_count_operations(removed_data, {})
+
+        if operations:
+            await self.statements.bulk_write(operations, ordered=False)
+
+        if self.context:
+            self.context.storage.unindex_statement(statement_text)
+
+    async def count_responders(self, texts):
+        """
+        Count the statements in response to each of the
+        statements with the given texts, and save the counts.
+        """
+        from chatterbot.adapters.storage import mongodb
+
+        responder_counts = await self.statements.aggregate(
+            mongodb.get_responder_count_pipeline(texts)
+        ).to_list(length=None)
+
+        operations = list(mongodb.iter_responder_count_operations(responder_counts, texts))
+
+        if operations:
+            await self.statements.bulk_write(operations, ordered=False)
+
+    async def get_random(self):
+        documents = await self.statements.aggregate(
+            [{'$sample': {'size': 1}}]
+        ).to_list(length=1)
+
+        if not documents:
+            raise self.context.storage.EmptyDatabaseException()
+
+        return self.mongo_to_object(documents[0])
+
+    async def get_response_statements(self):
+        query = self.base_query.raw({'responder_count': {'$gt': 0}})
+
+        matches = await self.statements.find(query.value()).to_list(length=None)
+
+        return [self.mongo_to_object(match) for match in matches]
+
+    async def drop(self):
+        if self.tenant is None:
+            await self.client.drop_database(self.database_name)
+        else:
+            await self.statements.drop()
+
+        if self.context:
+            self.context.storage.clear_indexes()
@@ -2,7 +2,8 @@ from .adapters.storage import StorageAdapter
 from .adapters.logic import LogicAdapter, MultiLogicAdapter
 from .adapters.input import InputAdapter
 from .adapters.output import OutputAdapter
-from .utils.queues import ResponseQueue
+from .conversation.session import Session
+from .utils.cache import ResponseCache
 from .utils.module_loading import import_module
 import logging
 
@@ -29,8 +30,11 @@ class ChatBot(object):
             'chatterbot.adapters.output.OutputFormatAdapter'
         )
 
+        # The conversation used when a response is requested without a session id
+        self.default_session = Session()
+
         # The last 10 statement inputs and outputs
-        self.recent_statements = ResponseQueue(maxsize=10)
+        self.recent_statements = self.default_session.conversation
 
         # The storage adapter must be an instance of StorageAdapter
         self.validate_adapter_class(storage_adapter, StorageAdapter)
@@ -46,8 +50,15 @@ class ChatBot(object):
         self.input = self.initialize_class(input_adapter, **kwargs)
         self.output = self.initialize_class(output_adapter, **kwargs)
 
+        session_manager = kwargs.get('session_manager',
+            'chatterbot.conversation.session.SessionManager'
+        )
+
+        # The sessions of conversations with each user
+        self.conversation_sessions = self.initialize_class(session_manager, **kwargs)
+
         filters = kwargs.get('filters', tuple())
-        self.filters = (import_module(F)() for F in filters)
+        self.filters = tuple(import_module(F)() for F in filters)
 
         # Add required system logic adapter
         self.add_logic_adapter('chatterbot.adapters.logic.NoKnowledgeAdapter')
@@ -62,6 +73,26 @@ class ChatBot(object):
         self.input.set_context(self)
         self.output.set_context(self)
 
+        # Responses to recent inputs are only cached if a cache size is set
+        self.response_cache = None
+
+        response_cache_size = kwargs.get('response_cache_size', 0)
+        if response_cache_size:
+            self.response_cache = ResponseCache(
+                maxsize=response_cache_size,
+                timeout=kwargs.get('response_cache_timeout')
+            )
+            self.storage.add_listener(self.response_cache)
+
+        # The storage adapter used by aget_response, which defaults to
+        # running the methods of the storage adapter in threads
+        self.async_storage = None
+
+        async_storage_adapter = kwargs.get('async_storage_adapter')
+        if async_storage_adapter:
+            self.async_storage = self.initialize_class(async_storage_adapter, **kwargs)
+            self.async_storage.set_context(self)
+
         # Use specified trainer or fall back to the default
         trainer = kwargs.get('trainer', 'chatterbot.trainers.Trainer')
         TrainerClass = import_module(trainer)
@@ -163,74 +194,169 @@ class ChatBot(object):
                 )
             )
 
-    def get_last_conversance(self):
+    def get_session(self, session_id=None):
+        """
+        Return the session with the id, which is created if it does not
+        exist. The default session is returned if no id is given.
+        """
+        if session_id is None:
+            return self.default_session
+
+        return self.conversation_sessions.get(session_id)
+
+    def get_last_conversance(self, session_id=None):
         """
         Return the most recent input statement and response pair.
         """
-        if not self.recent_statements.empty():
-            return self.recent_statements[-1]
-        return None
+        if session_id is None:
+            if not self.recent_statements.empty():
+                return self.recent_statements[-1]
+            return None
 
-    def get_last_response_statement(self):
+        return self.get_session(session_id).get_last_conversance()
+
+    def get_last_response_statement(self, session_id=None):
         """
         Return the last statement that was received.
         """
-        previous_interaction = self.get_last_conversance()
+        previous_interaction = self.get_last_conversance(session_id)
         if previous_interaction:
             # Return the output statement
             return previous_interaction[1]
         return None
 
-    def get_last_input_statement(self):
+    def get_last_input_statement(self, session_id=None):
         """
         Return the last response that was given.
         """
-        previous_interaction = self.get_last_conversance()
+        previous_interaction = self.get_last_conversance(session_id)
         if previous_interaction:
             # Return the input statement
             return previous_interaction[0]
         return None
 
-    def get_response(self, input_item):
+    def get_response(self, input_item, session_id=None):
         """
         Return the bot's response based on the input.
 
         :param input_item: An input value.
+        :param session_id: The id of the conversation that the input is a
+                           part of. Each conversation keeps its own record of
+                           recent statements, so that the conversations of
+                           different users do not affect each other.
         :returns: A response to the input.
         :rtype: Statement
         """
         input_statement = self.input.process_input_statement(input_item)
 
-        statement, response, confidence = self.generate_response(input_statement)
+        statement, response, confidence = self.generate_response(input_statement, session_id)
 
         # Learn that the user's input was a valid response to the chat bot's previous output
-        self.learn_response(statement)
+        self.learn_response(statement, session_id)
 
-        self.recent_statements.append(
-            (statement, response, )
-        )
+        self.add_to_conversation(statement, response, session_id)
 
         # Process the response output with the output adapter
         return self.output.process_response(response, confidence)
 
-    def generate_response(self, input_statement):
+    def add_to_conversation(self, statement, response, session_id=None):
+        """
+        Add an input statement and the response to it to a session's conversation.
+        The features that comparison functions cached are removed from both
+        statements first, so that they are not returned to the user.
+        """
+        statement.remove_features()
+        response.remove_features()
+
+        if session_id is None:
+            self.recent_statements.append((statement, response, ))
+        else:
+            session = self.get_session(session_id)
+            session.conversation.append((statement, response, ))
+            self.conversation_sessions.save(session)
+
+    def aget_response(self, input_item, session_id=None):
+        """
+        Return a coroutine that returns the bot's response to the input.
+        The event loop is not blocked while the response is selected,
+        so many conversations can be handled at once. Requires Python 3.5
+        or later.
+
+        .. code-block:: python
+
+           response = await chatbot.aget_response('Hello')
+
+        :param input_item: An input value.
+        :param session_id: The id of the conversation that the input is a part of.
+        :returns: A coroutine that returns a response to the input.
+        """
+        from .asynchronous import get_response
+
+        return get_response(self, input_item, session_id)
+
+    def generate_response(self, input_statement, session_id=None):
         """
         Return a response based on a given input statement.
         """
-        self.storage.generate_base_query(self)
+        self.storage.generate_base_query(self, session_id)
+
+        if self.response_cache is None:
+            # Select a response to the input statement
+            confidence, response = self.logic.process(input_statement)
+
+            return input_statement, response, confidence
+
+        cache_key = self.response_cache.get_key(
+            input_statement.text, self.storage.get_base_query_key()
+        )
+
+        cached = self.response_cache.get(cache_key)
+
+        if cached is not None:
+            confidence, response = cached
+            return input_statement, response, confidence
 
-        # Select a response to the input statement
-        confidence, response = self.logic.process(input_statement)
+        confidence, response, adapters = self.logic.get_result(input_statement)
+
+        # Responses without any confidence, such as a random response that
+        # is given when nothing matches, are not worth repeating
+        cacheable = response is not None and confidence > 0
+
+        if cacheable and all(adapter.cache_responses for adapter in adapters):
+            # A response found in the database was selected because it is
+            # in response to the statement that matched the input, so the
+            # entry is removed when a new response to any of them is saved
+            match_texts = [
+                statement.text for statement in response.in_response_to
+            ]
+
+            self.response_cache.set(
+                cache_key, (confidence, response, ), response.text, match_texts
+            )
 
         return input_statement, response, confidence
 
-    def learn_response(self, statement):
+    def learn_response(self, statement, session_id=None):
         """
         Learn that the statement provided is a valid response.
         """
+        previous_statement = self.add_previous_response(statement, session_id)
+
+        # Update the database after selecting a response
+        self.storage.bulk_update([
+            self.get_learned_statement(statement, previous_statement)
+        ])
+
+    def add_previous_response(self, statement, session_id=None):
+        """
+        Add the bot's previous response in the session, if there is one,
+        to the list of statements the statement is in response to.
+
+        :returns: The previous response, or None if there is not one.
+        """
         from .conversation import Response
 
-        previous_statement = self.get_last_response_statement()
+        previous_statement = self.get_last_response_statement(session_id)
 
         if previous_statement:
             statement.add_response(
@@ -241,8 +367,28 @@ class ChatBot(object):
                 previous_statement.text
             ))
 
-        # Update the database after selecting a response
-        self.storage.update(statement)
+        return previous_statement
+
+    def get_learned_statement(self, statement, previous_statement):
+        """
+        Return a statement that holds only what was learned from the input,
+        for the storage adapter's bulk_update method. The storage adapter adds
+        the occurrence of the response to the occurrence that is saved, so
+        responses learned at the same time in other threads are not lost.
+        """
+        from .conversation import Statement, Response
+
+        in_response_to = []
+
+        if previous_statement:
+            in_response_to.append(Response(previous_statement.text))
+
+        # The extra data is shared so that annotations are added to the statement
+        return Statement(
+            statement.text,
+            in_response_to=in_response_to,
+            extra_data=statement.extra_data
+        )
 
     def set_trainer(self, training_class, **kwargs):
         """
@@ -1,2 +1,2 @@
-from .statement import Statement
+from .statement import Statement, LazyStatement
 from .response import Response
@@ -2,6 +2,9 @@
 This module contains various text-comparison algorithms
 designed to compare one statement to another.
 """
+from chatterbot.conversation.statement import Statement
+from chatterbot.utils.cache import LRUCache
+
 
 def levenshtein_distance(statement, other_statement):
     """
@@ -19,6 +22,161 @@ def levenshtein_distance(statement, other_statement):
     return similarity / 100.0
 
 
+def levenshtein_distance_batch(statement, statement_list):
+    """
+    Compare a statement to each statement in a list based on the Levenshtein
+    distance of their text. The result is the same as calling
+    levenshtein_distance for each statement in the list, but the input text
+    is only prepared once and statements that cannot be more similar than
+    the best match found so far are skipped without being fully compared.
+
+    :return: The greatest percent of similarity and the index of the
+             first statement in the list with that similarity, or None
+             if no statement has any similarity to the input.
+    :rtype: tuple
+    """
+    from difflib import SequenceMatcher
+
+    try:
+        # The same C extension is used by fuzzywuzzy when it is installed
+        from Levenshtein import ratio as levenshtein_ratio
+    except ImportError:
+        levenshtein_ratio = None
+
+    def to_percent(value):
+        return int(round(100 * value)) / 100.0
+
+    text = statement.text.lower()
+    text_length = len(text)
+
+    matcher = SequenceMatcher(None)
+    matcher.set_seq1(text)
+
+    max_similarity = 0
+    closest_index = None
+
+    if not text_length:
+        return max_similarity, closest_index
+
+    for index, other_statement in enumerate(statement_list):
+        other_text = other_statement.text.lower()
+        other_text_length = len(other_text)
+
+        if not other_text_length:
+            continue
+
+        # The similarity can be no greater than this bound on the lengths
+        upper_bound = 2.0 * min(text_length, other_text_length) / (
+            text_length + other_text_length
+        )
+        if to_percent(upper_bound) <= max_similarity:
+            continue
+
+        if levenshtein_ratio:
+            similarity = to_percent(levenshtein_ratio(text, other_text))
+        else:
+            matcher.set_seq2(other_text)
+
+            if to_percent(matcher.quick_ratio()) <= max_similarity:
+                continue
+
+            similarity = to_percent(matcher.ratio())
+
+        if similarity > max_similarity:
+            max_similarity = similarity
+            closest_index = index
+
+            # No other statement can be a closer match
+            if max_similarity >= 1:
+                break
+
+    return max_similarity, closest_index
+
+
+# Allow logic adapters to compare a statement to a list of statements at once
+levenshtein_distance.batch = levenshtein_distance_batch
+
+# The keys of the extra data that each comparison function reads, so that
+# storage adapters only need to read those keys from the database
+levenshtein_distance.extra_data_keys = ()
+
+
+# The wordnet and tokenizer utilities check that their NLTK data has been
+# downloaded when they are created, so one instance of each is shared
+_utilities = {}
+
+# The greatest path similarity between the synsets of two tokens
+synset_similarity_cache = LRUCache(maxsize=100000)
+
+
+def get_wordnet():
+    """
+    Return the shared instance of the Wordnet utility.
+    """
+    if 'wordnet' not in _utilities:
+        from chatterbot.utils.wordnet import Wordnet
+        _utilities['wordnet'] = Wordnet()
+
+    return _utilities['wordnet']
+
+
+def get_tokenizer():
+    """
+    Return the shared instance of the Tokenizer utility.
+    """
+    if 'tokenizer' not in _utilities:
+        from chatterbot.utils.tokenizer import Tokenizer
+        _utilities['tokenizer'] = Tokenizer()
+
+    return _utilities['tokenizer']
+
+
+def get_synset_tokens(statement):
+    """
+    Return the tokens of a statement's text that are compared by synset_distance.
+    The tokens are cached as a feature of the statement so that they
+    are not calculated again when the statement is saved and reloaded.
+    """
+    tokens = statement.get_feature('synset_tokens')
+
+    if tokens is None:
+        tokens = sorted(get_tokenizer().get_tokens(statement.text))
+        statement.set_feature('synset_tokens', tokens)
+
+    return tokens
+
+
+def get_synset_similarity(token, other_token):
+    """
+    Return the greatest path similarity between the synsets of two tokens.
+    The most recently used results are cached.
+    """
+    import itertools
+
+    key = (token, other_token, )
+    max_similarity = synset_similarity_cache.get(key)
+
+    if max_similarity is not None:
+        return max_similarity
+
+    wordnet = get_wordnet()
+    max_similarity = 0.0
+
+    synset1 = wordnet.synsets(token)
+    synset2 = wordnet.synsets(other_token)
+
+    # Get the highest similarity for each combination of synsets
+    for synset in itertools.product(*[synset1, synset2]):
+        similarity = synset[0].path_similarity(synset[1])
+
+        if similarity and (similarity > max_similarity):
+            max_similarity = similarity
+
+    synset_similarity_cache.set(key, max_similarity)
+
+    return max_similarity
+
+
 def synset_distance(statement, other_statement):
     """
     Calculate the similarity of two statements.
@@ -28,15 +186,10 @@ def synset_distance(statement, other_statement):
     :return: The percent of similarity between the closest synset distance.
     :rtype: float
     """
-    from chatterbot.utils.wordnet import Wordnet
-    from chatterbot.utils.tokenizer import Tokenizer
     import itertools
 
-    wordnet = Wordnet()
-    tokenizer = Tokenizer()
-
-    tokens1 = tokenizer.get_tokens(statement.text)
-    tokens2 = tokenizer.get_tokens(other_statement.text)
+    tokens1 = get_synset_tokens(statement)
+    tokens2 = get_synset_tokens(other_statement)
 
     # The maximum possible similarity is an exact match
     # Because path_similarity returns a value between 0 and 1,
@@ -47,27 +200,24 @@ def synset_distance(statement, other_statement):
         len(other_statement.text.split())
     )
 
+    if max_possible_similarity == 0:
+        return 0
+
     max_similarity = 0.0
 
     # Get the highest matching value for each possible combination of words
     for combination in itertools.product(*[tokens1, tokens2]):
+        similarity = get_synset_similarity(combination[0], combination[1])
 
-        synset1 = wordnet.synsets(combination[0])
-        synset2 = wordnet.synsets(combination[1])
-
-        if synset1 and synset2:
+        if similarity > max_similarity:
+            max_similarity = similarity
 
-            # Get the highest similarity for each combination of synsets
-            for synset in itertools.product(*[synset1, synset2]):
-                similarity = synset[0].path_similarity(synset[1])
-
-                if similarity and (similarity > max_similarity):
-                    max_similarity = similarity
+    return max_similarity / max_possible_similarity
 
-    if max_possible_similarity == 0:
-        return 0
 
-    return max_similarity / max_possible_similarity
+# Allow the tokens of each statement to be saved when it is updated
+synset_distance.annotate = get_synset_tokens
+synset_distance.extra_data_keys = (Statement.features_key, )
 
 
 def sentiment_comparison(statement, other_statement):
@@ -78,19 +228,38 @@ def sentiment_comparison(statement, other_statement):
     :return: The percent of similarity between the sentiment value.
     :rtype: float
     """
-    from textblob import TextBlob
-
-    statement_blob = TextBlob(statement.text)
-    other_statement_blob = TextBlob(other_statement.text)
-
-    statement_sentiment = statement_blob.sentiment.polarity
-    other_statement_sentiment = other_statement_blob.sentiment.polarity
+    statement_sentiment = get_sentiment_polarity(statement)
+    other_statement_sentiment = get_sentiment_polarity(other_statement)
 
     values = [statement_sentiment, other_statement_sentiment]
     difference = max(values) - min(values)
 
     return 1.0 - difference
 
+
+def get_sentiment_polarity(statement):
+    """
+    Return the sentiment polarity of a statement's text that is compared
+    by sentiment_comparison. The polarity is cached as a feature of the
+    statement so that it is not calculated again when the statement is
+    saved and reloaded.
+    """
+    polarity = statement.get_feature('sentiment_polarity')
+
+    if polarity is None:
+        from textblob import TextBlob
+
+        polarity = TextBlob(statement.text).sentiment.polarity
+        statement.set_feature('sentiment_polarity', polarity)
+
+    return polarity
+
+
+# Allow the polarity of each statement to be saved when it is updated
+sentiment_comparison.annotate = get_sentiment_polarity
+sentiment_comparison.extra_data_keys = (Statement.features_key, )
+
+
 def jaccard_similarity(statement, other_statement, threshold=0.5):
     """
     The Jaccard index is composed of a numerator and denominator.
@@ -112,42 +281,64 @@ def jaccard_similarity(statement, other_statement, threshold=0.5):
     Therefore, our Jaccard similarity index is two divided by four, or 50%.
     Given our threshold above, we would consider this to be  a match.
     """
+    lemmae_a = set(get_lemmas(statement))
+    lemmae_b = set(get_lemmas(other_statement))
+
+    union = lemmae_a.union(lemmae_b)
+    ratio = 0
+
+    # Calculate Jaccard similarity
+    if union:
+        ratio = len(lemmae_a.intersection(lemmae_b)) / float(len(union))
+
+    return (ratio >= threshold)
+
+
+def get_lemmas(statement):
+    """
+    Return the lemmas of the nouns in a statement's text that are compared
+    by jaccard_similarity. The lemmas are cached as a feature of the
+    statement so that they are not calculated again when the statement is
+    saved and reloaded.
+    """
+    lemmas = statement.get_feature('lemmas')
+
+    if lemmas is not None:
+        return lemmas
+
     from nltk.corpus import wordnet
     import nltk
     import string
 
-    a = statement.text
-    b = other_statement.text
-
-    # Get default English stopwords and extend with punctuation
-    stopwords = nltk.corpus.stopwords.words('english')
-    stopwords.extend(string.punctuation)
-    stopwords.append('')
-    lemmatizer = nltk.stem.wordnet.WordNetLemmatizer()
-
-    def get_wordnet_pos(pos_tag):
-        if pos_tag[1].startswith('J'):
-            return (pos_tag[0], wordnet.ADJ)
-        elif pos_tag[1].startswith('V'):
-            return (pos_tag[0], wordnet.VERB)
-        elif pos_tag[1].startswith('N'):
-            return (pos_tag[0], wordnet.NOUN)
-        elif pos_tag[1].startswith('R'):
-            return (pos_tag[0], wordnet.ADV)
-        else:
-            return (pos_tag[0], wordnet.NOUN)
+    if 'jaccard_stopwords' not in _utilities:
+        # Get default English stopwords and extend with punctuation
+        stopwords = set(nltk.corpus.stopwords.words('english'))
+        stopwords.update(string.punctuation)
+        stopwords.add('')
 
-    ratio = 0
-    pos_a = map(get_wordnet_pos, nltk.pos_tag(nltk.tokenize.word_tokenize(a)))
-    pos_b = map(get_wordnet_pos, nltk.pos_tag(nltk.tokenize.word_tokenize(b)))
-    lemmae_a = [lemmatizer.lemmatize(token.lower().strip(string.punctuation), pos) for token, pos in pos_a \
-                    if pos == wordnet.NOUN and token.lower().strip(string.punctuation) not in stopwords]
-    lemmae_b = [lemmatizer.lemmatize(token.lower().strip(string.punctuation), pos) for token, pos in pos_b \
-                    if pos == wordnet.NOUN and token.lower().strip(string.punctuation) not in stopwords]
+        _utilities['jaccard_stopwords'] = stopwords
+        _utilities['lemmatizer'] = nltk.stem.wordnet.WordNetLemmatizer()
 
-    # Calculate Jaccard similarity
-    try:
-        ratio = len(set(lemmae_a).intersection(lemmae_b)) / float(len(set(lemmae_a).union(lemmae_b)))
-    except Exception as e:
-        print('Error', e)
-    return (ratio >= threshold)
+    stopwords = _utilities['jaccard_stopwords']
+    lemmatizer = _utilities['lemmatizer']
+
+    lemmas = set()
+
+    for token, pos_tag in nltk.pos_tag(nltk.tokenize.word_tokenize(statement.text)):
+        token = token.lower().strip(string.punctuation)
+
+        # Only the lemmas of nouns are compared
+        if pos_tag.startswith(('J', 'V', 'R', )) or token in stopwords:
+            continue
+
+        lemmas.add(lemmatizer.lemmatize(token, wordnet.NOUN))
+
+    lemmas = sorted(lemmas)
+    statement.set_feature('lemmas', lemmas)
+
+    return lemmas
+
+
+# Allow the lemmas of each statement to be saved when it is updated
+jaccard_similarity.annotate = get_lemmas
+jaccard_similarity.extra_data_keys = (Statement.features_key, )
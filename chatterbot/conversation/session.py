@@ -0,0 +1,104 @@
+from collections import OrderedDict
+from threading import Lock
+from chatterbot.utils.queues import ResponseQueue
+
+
+class Session(object):
+    """
+    A conversation between the chat bot and a single user.
+    The session holds the most recent input statements
+    and the responses that were given to them.
+    """
+
+    def __init__(self, session_id=None, conversation_length=10):
+        import uuid
+
+        self.id = session_id or uuid.uuid4().hex
+
+        # The recent pairs of input statements and responses
+        self.conversation = ResponseQueue(maxsize=conversation_length)
+
+    def get_last_conversance(self):
+        """
+        Return the most recent input statement and response pair.
+        """
+        if not self.conversation.empty():
+            return self.conversation[-1]
+        return None
+
+    def serialize(self):
+        """
+        Return a list of the serialized input statement
+        and response of each pair in the conversation.
+        """
+        return [
+            [statement.serialize(), response.serialize()]
+            for statement, response in self.conversation
+        ]
+
+
+class SessionManager(object):
+    """
+    Keep the session of each conversation in memory. Once the maximum number
+    of sessions is reached, the least recently used session is removed when
+    a new session is created.
+
+    To keep sessions elsewhere, such as in a cache shared by several
+    processes, create a subclass that overrides the get, save and remove
+    methods. The save method is called after each response is added
+    to a session's conversation.
+    """
+
+    def __init__(self, **kwargs):
+        self.max_sessions = kwargs.get('max_sessions', 10000)
+        self.conversation_length = kwargs.get('conversation_length', 10)
+
+        self.sessions = OrderedDict()
+        self.lock = Lock()
+
+    def new(self, session_id=None):
+        """
+        Create and return a new session.
+        """
+        session = Session(session_id, conversation_length=self.conversation_length)
+        self.save(session)
+
+        return session
+
+    def get(self, session_id):
+        """
+        Return the session with the id, creating it if it does not exist.
+        """
+        with self.lock:
+            session = self.sessions.pop(session_id, None)
+
+            if session is not None:
+                self.sessions[session_id] = session
+                return session
+
+        return self.new(session_id)
+
+    def save(self, session):
+        """
+        Save a session, marking it as the most recently used.
+        """
+        with self.lock:
+            self.sessions.pop(session.id, None)
+
+            if len(self.sessions) >= self.max_sessions:
+                self.sessions.popitem(last=False)
+
+            self.sessions[session.id] = session
+
+    def remove(self, session_id):
+        """
+        Remove a session if it exists.
+        """
+        with self.lock:
+            self.sessions.pop(session_id, None)
+
+    def __contains__(self, session_id):
+        return session_id in self.sessions
+
+    def __len__(self):
+        return len(self.sessions)
@@ -8,6 +8,10 @@ class Statement(object):
     phrase that someone can say.
     """
 
+    # The key of the extra data that holds the features of the text that
+    # comparison functions have cached, such as the lemmas of its words
+    features_key = '_features'
+
     def __init__(self, text, **kwargs):
         self.text = text
         self.in_response_to = kwargs.pop('in_response_to', [])
@@ -40,6 +44,33 @@ class Statement(object):
         """
         self.extra_data[key] = value
 
+    def get_feature(self, name):
+        """
+        Return a feature of the statement's text that was
+        cached by a comparison function, or None.
+        """
+        return self.extra_data.get(self.features_key, {}).get(name)
+
+    def set_feature(self, name, value):
+        """
+        Cache a feature of the statement's text. The features are kept
+        under a single key of the extra data, so that they are saved with
+        the statement and can be removed before it is shown to a user.
+        """
+        self.extra_data.setdefault(self.features_key, {})[name] = value
+
+    def remove_features(self):
+        """
+        Remove the cached features from the statement's extra data. The
+        extra data is replaced with a copy, so a dictionary that is shared
+        with the saved statement is not changed.
+        """
+        if self.features_key in self.extra_data:
+            self.extra_data = dict(
+                (key, value) for key, value in self.extra_data.items()
+                if key != self.features_key
+            )
+
     def add_response(self, response):
         """
         Add the response to the list if it does not already exist.
@@ -104,3 +135,60 @@ class Statement(object):
 
         def __str__(self):
             return repr(self.value)
+
+
+class LazyStatement(Statement):
+    """
+    A statement of which only the text and some of the extra data have been
+    read from the database. The rest of the statement is read with the load
+    function the first time its responses are used or it is serialized.
+
+    :param load: A function that returns the complete statement with the
+                 text, or None if the statement no longer exists.
+    """
+
+    def __init__(self, text, load, extra_data=None):
+        self.text = text
+        self.load = load
+        self.loaded = False
+        self._in_response_to = None
+        self.extra_data = extra_data if extra_data is not None else {}
+
+    @property
+    def in_response_to(self):
+        if self._in_response_to is None:
+            self.load_remaining()
+
+        return self._in_response_to
+
+    @in_response_to.setter
+    def in_response_to(self, in_response_to):
+        self._in_response_to = in_response_to
+
+    def load_remaining(self):
+        """
+        Read the responses and the extra data that have not been read.
+        Extra data that was already read, or added since, is kept.
+        """
+        if self.loaded:
+            return
+
+        self.loaded = True
+        statement = self.load(self.text)
+
+        if self._in_response_to is None:
+            self._in_response_to = statement.in_response_to if statement else []
+
+        if statement:
+            for key, value in statement.extra_data.items():
+                kept = self.extra_data.setdefault(key, value)
+
+                # Keep the saved features that were not read or found since
+                if key == self.features_key and kept is not value:
+                    for name, feature in value.items():
+                        kept.setdefault(name, feature)
+
+    def serialize(self):
+        self.load_remaining()
+
+        return super(LazyStatement, self).serialize()
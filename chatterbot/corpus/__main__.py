@@ -0,0 +1,15 @@
+import sys
+
+
+if __name__ == '__main__':
+    from chatterbot.corpus import Corpus
+
+    if len(sys.argv) > 2 and sys.argv[1] == 'compile':
+        corpus = Corpus()
+
+        # Compile each corpus, such as chatterbot.corpus.english
+        for dotted_path in sys.argv[2:]:
+            for compiled_path in corpus.compile_corpus(dotted_path):
+                print(compiled_path)
+    else:
+        print('Usage: python -m chatterbot.corpus compile <corpus> [<corpus> ...]')
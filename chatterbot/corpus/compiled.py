@@ -0,0 +1,215 @@
+"""
+A compact binary format for corpus data that can be read without parsing.
+
+A compiled corpus file contains, in order:
+
+* A header with the format identifier, the format version, the number of
+  strings, the number of conversations and the number of statements.
+* The offset of each string in the string data, followed by the end offset.
+* The index of the first statement of each conversation, followed by the
+  total number of statements.
+* The index in the string table of each statement, for every conversation.
+* The UTF-8 encoded text of each distinct string.
+
+All numbers are stored as little endian unsigned 32 bit integers.
+"""
+from array import array
+import struct
+import sys
+
+
+MAGIC = b'CBCORPUS'
+
+VERSION = 1
+
+HEADER = struct.Struct('<8sIIII')
+
+INTEGER_SIZE = 4
+
+
+def pack_integers(values):
+    """
+    Return a list of integers as little endian unsigned 32 bit integers.
+    """
+    values = array('I', values)
+
+    if values.itemsize != INTEGER_SIZE:
+        return struct.pack('<{}I'.format(len(values)), *values)
+
+    if sys.byteorder == 'big':
+        values.byteswap()
+
+    if hasattr(values, 'tobytes'):
+        return values.tobytes()
+
+    return values.tostring()
+
+
+def compile_conversations(conversations, file_path):
+    """
+    Write a compiled corpus file containing the conversations.
+    Each distinct string is only stored once.
+
+    :returns: The number of conversations written.
+    """
+    string_indexes = {}
+    strings = []
+    conversation_offsets = [0]
+    references = []
+
+    for conversation in conversations:
+        for text in conversation:
+            index = string_indexes.get(text)
+
+            if index is None:
+                index = len(strings)
+                string_indexes[text] = index
+                strings.append(text.encode('utf-8'))
+
+            references.append(index)
+
+        conversation_offsets.append(len(references))
+
+    string_offsets = [0]
+    for data in strings:
+        string_offsets.append(string_offsets[-1] + len(data))
+
+    with open(file_path, 'wb') as compiled_file:
+        compiled_file.write(HEADER.pack(
+            MAGIC, VERSION, len(strings), len(conversation_offsets) - 1, len(references)
+        ))
+        compiled_file.write(pack_integers(string_offsets))
+        compiled_file.write(pack_integers(conversation_offsets))
+        compiled_file.write(pack_integers(references))
+        compiled_file.write(b''.join(strings))
+
+    return len(conversation_offsets) - 1
+
+
+class CompiledCorpus(object):
+    """
+    Read conversations from a compiled corpus file. The file is memory
+    mapped, so only the pages that contain the data being read are
+    loaded, and each string is decoded once the first time it is used.
+    """
+
+    def __init__(self, file_path):
+        import mmap
+
+        self.file_path = file_path
+        self.views = []
+        self.file = open(file_path, 'rb')
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, string_count, conversation_count, reference_count = HEADER.unpack_from(
+            self.data, 0
+        )
+
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise self.InvalidCorpusFileException(
+                '{} is not a compiled corpus file.'.format(file_path)
+            )
+
+        self.string_count = string_count
+        self.conversation_count = conversation_count
+
+        self.string_offsets_start = HEADER.size
+        self.conversation_offsets_start = (
+            self.string_offsets_start + (string_count + 1) * INTEGER_SIZE
+        )
+        self.references_start = (
+            self.conversation_offsets_start + (conversation_count + 1) * INTEGER_SIZE
+        )
+        self.strings_start = self.references_start + reference_count * INTEGER_SIZE
+
+        self.strings = [None] * string_count
+
+        self.string_offsets = self.read_integers(self.string_offsets_start, string_count + 1)
+        self.conversation_offsets = self.read_integers(
+            self.conversation_offsets_start, conversation_count + 1
+        )
+        self.references = self.read_integers(self.references_start, reference_count)
+
+    def read_integers(self, start, count):
+        """
+        Return a sequence of the integers stored in the file from the start
+        offset. Where possible this is a view of the memory mapped file,
+        so the integers are not copied.
+        """
+        end = start + count * INTEGER_SIZE
+
+        if sys.byteorder == 'little' and hasattr(memoryview, 'cast'):
+            view = memoryview(self.data)[start:end].cast('I')
+
+            if view.itemsize == INTEGER_SIZE:
+                self.views.append(view)
+                return view
+
+            view.release()
+
+        return struct.unpack_from('<{}I'.format(count), self.data, start)
+
+    def get_string(self, index):
+        """
+        Return the string with the index in the string table.
+        """
+        text = self.strings[index]
+
+        if text is None:
+            start = self.strings_start + self.string_offsets[index]
+            end = self.strings_start + self.string_offsets[index + 1]
+            text = self.data[start:end].decode('utf-8')
+            self.strings[index] = text
+
+        return text
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.conversation_count
+
+        if not 0 <= index < self.conversation_count:
+            raise IndexError('Conversation index out of range.')
+
+        start = self.conversation_offsets[index]
+        end = self.conversation_offsets[index + 1]
+
+        return [self.get_string(reference) for reference in self.references[start:end]]
+
+    def __iter__(self):
+        strings = self.strings
+        get_string = self.get_string
+        offsets = self.conversation_offsets
+        references = self.references
+
+        for index in range(0, self.conversation_count):
+            yield [
+                strings[reference] or get_string(reference)
+                for reference in references[offsets[index]:offsets[index + 1]]
+            ]
+
+    def __len__(self):
+        return self.conversation_count
+
+    def close(self):
+        # Views of the file must be released before it can be closed
+        for view in self.views:
+            view.release()
+
+        self.views = []
+        self.data.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    class InvalidCorpusFileException(Exception):
+
+        def __init__(self, value='The file is not a compiled corpus file.'):
+            self.value = value
+
+        def __str__(self):
+            return repr(self.value)
@@ -1,6 +1,102 @@
 import os
 
 
+# The file extensions of corpus data files that can be read
+CORPUS_EXTENSIONS = (
+    'corpus.json',
+    'corpus.json.gz',
+    'corpus.jsonl',
+    'corpus.jsonl.gz',
+    'corpus.bin',
+)
+
+# The file extension of compiled corpus files
+COMPILED_EXTENSION = '.corpus.bin'
+
+
+def read_json_conversations(data_file, chunk_size=65536):
+    """
+    Yield each conversation in a corpus json file without reading the whole
+    file into memory. A corpus json file contains an object that maps the
+    name of each category to a list of conversations.
+    """
+    import json
+
+    decoder = json.JSONDecoder()
+    buffer = u''
+    position = 0
+    depth = 0
+    end_of_file = False
+
+    while True:
+        # Skip white space and the separators between values
+        while position < len(buffer) and buffer[position] in u' \t\r\n,:':
+            position += 1
+
+        if position >= len(buffer):
+            if end_of_file:
+                break
+
+            chunk = data_file.read(chunk_size)
+            end_of_file = not chunk
+            buffer = buffer[position:] + chunk
+            position = 0
+            continue
+
+        character = buffer[position]
+
+        if depth == 0 and character == u'{':
+            depth = 1
+            position += 1
+
+        elif depth == 1 and character == u'}':
+            depth = 0
+            position += 1
+
+        elif depth == 1 and character == u'[':
+            depth = 2
+            position += 1
+
+        elif depth == 2 and character == u']':
+            depth = 1
+            position += 1
+
+        elif (depth == 1 and character == u'"') or depth == 2:
+            try:
+                value, position = decoder.raw_decode(buffer, position)
+            except ValueError:
+                # The value may continue in the part of the file not yet read
+                if end_of_file:
+                    raise
+
+                chunk = data_file.read(chunk_size)
+                end_of_file = not chunk
+                buffer = buffer[position:] + chunk
+                position = 0
+                continue
+
+            # Values in the top level object are the names of categories
+            if depth == 2:
+                yield value
+
+        else:
+            raise ValueError(
+                u'Unexpected character "{}" in corpus data.'.format(character)
+            )
+
+
+def read_jsonl_conversations(data_file):
+    """
+    Yield each conversation in a corpus file that contains one
+    conversation per line, in the form of a json list of statements.
+    """
+    import json
+
+    for line in data_file:
+        if line.strip():
+            yield json.loads(line)
+
+
 class Corpus(object):
 
     def __init__(self):
@@ -11,6 +107,10 @@ class Corpus(object):
         """
         Reads a dotted file path and returns the file path.
         """
+        # Paths to existing files and directories are used as they are
+        if os.path.exists(dotted_path):
+            return dotted_path
+
         parts = dotted_path.split('.')
         if parts[0] == 'chatterbot':
             parts.pop(0)
@@ -23,17 +123,51 @@ class Corpus(object):
 
         return corpus_path
 
+    def open_corpus_file(self, file_name):
+        """
+        Open a corpus data file for reading as text,
+        decompressing it if it is compressed with gzip.
+        """
+        import io
+
+        if file_name.endswith('.gz'):
+            import gzip
+            return io.TextIOWrapper(gzip.open(file_name, 'rb'), encoding='utf-8')
+
+        return io.open(file_name, encoding='utf-8')
+
     def read_corpus(self, file_name):
         """
         Read and return the data from a corpus json file.
         """
         import json
-        import io
 
-        with io.open(file_name, encoding='utf-8') as data_file:
+        with self.open_corpus_file(file_name) as data_file:
             data = json.load(data_file)
         return data
 
+    def read_conversations(self, file_name):
+        """
+        Yield each conversation in a corpus file, reading
+        only as much of the file as is needed at a time.
+        """
+        if file_name.endswith(COMPILED_EXTENSION):
+            from .compiled import CompiledCorpus
+
+            with CompiledCorpus(file_name) as compiled_corpus:
+                for conversation in compiled_corpus:
+                    yield conversation
+            return
+
+        with self.open_corpus_file(file_name) as data_file:
+            if file_name.endswith(('.jsonl', '.jsonl.gz', )):
+                conversations = read_jsonl_conversations(data_file)
+            else:
+                conversations = read_json_conversations(data_file)
+
+            for conversation in conversations:
+                yield conversation
+
     def list_corpus_files(self, dotted_path):
         """
         Return a list of file paths to each data file in
@@ -42,17 +176,86 @@ class Corpus(object):
         corpus_path = self.get_file_path(dotted_path, extension='corpus.json')
         paths = []
 
+        if not os.path.exists(corpus_path):
+            for extension in CORPUS_EXTENSIONS:
+                if os.path.exists(corpus_path + '.{}'.format(extension)):
+                    corpus_path += '.{}'.format(extension)
+                    break
+
         if os.path.isdir(corpus_path):
             for dirname, dirnames, filenames in os.walk(corpus_path):
                 for datafile in filenames:
-                    if datafile.endswith('corpus.json'):
+                    if datafile.endswith(CORPUS_EXTENSIONS):
                         paths.append(os.path.join(dirname, datafile))
         else:
             paths.append(corpus_path)
 
+        paths = self.select_compiled_files(paths)
+
         paths.sort()
         return paths
 
+    def get_compiled_path(self, file_path):
+        """
+        Return the path that a corpus file is compiled to.
+        """
+        for extension in CORPUS_EXTENSIONS:
+            if file_path.endswith('.' + extension):
+                return file_path[:-len(extension) - 1] + COMPILED_EXTENSION
+
+        return file_path + COMPILED_EXTENSION
+
+    def select_compiled_files(self, paths):
+        """
+        Replace each corpus file that has been compiled since it was last
+        changed with its compiled file. Compiled files that are out of date
+        are not used.
+        """
+        selected = []
+        compiled_sources = set()
+
+        for path in paths:
+            if path.endswith(COMPILED_EXTENSION):
+                continue
+
+            compiled_path = self.get_compiled_path(path)
+            compiled_sources.add(compiled_path)
+
+            if os.path.exists(compiled_path) and (
+                    os.path.getmtime(compiled_path) >= os.path.getmtime(path)):
+                selected.append(compiled_path)
+            else:
+                selected.append(path)
+
+        # Compiled files can also be used without the file they were compiled from
+        for path in paths:
+            if path.endswith(COMPILED_EXTENSION) and path not in compiled_sources:
+                selected.append(path)
+
+        return selected
+
+    def compile_corpus(self, dotted_path):
+        """
+        Compile each file in the specified corpus to the binary corpus format.
+        The compiled files are written next to the files they are compiled
+        from, and are used in their place until the original files change.
+
+        :returns: A list of the paths of the compiled files.
+        """
+        from .compiled import compile_conversations
+
+        compiled_paths = []
+
+        for file_path in self.list_corpus_files(dotted_path):
+            if file_path.endswith(COMPILED_EXTENSION):
+                continue
+
+            compiled_path = self.get_compiled_path(file_path)
+            compile_conversations(self.read_conversations(file_path), compiled_path)
+            compiled_paths.append(compiled_path)
+
+        return compiled_paths
+
     def load_corpus(self, dotted_path):
         """
         Return the data contained within a specified corpus.
@@ -62,9 +265,21 @@ class Corpus(object):
         corpora = []
 
         for file_path in data_file_paths:
-            corpus = self.read_corpus(file_path)
+            if file_path.endswith(('.jsonl', '.jsonl.gz', COMPILED_EXTENSION, )):
+                corpora.append(list(self.read_conversations(file_path)))
+            else:
+                corpus = self.read_corpus(file_path)
 
-            for key in list(corpus.keys()):
-                corpora.append(corpus[key])
+                for key in list(corpus.keys()):
+                    corpora.append(corpus[key])
 
         return corpora
+
+    def iter_conversations(self, dotted_path):
+        """
+        Yield each conversation in the specified corpus,
+        one at a time, in the order of the corpus files.
+        """
+        for file_path in self.list_corpus_files(dotted_path):
+            for conversation in self.read_conversations(file_path):
+                yield conversation
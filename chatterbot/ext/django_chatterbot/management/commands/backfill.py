@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = 'Saves data used to compare statements for statements already in the database'
+    can_import_settings = True
+
+    def handle(self, *args, **options):
+        from chatterbot import ChatBot
+        from chatterbot.ext.django_chatterbot import settings
+
+        chatterbot = ChatBot(**settings.CHATTERBOT)
+
+        chatterbot.storage.backfill()
+
+        # Django 1.8 does not define SUCCESS
+        if hasattr(self.style, 'SUCCESS'):
+            style = self.style.SUCCESS
+        else:
+            style = self.style.NOTICE
+
+        self.stdout.write(style('Saved data for %d statements' % chatterbot.storage.count()))
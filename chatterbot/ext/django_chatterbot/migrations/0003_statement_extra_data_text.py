@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_chatterbot', '0002_statement_extra_data'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='statement',
+            name='extra_data',
+            field=models.TextField(default='{}'),
+        ),
+    ]
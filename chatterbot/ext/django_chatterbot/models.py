@@ -13,7 +13,7 @@ class Statement(models.Model):
         max_length=255
     )
 
-    extra_data = models.CharField(max_length=500)
+    extra_data = models.TextField(default='{}')
 
     def __str__(self):
         if len(self.text.strip()) > 60:
@@ -9,6 +9,27 @@ class ChatterBotViewMixin(object):
 
     chatterbot = ChatBot(**settings.CHATTERBOT)
 
+    def get_session_id(self, request):
+        """
+        Return the id of the chat bot session for the user making the
+        request, so that the conversation of each user is kept separate.
+        The id is kept in the user's Django session. If Django's session
+        middleware is not used, every user shares the chat bot's
+        default session.
+        """
+        session = getattr(request, 'session', None)
+
+        if session is None:
+            return None
+
+        session_id = session.get('chatterbot_session_id')
+
+        if session_id is None:
+            session_id = self.chatterbot.conversation_sessions.new().id
+            session['chatterbot_session_id'] = session_id
+
+        return session_id
+
     def validate(self, data):
         from django.core.exceptions import ValidationError
 
@@ -18,16 +39,8 @@ class ChatterBotViewMixin(object):
 
 class ChatterBotView(ChatterBotViewMixin, View):
 
-    def _serialize_recent_statements(self):
-        if self.chatterbot.recent_statements.empty():
-            return []
-
-        recent_statements = []
-
-        for statement, response in self.chatterbot.recent_statements:
-            recent_statements.append([statement.serialize(), response.serialize()])
-
-        return recent_statements
+    def _serialize_recent_statements(self, session_id=None):
+        return self.chatterbot.get_session(session_id).serialize()
 
     def post(self, request, *args, **kwargs):
 
@@ -38,7 +51,9 @@ class ChatterBotView(ChatterBotViewMixin, View):
 
         self.validate(input_data)
 
-        response_data = self.chatterbot.get_response(input_data)
+        response_data = self.chatterbot.get_response(
+            input_data, session_id=self.get_session_id(request)
+        )
 
         return JsonResponse(response_data, status=200)
 
@@ -46,7 +61,9 @@ class ChatterBotView(ChatterBotViewMixin, View):
         data = {
             'detail': 'You should make a POST request to this endpoint.',
             'name': self.chatterbot.name,
-            'recent_statements': self._serialize_recent_statements()
+            'recent_statements': self._serialize_recent_statements(
+                self.get_session_id(request)
+            )
         }
 
         # Return a method not allowed response
@@ -1,13 +1,38 @@
 # Filters set the base query that gets passed to the storage adapter
 
 
+def accepts_session_id(filter_instance):
+    """
+    Return True if the filter_selection method of a filter can be given
+    a session id. Filters written before sessions were added to the chat
+    bot only accept the chat bot.
+    """
+    try:
+        from inspect import signature
+    except ImportError:
+        # Python 2, where the arguments of a method include self
+        from inspect import getargspec
+        spec = getargspec(filter_instance.filter_selection)
+        return spec.varargs is not None or len(spec.args) > 2
+
+    positional_kinds = ('POSITIONAL_ONLY', 'POSITIONAL_OR_KEYWORD', )
+    parameters = signature(filter_instance.filter_selection).parameters.values()
+
+    if any(parameter.kind.name == 'VAR_POSITIONAL' for parameter in parameters):
+        return True
+
+    return len([
+        parameter for parameter in parameters if parameter.kind.name in positional_kinds
+    ]) > 1
+
+
 class Filter(object):
     """
     A base filter object from which all other
     filters should be subclassed.
     """
 
-    def filter_selection(self, chatterbot):
+    def filter_selection(self, chatterbot, session_id=None):
         return chatterbot.storage.base_query
 
 
@@ -18,14 +43,16 @@ class RepetitiveResponseFilter(Filter):
     statements that it has recently said.
     """
 
-    def filter_selection(self, chatterbot):
+    def filter_selection(self, chatterbot, session_id=None):
+
+        conversation = chatterbot.get_session(session_id).conversation
 
-        if chatterbot.recent_statements.empty():
+        if conversation.empty():
             return chatterbot.storage.base_query
 
         text_of_recent_responses = []
 
-        for statement, response in chatterbot.recent_statements:
+        for statement, response in conversation:
             text_of_recent_responses.append(response.text)
 
         query = chatterbot.storage.base_query.statement_text_not_in(
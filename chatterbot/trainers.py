@@ -1,13 +1,113 @@
 from .conversation import Statement, Response
+from .utils.progress import print_progress_bar
+from collections import OrderedDict
 import logging
 
 
+class TrainingBatch(object):
+    """
+    Collects the statements learned during training so that they can be
+    saved to the database together. When the same response is added to a
+    statement more than once, the occurrence of the response is increased.
+    """
+
+    def __init__(self):
+        # The occurrence of each response, by the text of each statement.
+        # Statements are only created when the batch is saved, which keeps
+        # batches small and fast to return from worker processes.
+        self.responses = OrderedDict()
+
+    def add(self, text, response_text=None):
+        """
+        Add a statement to the batch, with the text of the
+        statement that it is in response to if there is one.
+        """
+        responses = self.responses.get(text)
+
+        if responses is None:
+            responses = OrderedDict()
+            self.responses[text] = responses
+
+        if response_text is not None:
+            responses[response_text] = responses.get(response_text, 0) + 1
+
+    def add_conversation(self, conversation):
+        """
+        Add each statement in a conversation, in response to the one before it.
+        """
+        previous_text = None
+
+        for text in conversation:
+            self.add(text, previous_text)
+            previous_text = text
+
+    def get_statements(self):
+        """
+        Return a list of the statements in the batch.
+        """
+        statements = []
+
+        for text, responses in self.responses.items():
+            statement = Statement(text)
+            statement.in_response_to = [
+                Response(response_text, occurrence=occurrence)
+                for response_text, occurrence in responses.items()
+            ]
+            statements.append(statement)
+
+        return statements
+
+    def save(self, storage):
+        """
+        Save the statements in the batch to the database and empty the batch.
+        """
+        if self.responses:
+            storage.bulk_update(self.get_statements(), force=True)
+            self.responses = OrderedDict()
+
+    def __len__(self):
+        return len(self.responses)
+
+
+def build_training_batches(file_path, batch_size):
+    """
+    Return a list of batches containing the statements of each
+    conversation in a corpus file. A new batch is started once a
+    batch holds the given number of statements. This is called
+    in each worker process when training in parallel.
+    """
+    from .corpus import Corpus
+
+    batches = []
+    batch = TrainingBatch()
+
+    for conversation in Corpus().read_conversations(file_path):
+        batch.add_conversation(conversation)
+
+        if len(batch) >= batch_size:
+            batches.append(batch)
+            batch = TrainingBatch()
+
+    if len(batch):
+        batches.append(batch)
+
+    return batches
+
+
 class Trainer(object):
 
     def __init__(self, storage, **kwargs):
         self.storage = storage
         self.logger = logging.getLogger(__name__)
 
+        self.show_training_progress = kwargs.get('show_training_progress', False)
+
+        # The number of statements collected before they are saved
+        self.training_batch_size = kwargs.get('training_batch_size', 5000)
+
+        # The number of processes used to collect statements from a corpus
+        self.training_processes = kwargs.get('training_processes', 1)
+
     def train(self, *args, **kwargs):
         raise self.TrainerInitializationException()
 
@@ -45,31 +145,22 @@ class Trainer(object):
 
 class ListTrainer(Trainer):
 
-    def get_or_create(self, statement_text):
+    def train(self, conversation):
         """
-        Return a statement if it exists.
-        Create and return the statement if it does not exist.
+        Train the chat bot based on the provided list of
+        statements that represents a single conversation.
         """
-        statement = self.storage.find(statement_text)
-
-        if not statement:
-            statement = Statement(statement_text)
-
-        return statement
-
-    def train(self, conversation):
-        statement_history = []
+        batch = TrainingBatch()
+        previous_text = None
 
-        for text in conversation:
-            statement = self.get_or_create(text)
+        for index, text in enumerate(conversation):
+            batch.add(text, previous_text)
+            previous_text = text
 
-            if statement_history:
-                statement.add_response(
-                    Response(statement_history[-1].text)
-                )
+            if self.show_training_progress:
+                print_progress_bar('List Trainer', index + 1, len(conversation))
 
-            statement_history.append(statement)
-            self.storage.update(statement, force=True)
+        batch.save(self.storage)
 
 
 class ChatterBotCorpusTrainer(Trainer):
@@ -81,18 +172,69 @@ class ChatterBotCorpusTrainer(Trainer):
         self.corpus = Corpus()
 
     def train(self, *corpora):
-        trainer = ListTrainer(self.storage)
+        batch = TrainingBatch()
 
         # Allow a list of coupora to be passed instead of arguments
         if len(corpora) == 1:
             if isinstance(corpora[0], list):
                 corpora = corpora[0]
 
+        if self.training_processes > 1:
+            return self.train_in_parallel(corpora)
+
+        for corpus in corpora:
+            file_paths = self.corpus.list_corpus_files(corpus)
+
+            for index, file_path in enumerate(file_paths):
+
+                # Conversations are read from the file as they are needed
+                for conversation in self.corpus.read_conversations(file_path):
+                    batch.add_conversation(conversation)
+
+                    if len(batch) >= self.training_batch_size:
+                        batch.save(self.storage)
+
+                if self.show_training_progress:
+                    print_progress_bar(str(corpus), index + 1, len(file_paths))
+
+        batch.save(self.storage)
+
+    def train_in_parallel(self, corpora):
+        """
+        Read each corpus file in a separate process. The statements of each
+        file are returned in batches of about the training batch size, and
+        the batches are saved in the order of the files, so the result
+        does not depend on the number of processes used.
+        """
+        from multiprocessing import Pool
+        from collections import deque
+
+        file_paths = []
         for corpus in corpora:
-            corpus_data = self.corpus.load_corpus(corpus)
-            for data in corpus_data:
-                for pair in data:
-                    trainer.train(pair)
+            file_paths.extend(self.corpus.list_corpus_files(corpus))
+
+        # Only a few files are read ahead of the ones being saved,
+        # so that the results waiting to be saved stay small
+        window = self.training_processes * 2
+        pending = deque()
+        pool = Pool(self.training_processes)
+
+        try:
+            for index in range(len(file_paths)):
+                while len(pending) < window and index + len(pending) < len(file_paths):
+                    pending.append(pool.apply_async(
+                        build_training_batches,
+                        (file_paths[index + len(pending)], self.training_batch_size, )
+                    ))
+
+                for batch in pending.popleft().get():
+                    batch.save(self.storage)
+
+                if self.show_training_progress:
+                    print_progress_bar('Corpus Trainer', index + 1, len(file_paths))
+        finally:
+            pool.close()
+            pool.join()
 
 
 class TwitterTrainer(Trainer):
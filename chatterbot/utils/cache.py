@@ -0,0 +1,244 @@
+from collections import OrderedDict
+from threading import Lock
+
+
+class LRUCache(object):
+    """
+    A dictionary-like cache that holds a limited number of items.
+    Once the maximum is reached, the least recently used item
+    is removed when a new item is added.
+    """
+
+    def __init__(self, maxsize=1000):
+        self.maxsize = maxsize
+        self.items = OrderedDict()
+        self.lock = Lock()
+
+    def get(self, key, default=None):
+        """
+        Return the value for the key if it is in the cache,
+        and mark the key as the most recently used.
+        """
+        with self.lock:
+            if key not in self.items:
+                return default
+
+            value = self.items.pop(key)
+            self.items[key] = value
+
+            return value
+
+    def set(self, key, value):
+        """
+        Add a value to the cache, removing the least
+        recently used item if the cache is full.
+        """
+        with self.lock:
+            self.items.pop(key, None)
+
+            if len(self.items) >= self.maxsize:
+                self.items.popitem(last=False)
+
+            self.items[key] = value
+
+    def remove(self, key):
+        """
+        Remove a key from the cache if it exists.
+        """
+        with self.lock:
+            self.items.pop(key, None)
+
+    def clear(self):
+        """
+        Remove all items from the cache.
+        """
+        with self.lock:
+            self.items.clear()
+
+    def __contains__(self, key):
+        return key in self.items
+
+    def __len__(self):
+        return len(self.items)
+
+
+def normalize_text(text):
+    """
+    Return the text in lower case, with consecutive white space
+    replaced by a single space.
+    """
+    return u' '.join(text.lower().split())
+
+
+class ResponseCache(object):
+    """
+    A cache of the responses given to input statements. Inputs that only
+    differ by case or white space share a single entry.
+
+    Entries are removed when the cache is full, least recently used first,
+    once they are older than the timeout, and when a statement that the
+    entry was created from is changed in or removed from the database,
+    or a statement is saved as a new response to one of them.
+    """
+
+    def __init__(self, maxsize=1000, timeout=None):
+        self.maxsize = maxsize
+
+        # The number of seconds that an entry can be used for
+        self.timeout = timeout
+
+        # The expiry time, input text, response text, matched texts
+        # and value of each key
+        self.items = OrderedDict()
+
+        # The keys of the entries created for each input, response and
+        # matched text
+        self.keys_by_input = {}
+        self.keys_by_response = {}
+        self.keys_by_match = {}
+
+        self.lock = Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get_key(self, text, base_query_key=None):
+        """
+        Return the key of the entry for an input text. Responses selected
+        with a different base query are kept in a separate entry.
+        """
+        return (normalize_text(text), base_query_key, )
+
+    def get(self, key, default=None):
+        """
+        Return the value for the key if it is in the cache and has
+        not expired, and mark the key as the most recently used.
+        """
+        from time import time
+
+        with self.lock:
+            item = self.items.get(key)
+
+            if item is None:
+                self.misses += 1
+                return default
+
+            if item[0] is not None and item[0] < time():
+                self._remove(key)
+                self.misses += 1
+                return default
+
+            del self.items[key]
+            self.items[key] = item
+            self.hits += 1
+
+            return item[4]
+
+    def set(self, key, value, response_text, match_texts=()):
+        """
+        Add a value to the cache, removing the least
+        recently used entry if the cache is full.
+
+        :param response_text: The text of the response that the value holds.
+
+        :param match_texts: The texts of the known statements that the
+            response was selected for, such as the closest match to the input.
+        """
+        from time import time
+
+        expires = None
+        if self.timeout is not None:
+            expires = time() + self.timeout
+
+        input_text = key[0]
+        response_text = normalize_text(response_text)
+        match_texts = frozenset(normalize_text(text) for text in match_texts)
+
+        with self.lock:
+            self._remove(key)
+
+            if len(self.items) >= self.maxsize:
+                self._remove(next(iter(self.items)))
+
+            self.items[key] = (expires, input_text, response_text, match_texts, value, )
+            self.keys_by_input.setdefault(input_text, set()).add(key)
+            self.keys_by_response.setdefault(response_text, set()).add(key)
+
+            for match_text in match_texts:
+                self.keys_by_match.setdefault(match_text, set()).add(key)
+
+    def _remove(self, key):
+        item = self.items.pop(key, None)
+
+        if item is None:
+            return
+
+        indexed = [(self.keys_by_input, item[1]), (self.keys_by_response, item[2])]
+        indexed.extend((self.keys_by_match, text) for text in item[3])
+
+        for keys, text in indexed:
+            keys[text].discard(key)
+            if not keys[text]:
+                del keys[text]
+
+    def remove_input(self, text):
+        """
+        Remove each entry created for the input text.
+        """
+        with self.lock:
+            for key in list(self.keys_by_input.get(normalize_text(text), ())):
+                self._remove(key)
+
+    def remove_response(self, text):
+        """
+        Remove each entry that holds a response with the text.
+        """
+        with self.lock:
+            for key in list(self.keys_by_response.get(normalize_text(text), ())):
+                self._remove(key)
+
+    def remove_match(self, text):
+        """
+        Remove each entry whose response was selected for a statement
+        with the text.
+        """
+        with self.lock:
+            for key in list(self.keys_by_match.get(normalize_text(text), ())):
+                self._remove(key)
+
+    def statement_updated(self, statement):
+        """
+        Remove the entries that may be out of date after a statement is saved.
+        The saved statement may now be a response to each statement in its
+        in_response_to list, which changes the responses to inputs matched to
+        those statements, and entries holding the statement are replaced so
+        that they hold the saved version.
+        """
+        self.remove_response(statement.text)
+
+        for response in statement.in_response_to:
+            self.remove_input(response.text)
+            self.remove_match(response.text)
+
+    def statement_removed(self, statement_text):
+        """
+        Remove the entries that were created from a removed statement.
+        """
+        self.remove_input(statement_text)
+        self.remove_response(statement_text)
+
+    def clear(self):
+        """
+        Remove all entries from the cache.
+        """
+        with self.lock:
+            self.items.clear()
+            self.keys_by_input.clear()
+            self.keys_by_response.clear()
+            self.keys_by_match.clear()
+
+    def __contains__(self, key):
+        return key in self.items
+
+    def __len__(self):
+        return len(self.items)
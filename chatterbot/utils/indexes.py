@@ -0,0 +1,336 @@
+"""
+Indexes that storage adapters can maintain to quickly select a small set
+of candidate statements that are likely to be a close match to an input.
+"""
+from chatterbot.conversation.statement import Statement
+import heapq
+import threading
+
+
+class StatementIndex(object):
+    """
+    An inverted index that maps each feature of a statement's text
+    to the text of every indexed statement that contains it.
+    Statements can be added and searched for from several threads at once.
+    """
+
+    # The keys of the extra data that are read from statements being indexed
+    extra_data_keys = ()
+
+    def __init__(self):
+        self.postings = {}
+        self.documents = {}
+
+        self.lock = threading.RLock()
+
+        # Set to True once the index has been filled with existing statements
+        self.populated = False
+
+    def get_features(self, text):
+        """
+        Return the set of features that will be indexed for the text.
+        This method must be overridden in a subclass.
+        """
+        raise NotImplementedError(
+            'This method must be overridden in a subclass method.'
+        )
+
+    def get_statement_features(self, statement):
+        """
+        Return the set of features that will be indexed for a statement.
+        A subclass may override this method to use the data that was
+        saved in the statement's extra data.
+        """
+        return self.get_features(statement.text)
+
+    def insert(self, text, features):
+        """
+        Add the text of a statement with known features to the index.
+        """
+        with self.lock:
+            if text in self.documents:
+                return
+
+            self.documents[text] = features
+
+            for feature in features:
+                self.postings.setdefault(feature, set()).add(text)
+
+    def add(self, text):
+        """
+        Add the text of a statement to the index.
+        """
+        if text not in self.documents:
+            self.insert(text, self.get_features(text))
+
+    def remove(self, text):
+        """
+        Remove the text of a statement from the index.
+        """
+        with self.lock:
+            features = self.documents.pop(text, set())
+
+            for feature in features:
+                texts = self.postings.get(feature)
+                if texts is not None:
+                    texts.discard(text)
+                    if not texts:
+                        del self.postings[feature]
+
+    def populate(self, statements):
+        """
+        Add each statement in a collection of statements to the index.
+        """
+        for statement in statements:
+            if statement.text not in self.documents:
+                self.insert(statement.text, self.get_statement_features(statement))
+
+        self.populated = True
+
+    def refresh(self, statements):
+        """
+        Make the index hold exactly the statements in a collection of
+        statements, adding the statements that are not indexed yet and
+        removing the indexed statements that are not in the collection.
+        """
+        texts = set()
+        new_statements = []
+
+        for statement in statements:
+            texts.add(statement.text)
+
+            if statement.text not in self.documents:
+                new_statements.append(statement)
+
+        with self.lock:
+            removed = [text for text in self.documents if text not in texts]
+
+        for text in removed:
+            self.remove(text)
+
+        self.populate(new_statements)
+
+    def clear(self):
+        """
+        Remove all entries from the index.
+        """
+        with self.lock:
+            self.postings = {}
+            self.documents = {}
+            self.populated = False
+
+    def search(self, text, limit=100):
+        """
+        Return the text of up to `limit` indexed statements, ordered by
+        the Jaccard similarity of their features to those of the text.
+        """
+        features = self.get_features(text)
+        overlap = {}
+
+        with self.lock:
+            for feature in features:
+                for match in self.postings.get(feature, ()):
+                    overlap[match] = overlap.get(match, 0) + 1
+
+            sizes = dict((match, len(self.documents[match])) for match in overlap)
+
+        def score(item):
+            match, shared = item
+            total = len(features) + sizes[match] - shared
+            return (float(shared) / total, match)
+
+        best = heapq.nlargest(limit, overlap.items(), key=score)
+
+        return [match for match, shared in best]
+
+    def __contains__(self, text):
+        return text in self.documents
+
+    def __len__(self):
+        return len(self.documents)
+
+
+class NgramIndex(StatementIndex):
+    """
+    Indexes statements by the character n-grams and the
+    word tokens contained in the lowercase form of their text.
+    """
+
+    def __init__(self, ngram_size=3):
+        super(NgramIndex, self).__init__()
+        self.ngram_size = ngram_size
+
+    def get_features(self, text):
+        text = text.lower()
+
+        # Word tokens are stored as tuples so they never collide with n-grams
+        features = set((token, ) for token in text.split())
+
+        padded = u' {} '.format(text)
+        for start in range(0, len(padded) - self.ngram_size + 1):
+            features.add(padded[start:start + self.ngram_size])
+
+        return features
+
+
+class MinHashIndex(StatementIndex):
+    """
+    Indexes statements by locality sensitive hashing of the MinHash
+    signatures of the lemma sets compared by jaccard_similarity.
+    Statements with a high Jaccard similarity to an input are likely
+    to share at least one band of their signatures with it.
+    """
+
+    extra_data_keys = (Statement.features_key, )
+
+    # A Mersenne prime larger than any 32 bit hash value
+    prime = (1 << 61) - 1
+
+    def __init__(self, bands=16, rows=2, seed=1):
+        from random import Random
+
+        super(MinHashIndex, self).__init__()
+        self.bands = bands
+        self.rows = rows
+
+        # Seeded so that signatures are the same in every process
+        random = Random(seed)
+        self.permutations = [
+            (random.randint(1, self.prime - 1), random.randint(0, self.prime - 1), )
+            for _ in range(0, bands * rows)
+        ]
+
+    def get_signature(self, lemmas):
+        """
+        Return the MinHash signature of a set of lemmas.
+        """
+        import zlib
+
+        hashes = [zlib.crc32(lemma.encode('utf-8')) & 0xffffffff for lemma in lemmas]
+
+        return [
+            min((a * value + b) % self.prime for value in hashes)
+            for a, b in self.permutations
+        ]
+
+    def get_features(self, text):
+        return self.get_statement_features(Statement(text))
+
+    def get_statement_features(self, statement):
+        """
+        Return the bands of the signature of the statement's lemmas. The
+        lemmas saved with the statement are used if it has them, so that
+        they are not found again for each statement in the database.
+        """
+        from chatterbot.conversation.comparisons import get_lemmas
+
+        lemmas = get_lemmas(statement)
+
+        if not lemmas:
+            return set()
+
+        signature = self.get_signature(lemmas)
+
+        return set(
+            (band, tuple(signature[band * self.rows:(band + 1) * self.rows]), )
+            for band in range(0, self.bands)
+        )
+
+
+class PolarityIndex(StatementIndex):
+    """
+    Keeps statements sorted by the sentiment polarity compared by
+    sentiment_comparison, so that the statements with the closest
+    polarity to an input can be found with a binary search.
+    """
+
+    extra_data_keys = (Statement.features_key, )
+
+    def __init__(self):
+        super(PolarityIndex, self).__init__()
+
+        # A sorted list of (polarity, text) pairs
+        self.entries = []
+
+    def get_polarity(self, statement):
+        from chatterbot.conversation.comparisons import get_sentiment_polarity
+
+        return get_sentiment_polarity(statement)
+
+    def insert(self, text, polarity):
+        """
+        Add the text of a statement with a known polarity to the index.
+        """
+        import bisect
+
+        with self.lock:
+            if text in self.documents:
+                return
+
+            self.documents[text] = polarity
+            bisect.insort(self.entries, (polarity, text, ))
+
+    def add(self, text):
+        """
+        Add the text of a statement to the index.
+        """
+        if text not in self.documents:
+            self.insert(text, self.get_polarity(Statement(text)))
+
+    def remove(self, text):
+        import bisect
+
+        with self.lock:
+            if text not in self.documents:
+                return
+
+            entry = (self.documents.pop(text), text, )
+            del self.entries[bisect.bisect_left(self.entries, entry)]
+
+    def populate(self, statements):
+        """
+        Add each statement to the index, using the
+        polarity saved with the statement if it has one.
+        """
+        for statement in statements:
+            self.insert(statement.text, self.get_polarity(statement))
+
+        self.populated = True
+
+    def clear(self):
+        with self.lock:
+            super(PolarityIndex, self).clear()
+            self.entries = []
+
+    def search(self, text, limit=100):
+        """
+        Return the text of up to `limit` indexed statements,
+        ordered by the closeness of their polarity to the text's.
+        """
+        import bisect
+
+        polarity = self.get_polarity(Statement(text))
+
+        # Statements may be added by other threads while the search runs
+        with self.lock:
+            # Walk outwards from the position the polarity would be inserted at
+            upper = bisect.bisect_left(self.entries, (polarity, ))
+            lower = upper - 1
+            results = []
+
+            while len(results) < limit:
+                has_lower = lower >= 0
+                has_upper = upper < len(self.entries)
+
+                if not has_lower and not has_upper:
+                    break
+
+                if has_upper and (not has_lower or (
+                        self.entries[upper][0] - polarity <= polarity - self.entries[lower][0])):
+                    results.append(self.entries[upper][1])
+                    upper += 1
+                else:
+                    results.append(self.entries[lower][1])
+                    lower -= 1
+
+        return results
@@ -0,0 +1,28 @@
+import sys
+
+
+def print_progress_bar(description, iteration_counter, total_items, progress_bar_length=20):
+    """
+    Print a progress bar for the current stage of a long running process.
+
+    :param description: The name of the process being tracked.
+    :param iteration_counter: The number of items that have been processed.
+    :param total_items: The total number of items to process.
+    :param progress_bar_length: The number of characters in the bar.
+    """
+    if total_items:
+        percent = float(iteration_counter) / total_items
+    else:
+        percent = 1.0
+
+    hashes = '#' * int(round(percent * progress_bar_length))
+    spaces = ' ' * (progress_bar_length - len(hashes))
+
+    sys.stdout.write('\r{0}: [{1}] {2}%'.format(
+        description, hashes + spaces, int(round(percent * 100))
+    ))
+
+    if iteration_counter >= total_items:
+        sys.stdout.write('\n')
+
+    sys.stdout.flush()
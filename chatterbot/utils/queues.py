@@ -1,3 +1,111 @@
+from collections import deque
+from threading import Lock
+
+
+class IndexedDeque(deque):
+    """
+    A deque that keeps a count of each item that it holds, so that checking
+    if an item is in the deque does not require looking at every item.
+    Items that cannot be hashed are found by looking at each item.
+    """
+
+    def __init__(self, iterable=(), maxlen=None):
+        super(IndexedDeque, self).__init__(maxlen=maxlen)
+
+        self.counts = {}
+        self.unhashable_count = 0
+
+        self.extend(iterable)
+
+    def _add(self, item):
+        try:
+            self.counts[item] = self.counts.get(item, 0) + 1
+        except TypeError:
+            self.unhashable_count += 1
+
+    def _discard(self, item):
+        try:
+            count = self.counts[item] - 1
+        except TypeError:
+            self.unhashable_count -= 1
+            return
+
+        if count:
+            self.counts[item] = count
+        else:
+            del self.counts[item]
+
+    def append(self, item):
+        if len(self) == self.maxlen:
+            if not self.maxlen:
+                return
+            self._discard(self[0])
+
+        deque.append(self, item)
+        self._add(item)
+
+    def appendleft(self, item):
+        if len(self) == self.maxlen:
+            if not self.maxlen:
+                return
+            self._discard(self[-1])
+
+        deque.appendleft(self, item)
+        self._add(item)
+
+    def extend(self, items):
+        for item in items:
+            self.append(item)
+
+    def extendleft(self, items):
+        for item in items:
+            self.appendleft(item)
+
+    def __iadd__(self, items):
+        self.extend(items)
+        return self
+
+    def pop(self):
+        item = super(IndexedDeque, self).pop()
+        self._discard(item)
+        return item
+
+    def popleft(self):
+        item = super(IndexedDeque, self).popleft()
+        self._discard(item)
+        return item
+
+    def remove(self, item):
+        super(IndexedDeque, self).remove(item)
+        self._discard(item)
+
+    def clear(self):
+        super(IndexedDeque, self).clear()
+        self.counts.clear()
+        self.unhashable_count = 0
+
+    def __setitem__(self, index, item):
+        self._discard(self[index])
+        super(IndexedDeque, self).__setitem__(index, item)
+        self._add(item)
+
+    def __delitem__(self, index):
+        self._discard(self[index])
+        super(IndexedDeque, self).__delitem__(index)
+
+    def __contains__(self, item):
+        try:
+            if item in self.counts:
+                return True
+        except TypeError:
+            return deque.__contains__(self, item)
+
+        if self.unhashable_count:
+            return deque.__contains__(self, item)
+
+        return False
+
+
 class ResponseQueue(object):
     """
     This is a data structure like a queue.
@@ -5,31 +113,54 @@ class ResponseQueue(object):
     Once the maximum is reached, when a new item
     is added the oldest item in the queue will
     be removed.
+
+    Adding an item and checking if an item is in the queue take the same
+    time no matter how many items the queue holds. Items can be added
+    from several threads at once.
     """
 
     def __init__(self, maxsize=10):
         self.maxsize = maxsize
-        self.queue = []
+        self.queue = IndexedDeque(maxlen=maxsize)
+        self.lock = Lock()
 
     def append(self, item):
         """
         Append an element at the end of the queue.
         """
-        if len(self.queue) == self.maxsize:
-            # Remove an element from the top of the list
-            self.queue.pop(0)
+        with self.lock:
+            self.queue.append(item)
 
-        self.queue.append(item)
+    def snapshot(self):
+        """
+        Return a list of the elements in the queue, from oldest to newest.
+        The list is not changed when elements are added to the queue.
+        """
+        with self.lock:
+            return list(self.queue)
 
     def __getitem__(self, index):
         return self.queue[index]
 
+    def __iter__(self):
+        return iter(self.snapshot())
+
+    def __len__(self):
+        return len(self.queue)
+
     def __contains__(self, item):
         """
         Check if an element is in this queue.
         """
         return item in self.queue
 
+    def __getstate__(self):
+        return {'maxsize': self.maxsize, 'items': self.snapshot()}
+
+    def __setstate__(self, state):
+        self.__init__(maxsize=state['maxsize'])
+        self.queue.extend(state['items'])
+
     def empty(self):
         """
         Return True if the queue is empty, False otherwise.
@@ -40,4 +171,5 @@ class ResponseQueue(object):
         """
         Remove all elements from the queue.
         """
-        self.queue = []
+        with self.lock:
+            self.queue.clear()
@@ -0,0 +1,188 @@
+"""
+Data structures that storage adapters use to select random statements.
+"""
+from collections import deque
+from threading import Lock, Thread
+import random
+
+
+class RandomKeys(object):
+    """
+    A set of keys that a random key can be chosen from.
+    Adding a key, removing a key and choosing a random key
+    take the same time no matter how many keys are held.
+    """
+
+    def __init__(self, keys=()):
+        self.keys = []
+        self.positions = {}
+
+        for key in keys:
+            self.add(key)
+
+    def add(self, key):
+        """
+        Add a key if it is not already held.
+        """
+        if key not in self.positions:
+            self.positions[key] = len(self.keys)
+            self.keys.append(key)
+
+    def remove(self, key):
+        """
+        Remove a key if it is held. The last key is
+        moved into the position of the removed key.
+        """
+        position = self.positions.pop(key, None)
+
+        if position is None:
+            return
+
+        last = self.keys.pop()
+
+        if position < len(self.keys):
+            self.keys[position] = last
+            self.positions[last] = position
+
+    def choice(self):
+        """
+        Return a random key, or None if no keys are held.
+        """
+        if not self.keys:
+            return None
+
+        return self.keys[random.randrange(len(self.keys))]
+
+    def sample(self, count):
+        """
+        Return a list of `count` random keys. A key may be chosen more than once.
+        """
+        if not self.keys:
+            return []
+
+        return [self.keys[random.randrange(len(self.keys))] for _ in range(0, count)]
+
+    def clear(self):
+        """
+        Remove all keys.
+        """
+        self.keys = []
+        self.positions = {}
+
+    def __contains__(self, key):
+        return key in self.positions
+
+    def __len__(self):
+        return len(self.keys)
+
+
+class RandomStatementPool(object):
+    """
+    Hold random statements that were selected from a storage adapter ahead
+    of time, so that a random statement can be returned without waiting
+    for the database. Once fewer than `refill_threshold` statements are
+    left, the pool is refilled in a background thread.
+
+    The pool is registered as a listener of the storage adapter, so
+    statements that are changed or removed are taken out of the pool.
+    """
+
+    def __init__(self, storage, size=100, refill_threshold=None):
+        self.storage = storage
+        self.size = size
+
+        if refill_threshold is None:
+            refill_threshold = size // 4
+
+        self.refill_threshold = refill_threshold
+
+        self.statements = deque()
+        self.lock = Lock()
+
+        # The thread that is refilling the pool, if one is running
+        self.refill_thread = None
+
+    def fill(self):
+        """
+        Add random statements from the storage adapter until the pool is full.
+        """
+        count = self.size - len(self.statements)
+
+        if count > 0:
+            statements = self.storage.get_random_statements(count)
+
+            with self.lock:
+                self.statements.extend(statements[:self.size - len(self.statements)])
+
+    def _refill(self):
+        try:
+            self.fill()
+        except Exception:
+            self.storage.logger.exception('Unable to refill the random statement pool.')
+        finally:
+            self.refill_thread = None
+
+    def refill_in_background(self):
+        """
+        Start a thread that fills the pool, unless one is already running.
+        """
+        with self.lock:
+            if self.refill_thread is not None:
+                return
+
+            self.refill_thread = Thread(target=self._refill)
+            self.refill_thread.daemon = True
+
+        self.refill_thread.start()
+
+    def get(self):
+        """
+        Return a random statement. If the pool is empty, the pool is filled
+        before the statement is returned.
+
+        :raises: EmptyDatabaseException if the database has no statements.
+        """
+        with self.lock:
+            statement = self.statements.popleft() if self.statements else None
+            remaining = len(self.statements)
+
+        if statement is None:
+            self.fill()
+
+            with self.lock:
+                statement = self.statements.popleft() if self.statements else None
+                remaining = len(self.statements)
+
+            if statement is None:
+                raise self.storage.EmptyDatabaseException()
+
+        if remaining < self.refill_threshold:
+            self.refill_in_background()
+
+        return statement
+
+    def discard(self, text):
+        """
+        Remove each statement with the text from the pool.
+        """
+        with self.lock:
+            if any(statement.text == text for statement in self.statements):
+                self.statements = deque(
+                    statement for statement in self.statements if statement.text != text
+                )
+
+    def clear(self):
+        """
+        Remove all statements from the pool.
+        """
+        with self.lock:
+            self.statements.clear()
+
+    def statement_updated(self, statement):
+        self.discard(statement.text)
+
+    def statement_removed(self, statement_text):
+        self.discard(statement_text)
+
+    def __len__(self):
+        return len(self.statements)
@@ -27,15 +27,19 @@ class StopWordsManager(object):
         except LookupError:
             download('stopwords')
 
+        # The set of stop words for each language that has been used
+        self.stop_words = {}
+
     def remove_stopwords(self, language, tokens):
         """
         Takes a language (i.e. 'english'), and a set of word tokens.
         Returns the tokenized text with any stopwords removed.
         """
         # Get the stopwords for the specified language
-        stop_words = stopwords.words(language)
+        if language not in self.stop_words:
+            self.stop_words[language] = set(stopwords.words(language))
 
         # Remove the stop words from the set of word tokens
-        tokens = set(tokens) - set(stop_words)
+        tokens = set(tokens) - self.stop_words[language]
 
         return tokens
\ No newline at end of file
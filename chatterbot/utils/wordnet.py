@@ -8,7 +8,7 @@ class Wordnet(object):
     1) synsets: Returns the synsets of a token
     """
 
-    def __init__(self):
+    def __init__(self, synset_cache_size=10000):
         from nltk.data import find
         from nltk import download
         import os
@@ -27,9 +27,20 @@ class Wordnet(object):
         except LookupError:
             download('wordnet')
 
+        from chatterbot.utils.cache import LRUCache
+
+        # The synsets of the tokens that have been looked up
+        self.synset_cache = LRUCache(maxsize=synset_cache_size)
+
     def synsets(self, token):
         """
         Takes a token and returns the synsets for
         it.
         """
-        return wordnet.synsets(token)
+        synsets = self.synset_cache.get(token)
+
+        if synsets is None:
+            synsets = wordnet.synsets(token)
+            self.synset_cache.set(token, synsets)
+
+        return synsets
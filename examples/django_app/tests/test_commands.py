@@ -18,4 +18,11 @@ class TrainCommandTestCase(TestCase):
         statements_after = Statement.objects.exists()
 
         self.assertFalse(statements_before)
-        self.assertTrue(statements_after)
\ No newline at end of file
+        self.assertTrue(statements_after)
+
+class BackfillCommandTestCase(TestCase):
+
+    def test_command_output(self):
+        out = StringIO()
+        call_command('backfill', stdout=out)
+        self.assertIn('Saved data for', out.getvalue())
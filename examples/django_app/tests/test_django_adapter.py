@@ -192,6 +192,76 @@ class DjangoStorageAdapterTestCase(DjangoAdapterTestCase):
         self.assertIn("This is a phone.", responses)
         self.assertIn("A what?", responses)
 
+    def test_get_response_statements_query_count(self):
+        for text in ["A", "B", "C", "D"]:
+            self.adapter.update(Statement(text, in_response_to=[Response("Hi")]))
+            self.adapter.update(Statement("Hi", in_response_to=[Response(text)]))
+
+        # One query for the statements and one for their responses
+        with self.assertNumQueries(2):
+            responses = self.adapter.get_response_statements()
+
+        self.assertEqual(len(responses), 5)
+
+    def test_update_query_count_does_not_depend_on_responses(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        def count_update_queries(text, response_count):
+            statement = Statement(text, in_response_to=[
+                Response('{} {}'.format(text, i)) for i in range(0, response_count)
+            ])
+            with CaptureQueriesContext(connection) as context:
+                self.adapter.update(statement)
+            return len(context.captured_queries)
+
+        self.assertEqual(
+            count_update_queries('One', 1),
+            count_update_queries('Ten', 10)
+        )
+
+    def test_update_existing_responses(self):
+        statement = Statement("Hi", in_response_to=[Response("Hello")])
+        self.adapter.update(statement)
+
+        statement.add_response(Response("Hello"))
+        statement.add_response(Response("Hey"))
+        self.adapter.update(statement)
+
+        found = self.adapter.find("Hi")
+
+        self.assertEqual(len(found.in_response_to), 2)
+        self.assertEqual(found.get_response_count(Statement("Hello")), 2)
+        self.assertEqual(found.get_response_count(Statement("Hey")), 1)
+
+
+class DjangoAdapterBulkUpdateTestCase(DjangoAdapterTestCase):
+
+    def test_bulk_update_adds_statements(self):
+        self.adapter.bulk_update([
+            Statement("Hi", in_response_to=[Response("Hello")]),
+            Statement("Hey")
+        ])
+
+        self.assertEqual(self.adapter.count(), 3)
+        self.assertIn("Hello", self.adapter.find("Hi").in_response_to)
+
+    def test_bulk_update_adds_occurrence(self):
+        self.adapter.update(Statement("Hi", in_response_to=[Response("Hello")]))
+
+        self.adapter.bulk_update([
+            Statement("Hi", in_response_to=[Response("Hello", occurrence=2)])
+        ])
+
+        self.assertEqual(self.adapter.find("Hi").in_response_to[0].occurrence, 3)
+
+    def test_bulk_update_merges_extra_data(self):
+        self.adapter.update(Statement("Hi", extra_data={"a": 1}))
+
+        self.adapter.bulk_update([Statement("Hi", extra_data={"b": 2})])
+
+        self.assertEqual(self.adapter.find("Hi").extra_data, {"a": 1, "b": 2})
+
 
 class DjangoAdapterFilterTestCase(DjangoAdapterTestCase):
 
@@ -0,0 +1,191 @@
+"""
+Tests for the asyncio support. These tests use syntax that is only
+available in Python 3.5 or later, so they are imported by test_asynchronous.
+"""
+import asyncio
+from unittest import TestCase, SkipTest
+from .base_case import ChatBotSqliteTestCase
+from chatterbot.adapters.input import InputAdapter
+from chatterbot.conversation import Statement, Response
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class AsyncInputAdapter(InputAdapter):
+
+    async def aprocess_input(self, statement):
+        return Statement(statement.upper())
+
+
+class AsyncChatBotTestCase(ChatBotSqliteTestCase):
+
+    def setUp(self):
+        super(AsyncChatBotTestCase, self).setUp()
+
+        self.chatbot.storage.update(
+            Statement('Hi there!', in_response_to=[Response('Hello')])
+        )
+
+    def test_aget_response(self):
+        response = run(self.chatbot.aget_response('Hello'))
+
+        self.assertEqual(response, 'Hi there!')
+
+    def test_aget_response_learns_input(self):
+        run(self.chatbot.aget_response('Hello'))
+        run(self.chatbot.aget_response('How are you?'))
+
+        statement = self.chatbot.storage.find('How are you?')
+
+        self.assertIsNotNone(statement)
+        self.assertEqual(statement.in_response_to, [Response('Hi there!')])
+
+    def test_aget_response_session(self):
+        run(self.chatbot.aget_response('Hello', session_id='a'))
+
+        self.assertEqual(self.chatbot.get_last_response_statement('a'), 'Hi there!')
+        self.assertTrue(self.chatbot.recent_statements.empty())
+
+    def test_aget_response_uses_threaded_storage(self):
+        from chatterbot.asynchronous import ThreadedStorageAdapter
+
+        run(self.chatbot.aget_response('Hello'))
+
+        self.assertIsInstance(self.chatbot.async_storage, ThreadedStorageAdapter)
+        self.assertEqual(self.chatbot.async_storage.storage, self.chatbot.storage)
+
+    def test_aget_response_async_input_adapter(self):
+        self.chatbot.input = AsyncInputAdapter()
+        self.chatbot.input.set_context(self.chatbot)
+
+        response = run(self.chatbot.aget_response('hello'))
+
+        self.assertEqual(response, 'Hi there!')
+        self.assertIsNotNone(self.chatbot.storage.find('HELLO'))
+
+    def test_concurrent_responses(self):
+        async def get_responses():
+            return await asyncio.gather(*[
+                self.chatbot.aget_response('Hello') for _ in range(20)
+            ])
+
+        responses = run(get_responses())
+
+        self.assertEqual(len(responses), 20)
+        self.assertEqual(len(self.chatbot.recent_statements.queue), 10)
+
+
+class ThreadedStorageAdapterTestCase(ChatBotSqliteTestCase):
+
+    def setUp(self):
+        super(ThreadedStorageAdapterTestCase, self).setUp()
+        from chatterbot.asynchronous import ThreadedStorageAdapter
+
+        self.adapter = ThreadedStorageAdapter()
+        self.adapter.set_context(self.chatbot)
+
+    def test_update_and_find(self):
+        run(self.adapter.update(Statement('Hello')))
+
+        statement = run(self.adapter.find('Hello'))
+
+        self.assertEqual(statement, 'Hello')
+        self.assertEqual(run(self.adapter.count()), 1)
+
+    def test_filter(self):
+        run(self.adapter.update(
+            Statement('Hi there!', in_response_to=[Response('Hello')])
+        ))
+
+        results = run(self.adapter.filter(in_response_to__contains='Hello'))
+
+        self.assertEqual(results, ['Hi there!'])
+
+    def test_remove(self):
+        run(self.adapter.update(Statement('Hello')))
+        run(self.adapter.remove('Hello'))
+
+        self.assertIsNone(run(self.adapter.find('Hello')))
+
+    def test_get_response_statements(self):
+        run(self.adapter.update(
+            Statement('Hi there!', in_response_to=[Response('Hello')])
+        ))
+
+        results = run(self.adapter.get_response_statements())
+
+        self.assertEqual(results, ['Hello'])
+
+
+class MotorStorageAdapterTestCase(TestCase):
+
+    def setUp(self):
+        try:
+            from chatterbot.asynchronous import MotorStorageAdapter
+        except ImportError:
+            raise SkipTest('Motor is not installed.')
+
+        from pymongo.errors import ServerSelectionTimeoutError
+        from pymongo import MongoClient
+
+        # Skip these tests if a mongo client is not running
+        try:
+            client = MongoClient(serverSelectionTimeoutMS=0.1)
+            client.server_info()
+        except ServerSelectionTimeoutError:
+            raise SkipTest('Unable to connect to Mongo DB.')
+
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+        self.adapter = MotorStorageAdapter(database='chatterbot_test_motor')
+
+    def tearDown(self):
+        self.loop.run_until_complete(self.adapter.drop())
+        self.loop.close()
+
+    def test_update_and_find(self):
+        self.loop.run_until_complete(self.adapter.update(
+            Statement('Hi there!', in_response_to=[Response('Hello')])
+        ))
+
+        statement = self.loop.run_until_complete(self.adapter.find('Hi there!'))
+
+        self.assertEqual(statement.in_response_to, [Response('Hello')])
+        self.assertEqual(self.loop.run_until_complete(self.adapter.count()), 2)
+
+    def test_remove(self):
+        self.loop.run_until_complete(self.adapter.update(
+            Statement('Hi there!', in_response_to=[Response('Hello')])
+        ))
+        self.loop.run_until_complete(self.adapter.remove('Hello'))
+
+        statement = self.loop.run_until_complete(self.adapter.find('Hi there!'))
+
+        self.assertEqual(statement.in_response_to, [])
+
+    def test_get_response_statements(self):
+        self.loop.run_until_complete(self.adapter.update(
+            Statement('Hi there!', in_response_to=[Response('Hello')])
+        ))
+
+        results = self.loop.run_until_complete(self.adapter.get_response_statements())
+
+        self.assertEqual(results, ['Hello'])
+
+    def test_base_query(self):
+        self.loop.run_until_complete(self.adapter.update(
+            Statement('Hi there!', in_response_to=[Response('Hello')])
+        ))
+
+        self.adapter.base_query = self.adapter.base_query.statement_text_not_in(['Hello'])
+
+        self.assertIsNone(self.loop.run_until_complete(self.adapter.find('Hello')))
+        self.assertEqual(self.loop.run_until_complete(self.adapter.get_response_statements()), [])
@@ -72,4 +72,11 @@ class ChatBotMongoTestCase(ChatBotTestCase):
         kwargs = super(ChatBotMongoTestCase, self).get_kwargs()
         kwargs['database'] = self.random_string()
         kwargs['storage_adapter'] = 'chatterbot.adapters.storage.MongoDatabaseAdapter'
-        return kwargs
\ No newline at end of file
+        return kwargs
+
+class ChatBotSqliteTestCase(ChatBotTestCase):
+
+    def get_kwargs(self):
+        kwargs = super(ChatBotSqliteTestCase, self).get_kwargs()
+        kwargs['storage_adapter'] = 'chatterbot.adapters.storage.SqliteStorageAdapter'
+        return kwargs
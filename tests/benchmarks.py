@@ -0,0 +1,448 @@
+"""
+Benchmarks for measuring the performance of ChatterBot's components.
+
+These are not run as part of the test suite. To run them use:
+
+    python -m tests.benchmarks
+"""
+from random import Random
+import time
+
+
+WORDS = [
+    'hello', 'how', 'are', 'you', 'what', 'is', 'your', 'name', 'quest',
+    'favorite', 'color', 'the', 'meaning', 'of', 'life', 'good', 'morning',
+    'night', 'weather', 'today', 'where', 'do', 'live', 'like', 'to', 'eat',
+    'time', 'it', 'going', 'tell', 'me', 'a', 'joke', 'about', 'robots',
+    'python', 'code', 'music', 'movie', 'book', 'read', 'play', 'game'
+]
+
+
+def generate_sentences(count, seed=0):
+    """
+    Return a list of unique, randomly generated sentences.
+    """
+    random = Random(seed)
+    sentences = set()
+
+    while len(sentences) < count:
+        length = random.randint(3, 10)
+        words = [random.choice(WORDS) for _ in range(0, length)]
+        sentences.add(' '.join(words))
+
+    return sorted(sentences)
+
+
+def perturb(sentence, random):
+    """
+    Return a copy of the sentence with one word replaced.
+    """
+    words = sentence.split()
+    words[random.randint(0, len(words) - 1)] = random.choice(WORDS)
+    return ' '.join(words)
+
+
+def benchmark_candidate_index(statement_count=10000, query_count=50, limits=(10, 50, 100, 500)):
+    """
+    Compare the time taken to find the closest match to an input by comparing
+    it with every known statement to the time taken when only comparing it to
+    the candidates selected by an NgramIndex. The recall is the fraction of
+    inputs for which the indexed search selects the same match as the full scan.
+    """
+    from chatterbot.conversation import Statement
+    from chatterbot.conversation.comparisons import levenshtein_distance
+    from chatterbot.utils.indexes import NgramIndex
+
+    random = Random(1)
+    statements = [Statement(text) for text in generate_sentences(statement_count)]
+    statements_by_text = dict((statement.text, statement) for statement in statements)
+    queries = [
+        Statement(perturb(random.choice(statements).text, random))
+        for _ in range(0, query_count)
+    ]
+
+    def closest_match(query, candidates):
+        best_confidence = 0
+        best_match = None
+        for candidate in candidates:
+            confidence = levenshtein_distance(query, candidate)
+            if confidence > best_confidence:
+                best_confidence = confidence
+                best_match = candidate
+        return best_match
+
+    start = time.time()
+    expected = [closest_match(query, statements) for query in queries]
+    full_scan_time = (time.time() - start) / query_count
+
+    start = time.time()
+    index = NgramIndex()
+    index.populate(statements)
+    build_time = time.time() - start
+
+    print('Candidate index ({} statements, built in {:.2f}s)'.format(
+        statement_count, build_time
+    ))
+    print('  full scan: {:.2f}ms per input'.format(full_scan_time * 1000))
+
+    for limit in limits:
+        found = 0
+        start = time.time()
+        for query, match in zip(queries, expected):
+            candidates = [
+                statements_by_text[text] for text in index.search(query.text, limit)
+            ]
+            if closest_match(query, candidates) == match:
+                found += 1
+        indexed_time = (time.time() - start) / query_count
+
+        print('  limit {:>4}: {:.2f}ms per input, recall {:.2f}'.format(
+            limit, indexed_time * 1000, found / float(query_count)
+        ))
+
+
+def benchmark_levenshtein_batch(statement_count=20000, query_count=10):
+    """
+    Compare the time taken to find the closest match to an input by calling
+    levenshtein_distance for each statement to the time taken by the batch
+    comparison method.
+    """
+    from chatterbot.conversation import Statement
+    from chatterbot.conversation.comparisons import levenshtein_distance
+
+    random = Random(2)
+    statements = [Statement(text) for text in generate_sentences(statement_count)]
+    queries = [
+        Statement(perturb(random.choice(statements).text, random))
+        for _ in range(0, query_count)
+    ]
+
+    start = time.time()
+    for query in queries:
+        max([levenshtein_distance(query, statement) for statement in statements])
+    pairwise_time = (time.time() - start) / query_count
+
+    start = time.time()
+    for query in queries:
+        levenshtein_distance.batch(query, statements)
+    batch_time = (time.time() - start) / query_count
+
+    print('Levenshtein distance ({} statements)'.format(statement_count))
+    print('  pairwise: {:.2f}ms per input'.format(pairwise_time * 1000))
+    print('  batch: {:.2f}ms per input'.format(batch_time * 1000))
+
+
+def generate_conversation(count, seed=0):
+    """
+    Return a list of statements, about half of which are
+    in response to the statement before them.
+    """
+    from chatterbot.conversation import Statement, Response
+
+    random = Random(seed)
+    statements = []
+
+    for text in generate_sentences(count, seed):
+        statement = Statement(text)
+        if statements and random.random() < 0.5:
+            statement.add_response(Response(statements[-1].text))
+        statements.append(statement)
+
+    return statements
+
+
+def benchmark_get_response_statements(statement_count=100000):
+    """
+    Compare the time taken to select the statements that have known
+    responses by each storage adapter's get_response_statements method
+    to the time taken by the StorageAdapter implementation, which
+    filters every statement in the database.
+    """
+    from chatterbot.adapters.storage import (
+        StorageAdapter, SqliteStorageAdapter, JsonLogStorageAdapter
+    )
+    import tempfile
+    import shutil
+    import os
+
+    statements = generate_conversation(statement_count)
+    directory = tempfile.mkdtemp()
+
+    def list_removal(statement_list):
+        # The implementation previously used by StorageAdapter
+        statement_list = list(statement_list)
+        responses = set()
+        for statement in statement_list:
+            for response in statement.in_response_to:
+                responses.add(response.text)
+        to_remove = [s for s in statement_list if s.text not in responses]
+        for statement in to_remove:
+            statement_list.remove(statement)
+        return statement_list
+
+    print('Get response statements ({} statements)'.format(statement_count))
+
+    # The quadratic removal is only timed on a sample of the statements
+    sample = statements[:10000]
+    start = time.time()
+    list_removal(sample)
+    print('  list removal ({} statements): {:.2f}s'.format(
+        len(sample), time.time() - start
+    ))
+
+    try:
+        adapters = [
+            SqliteStorageAdapter(database=os.path.join(directory, 'db.sqlite3')),
+            JsonLogStorageAdapter(database=os.path.join(directory, 'db.jsonl'))
+        ]
+
+        for storage in adapters:
+            for statement in statements:
+                storage.update(statement)
+
+            start = time.time()
+            StorageAdapter.get_response_statements(storage)
+            filter_time = time.time() - start
+
+            start = time.time()
+            storage.get_response_statements()
+            native_time = time.time() - start
+
+            print('  {}: filter {:.2f}s, native {:.2f}s'.format(
+                type(storage).__name__, filter_time, native_time
+            ))
+
+            storage.drop()
+    finally:
+        shutil.rmtree(directory)
+
+
+def benchmark_training(conversation_count=2000, conversation_length=6):
+    """
+    Compare the number of statements trained per second when each statement
+    is found and updated separately to the number trained per second when
+    the statements of each conversation, or of every conversation, are
+    collected in a batch and saved with bulk_update.
+    """
+    from chatterbot.adapters.storage import SqliteStorageAdapter, JsonLogStorageAdapter
+    from chatterbot.conversation import Statement, Response
+    from chatterbot.trainers import ListTrainer, TrainingBatch
+    import tempfile
+    import shutil
+    import os
+
+    random = Random(3)
+    sentences = generate_sentences(conversation_count)
+    conversations = [
+        [random.choice(sentences) for _ in range(0, conversation_length)]
+        for _ in range(0, conversation_count)
+    ]
+    statement_count = conversation_count * conversation_length
+
+    def train_each_statement(storage, conversation):
+        # The process previously used by ListTrainer
+        previous = None
+        for text in conversation:
+            statement = storage.find(text) or Statement(text)
+            if previous:
+                statement.add_response(Response(previous.text))
+            previous = statement
+            storage.update(statement, force=True)
+
+    directory = tempfile.mkdtemp()
+
+    print('Training ({} statements)'.format(statement_count))
+
+    try:
+        adapter_classes = [
+            (SqliteStorageAdapter, 'db.sqlite3', ),
+            (JsonLogStorageAdapter, 'db.jsonl', )
+        ]
+
+        for adapter_class, file_name in adapter_classes:
+            path = os.path.join(directory, file_name)
+
+            storage = adapter_class(database=path)
+            start = time.time()
+            for conversation in conversations:
+                train_each_statement(storage, conversation)
+            each_time = time.time() - start
+            storage.drop()
+
+            storage = adapter_class(database=path)
+            trainer = ListTrainer(storage)
+            start = time.time()
+            for conversation in conversations:
+                trainer.train(conversation)
+            batch_time = time.time() - start
+            storage.drop()
+
+            storage = adapter_class(database=path)
+            batch = TrainingBatch()
+            start = time.time()
+            for conversation in conversations:
+                batch.add_conversation(conversation)
+            batch.save(storage)
+            single_batch_time = time.time() - start
+            storage.drop()
+
+            print('  {}: each statement {:.0f}/s, each conversation {:.0f}/s, single batch {:.0f}/s'.format(
+                adapter_class.__name__,
+                statement_count / each_time,
+                statement_count / batch_time,
+                statement_count / single_batch_time
+            ))
+    finally:
+        shutil.rmtree(directory)
+
+
+def benchmark_parallel_training(file_count=8, conversation_count=20000):
+    """
+    Compare the time taken to train from a corpus of several files with one
+    process to the time taken with a process for each available processor.
+    The statements are not saved, so that only the reading of the corpus
+    files and the collecting of the statements is measured.
+    """
+    from chatterbot.trainers import ChatterBotCorpusTrainer
+    from multiprocessing import cpu_count
+    import tempfile
+    import shutil
+    import json
+    import os
+
+    class DiscardingStorage(object):
+
+        def bulk_update(self, statements, **kwargs):
+            pass
+
+    random = Random(5)
+    sentences = generate_sentences(5000)
+    directory = tempfile.mkdtemp()
+    processes = max(2, cpu_count())
+
+    print('Parallel training ({} files, {} conversations, {} processes, {} processors)'.format(
+        file_count, file_count * conversation_count, processes, cpu_count()
+    ))
+
+    try:
+        for index in range(0, file_count):
+            conversations = [
+                [random.choice(sentences) for _ in range(0, random.randint(2, 6))]
+                for _ in range(0, conversation_count)
+            ]
+            file_path = os.path.join(directory, '{}.corpus.json'.format(index))
+            with open(file_path, 'w') as data_file:
+                json.dump({'conversations': conversations}, data_file)
+
+        for training_processes in (1, processes, ):
+            trainer = ChatterBotCorpusTrainer(
+                DiscardingStorage(), training_processes=training_processes
+            )
+            start = time.time()
+            trainer.train(directory)
+            print('  {} process(es): {:.2f}s'.format(training_processes, time.time() - start))
+    finally:
+        shutil.rmtree(directory)
+
+
+def benchmark_corpus_loading(conversation_count=200000):
+    """
+    Compare the time taken to read every conversation in a corpus from a
+    json file, from the same file one conversation at a time, and from the
+    compiled form of the file.
+    """
+    from chatterbot.corpus import Corpus
+    import tempfile
+    import shutil
+    import json
+    import os
+
+    random = Random(4)
+    sentences = generate_sentences(5000)
+    conversations = [
+        [random.choice(sentences) for _ in range(0, random.randint(2, 6))]
+        for _ in range(0, conversation_count)
+    ]
+
+    corpus = Corpus()
+    directory = tempfile.mkdtemp()
+    file_path = os.path.join(directory, 'benchmark.corpus.json')
+
+    try:
+        with open(file_path, 'w') as corpus_file:
+            json.dump({'conversations': conversations}, corpus_file)
+
+        start = time.time()
+        for data in corpus.load_corpus(file_path):
+            for conversation in data:
+                pass
+        load_time = time.time() - start
+
+        start = time.time()
+        for conversation in corpus.read_conversations(file_path):
+            pass
+        stream_time = time.time() - start
+
+        start = time.time()
+        compiled_path = corpus.compile_corpus(file_path)[0]
+        compile_time = time.time() - start
+
+        start = time.time()
+        for conversation in corpus.read_conversations(compiled_path):
+            pass
+        compiled_time = time.time() - start
+
+        print('Corpus loading ({} conversations)'.format(conversation_count))
+        print('  json file: {:.2f}s'.format(load_time))
+        print('  streamed json file: {:.2f}s'.format(stream_time))
+        print('  compiled file: {:.2f}s (compiled in {:.2f}s, {:.1f}MB instead of {:.1f}MB)'.format(
+            compiled_time,
+            compile_time,
+            os.path.getsize(compiled_path) / 1048576.0,
+            os.path.getsize(file_path) / 1048576.0
+        ))
+    finally:
+        shutil.rmtree(directory)
+
+
+def benchmark_response_queue(maxsize=100, operation_count=200000):
+    """
+    Compare appending to and searching a ResponseQueue with the list
+    based queue that it replaced.
+    """
+    from chatterbot.utils.queues import ResponseQueue
+
+    class ListQueue(object):
+        # The implementation previously used by ResponseQueue
+
+        def __init__(self, maxsize):
+            self.maxsize = maxsize
+            self.queue = []
+
+        def append(self, item):
+            if len(self.queue) == self.maxsize:
+                self.queue.pop(0)
+            self.queue.append(item)
+
+        def __contains__(self, item):
+            return item in self.queue
+
+    print('Response queue ({} items, {} operations)'.format(maxsize, operation_count))
+
+    for name, queue in (('list', ListQueue(maxsize)), ('deque', ResponseQueue(maxsize))):
+        start = time.time()
+        for item in range(operation_count):
+            queue.append(item)
+            item in queue
+            -1 in queue
+        print('  {}: {:.2f}s'.format(name, time.time() - start))
+
+
+if __name__ == '__main__':
+    benchmark_candidate_index()
+    benchmark_levenshtein_batch()
+    benchmark_get_response_statements()
+    benchmark_training()
+    benchmark_parallel_training()
+    benchmark_corpus_loading()
+    benchmark_response_queue()
@@ -0,0 +1,120 @@
+from unittest import TestCase
+from chatterbot.conversation import Statement
+from chatterbot.conversation import comparisons
+
+
+class LevenshteinDistanceBatchTestCase(TestCase):
+
+    def setUp(self):
+        self.statements = [
+            Statement('Who do you love?'),
+            Statement(''),
+            Statement('What is the meaning of life?'),
+            Statement('What... is your quest?'),
+            Statement('I hear you are going on a quest?'),
+        ]
+
+    def test_batch_method(self):
+        self.assertEqual(
+            comparisons.levenshtein_distance.batch,
+            comparisons.levenshtein_distance_batch
+        )
+
+    def test_same_result_as_pairwise_comparison(self):
+        statement = Statement('What is your quest?')
+
+        similarities = [
+            comparisons.levenshtein_distance(statement, other_statement)
+            for other_statement in self.statements
+        ]
+        max_similarity = max(similarities)
+
+        result = comparisons.levenshtein_distance_batch(statement, self.statements)
+
+        self.assertEqual(result, (max_similarity, similarities.index(max_similarity)))
+
+    def test_exact_match(self):
+        statement = Statement('WHAT IS THE MEANING OF LIFE?')
+
+        result = comparisons.levenshtein_distance_batch(statement, self.statements)
+
+        self.assertEqual(result, (1, 2))
+
+    def test_no_similarity(self):
+        result = comparisons.levenshtein_distance_batch(
+            Statement('xxx'), [Statement('yyy')]
+        )
+
+        self.assertEqual(result, (0, None))
+
+    def test_empty_input(self):
+        result = comparisons.levenshtein_distance_batch(
+            Statement(''), self.statements
+        )
+
+        self.assertEqual(result, (0, None))
+
+
+class SynsetDistanceTestCase(TestCase):
+
+    def test_annotate(self):
+        self.assertEqual(
+            comparisons.synset_distance.annotate,
+            comparisons.get_synset_tokens
+        )
+
+    def test_get_synset_tokens_from_extra_data(self):
+        """
+        Tokens that have already been saved with a
+        statement should not be calculated again.
+        """
+        statement = Statement('Hello', extra_data={'_features': {'synset_tokens': ['hi']}})
+
+        self.assertEqual(comparisons.get_synset_tokens(statement), ['hi'])
+
+    def test_cached_similarity(self):
+        comparisons.synset_similarity_cache.set(('cat', 'kitten', ), 0.5)
+
+        statement = Statement('cat', extra_data={'_features': {'synset_tokens': ['cat']}})
+        other_statement = Statement('kitten', extra_data={'_features': {'synset_tokens': ['kitten']}})
+
+        self.assertEqual(comparisons.synset_distance(statement, other_statement), 0.5)
+
+        comparisons.synset_similarity_cache.remove(('cat', 'kitten', ))
+
+
+class JaccardSimilarityTestCase(TestCase):
+
+    def test_annotate(self):
+        self.assertEqual(
+            comparisons.jaccard_similarity.annotate,
+            comparisons.get_lemmas
+        )
+
+    def test_get_lemmas_from_extra_data(self):
+        statement = Statement('The cats', extra_data={'_features': {'lemmas': ['cat']}})
+
+        self.assertEqual(comparisons.get_lemmas(statement), ['cat'])
+
+    def test_similar(self):
+        statement = Statement(
+            'The young cat is hungry.',
+            extra_data={'_features': {'lemmas': ['cat', 'hungry', 'young']}}
+        )
+        other_statement = Statement(
+            'The cat is very hungry.',
+            extra_data={'_features': {'lemmas': ['cat', 'hungry', 'very']}}
+        )
+
+        self.assertTrue(comparisons.jaccard_similarity(statement, other_statement))
+
+    def test_not_similar(self):
+        statement = Statement('Hello', extra_data={'_features': {'lemmas': ['hello']}})
+        other_statement = Statement('Goodbye', extra_data={'_features': {'lemmas': ['goodbye']}})
+
+        self.assertFalse(comparisons.jaccard_similarity(statement, other_statement))
+
+    def test_no_lemmas(self):
+        statement = Statement('The', extra_data={'_features': {'lemmas': []}})
+
+        self.assertFalse(comparisons.jaccard_similarity(statement, statement))
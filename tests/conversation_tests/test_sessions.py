@@ -0,0 +1,82 @@
+from unittest import TestCase
+from chatterbot.conversation import Statement
+from chatterbot.conversation.session import Session, SessionManager
+
+
+class SessionTestCase(TestCase):
+
+    def test_id_generated(self):
+        self.assertNotEqual(Session().id, Session().id)
+
+    def test_id(self):
+        self.assertEqual(Session('abc').id, 'abc')
+
+    def test_conversation_length(self):
+        session = Session(conversation_length=2)
+
+        for index in range(3):
+            session.conversation.append((Statement(str(index)), Statement('Hi'), ))
+
+        self.assertEqual(len(session.conversation.queue), 2)
+
+    def test_get_last_conversance(self):
+        session = Session()
+        session.conversation.append((Statement('Hello'), Statement('Hi'), ))
+
+        self.assertEqual(session.get_last_conversance()[1], 'Hi')
+
+    def test_get_last_conversance_empty(self):
+        self.assertIsNone(Session().get_last_conversance())
+
+    def test_serialize(self):
+        session = Session()
+        session.conversation.append((Statement('Hello'), Statement('Hi'), ))
+
+        data = session.serialize()
+
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0][0]['text'], 'Hello')
+        self.assertEqual(data[0][1]['text'], 'Hi')
+
+
+class SessionManagerTestCase(TestCase):
+
+    def setUp(self):
+        self.manager = SessionManager(max_sessions=2)
+
+    def test_new(self):
+        session = self.manager.new()
+
+        self.assertIn(session.id, self.manager)
+
+    def test_get_creates_session(self):
+        session = self.manager.get('abc')
+
+        self.assertEqual(session.id, 'abc')
+        self.assertIn('abc', self.manager)
+
+    def test_get_existing_session(self):
+        session = self.manager.new()
+
+        self.assertIs(self.manager.get(session.id), session)
+
+    def test_max_sessions(self):
+        self.manager.get('a')
+        self.manager.get('b')
+        self.manager.get('a')
+        self.manager.get('c')
+
+        self.assertEqual(len(self.manager), 2)
+        self.assertIn('a', self.manager)
+        self.assertNotIn('b', self.manager)
+
+    def test_remove(self):
+        self.manager.get('a')
+        self.manager.remove('a')
+
+        self.assertNotIn('a', self.manager)
+
+    def test_conversation_length(self):
+        manager = SessionManager(conversation_length=3)
+
+        self.assertEqual(manager.new().conversation.maxsize, 3)
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from unittest import TestCase
-from chatterbot.conversation import Statement, Response
+from chatterbot.conversation import Statement, LazyStatement, Response
 
 
 class StatementTests(TestCase):
@@ -83,3 +83,89 @@ class StatementTests(TestCase):
     def test_add_non_response(self):
         with self.assertRaises(Statement.InvalidTypeException):
             self.statement.add_response(Statement("Blah"))
+
+    def test_features_kept_under_one_key(self):
+        self.statement.add_extra_data("test", 1)
+        self.statement.set_feature("lemmas", ["test"])
+
+        self.assertEqual(self.statement.get_feature("lemmas"), ["test"])
+        self.assertIsNone(self.statement.get_feature("synset_tokens"))
+        self.assertEqual(self.statement.extra_data, {
+            "test": 1,
+            Statement.features_key: {"lemmas": ["test"]}
+        })
+
+    def test_remove_features(self):
+        extra_data = {"test": 1, Statement.features_key: {"lemmas": ["test"]}}
+        statement = Statement("Hello", extra_data=extra_data)
+
+        statement.remove_features()
+
+        self.assertEqual(statement.extra_data, {"test": 1})
+        self.assertIn(Statement.features_key, extra_data)
+
+
+class LazyStatementTests(TestCase):
+
+    def setUp(self):
+        self.loaded = []
+        self.statement = LazyStatement(
+            "Hello",
+            self.load,
+            extra_data={'lemmas': ['hello']}
+        )
+
+    def load(self, text):
+        self.loaded.append(text)
+
+        return Statement(
+            text,
+            in_response_to=[Response("Hi")],
+            extra_data={'lemmas': ['old'], 'sentiment_polarity': 0.5}
+        )
+
+    def test_not_loaded_until_used(self):
+        self.assertEqual(self.statement.text, "Hello")
+        self.assertEqual(self.statement.extra_data, {'lemmas': ['hello']})
+        self.assertEqual(self.loaded, [])
+
+    def test_responses_loaded(self):
+        self.assertEqual(self.statement.in_response_to, [Response("Hi")])
+        self.assertEqual(self.loaded, ["Hello"])
+
+    def test_loaded_once(self):
+        self.statement.add_response(Response("Hey"))
+        self.statement.add_response(Response("Hey"))
+
+        self.assertEqual(len(self.statement.in_response_to), 2)
+        self.assertEqual(self.loaded, ["Hello"])
+
+    def test_loaded_extra_data_kept(self):
+        self.statement.load_remaining()
+
+        self.assertEqual(self.statement.extra_data, {
+            'lemmas': ['hello'],
+            'sentiment_polarity': 0.5
+        })
+
+    def test_loaded_features_merged(self):
+        statement = LazyStatement("Hello", lambda text: Statement(
+            text, extra_data={Statement.features_key: {"lemmas": ["hello"]}}
+        ))
+
+        statement.set_feature("synset_tokens", ["hello"])
+        statement.load_remaining()
+
+        self.assertEqual(statement.get_feature("lemmas"), ["hello"])
+        self.assertEqual(statement.get_feature("synset_tokens"), ["hello"])
+
+    def test_serialize(self):
+        data = self.statement.serialize()
+
+        self.assertEqual(data['in_response_to'], [{'text': 'Hi', 'occurrence': 1}])
+        self.assertEqual(data['extra_data']['sentiment_polarity'], 0.5)
+
+    def test_statement_removed(self):
+        statement = LazyStatement("Hello", lambda text: None)
+
+        self.assertEqual(statement.in_response_to, [])
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+from unittest import TestCase
+from chatterbot.corpus import Corpus
+from chatterbot.corpus.compiled import CompiledCorpus, compile_conversations
+import os
+
+
+class CompiledCorpusTestCase(TestCase):
+
+    def setUp(self):
+        import tempfile
+
+        self.directory = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.directory, 'test.corpus.bin')
+        self.conversations = [
+            [u'Hello', u'Hi'],
+            [u'Hi', u'Hello', u'Hi'],
+            [],
+            [u'¿Cómo estás?', u'Très bien, merci.']
+        ]
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.directory)
+
+    def test_compile_and_read(self):
+        count = compile_conversations(self.conversations, self.file_path)
+
+        with CompiledCorpus(self.file_path) as corpus:
+            self.assertEqual(count, 4)
+            self.assertEqual(len(corpus), 4)
+            self.assertEqual(list(corpus), self.conversations)
+
+    def test_strings_stored_once(self):
+        compile_conversations(self.conversations, self.file_path)
+
+        with CompiledCorpus(self.file_path) as corpus:
+            self.assertEqual(corpus.string_count, 4)
+
+    def test_get_item(self):
+        compile_conversations(self.conversations, self.file_path)
+
+        with CompiledCorpus(self.file_path) as corpus:
+            self.assertEqual(corpus[1], [u'Hi', u'Hello', u'Hi'])
+            self.assertEqual(corpus[-1], self.conversations[-1])
+
+            with self.assertRaises(IndexError):
+                corpus[4]
+
+    def test_empty_corpus(self):
+        compile_conversations([], self.file_path)
+
+        with CompiledCorpus(self.file_path) as corpus:
+            self.assertEqual(list(corpus), [])
+
+    def test_invalid_file(self):
+        with open(self.file_path, 'wb') as invalid_file:
+            invalid_file.write(b'{"conversations": []}   ')
+
+        with self.assertRaises(CompiledCorpus.InvalidCorpusFileException):
+            CompiledCorpus(self.file_path)
+
+
+class CorpusCompilationTestCase(TestCase):
+
+    def setUp(self):
+        import tempfile
+        import json
+        import io
+
+        self.corpus = Corpus()
+        self.directory = tempfile.mkdtemp()
+        self.source_path = os.path.join(self.directory, 'test.corpus.json')
+
+        with io.open(self.source_path, 'w', encoding='utf-8') as source_file:
+            source_file.write(json.dumps({'test': [['Hello', 'Hi']]}))
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.directory)
+
+    def test_get_compiled_path(self):
+        self.assertEqual(
+            self.corpus.get_compiled_path('data/test.corpus.jsonl.gz'),
+            'data/test.corpus.bin'
+        )
+
+    def test_compile_corpus(self):
+        compiled_paths = self.corpus.compile_corpus(self.directory)
+
+        self.assertEqual(compiled_paths, [os.path.join(self.directory, 'test.corpus.bin')])
+        self.assertEqual(
+            list(self.corpus.read_conversations(compiled_paths[0])),
+            [['Hello', 'Hi']]
+        )
+
+    def test_compiled_file_used_in_place_of_source(self):
+        compiled_path = self.corpus.compile_corpus(self.directory)[0]
+
+        self.assertEqual(self.corpus.list_corpus_files(self.directory), [compiled_path])
+        self.assertEqual(self.corpus.list_corpus_files(self.source_path), [compiled_path])
+
+    def test_out_of_date_compiled_file_not_used(self):
+        compiled_path = self.corpus.compile_corpus(self.directory)[0]
+
+        # Make the source file newer than the compiled file
+        modified = os.path.getmtime(compiled_path) + 10
+        os.utime(self.source_path, (modified, modified, ))
+
+        self.assertEqual(self.corpus.list_corpus_files(self.directory), [self.source_path])
+
+    def test_compiled_file_without_source(self):
+        compiled_path = self.corpus.compile_corpus(self.directory)[0]
+        os.remove(self.source_path)
+
+        self.assertEqual(self.corpus.list_corpus_files(self.directory), [compiled_path])
@@ -108,4 +108,113 @@ class CorpusLoadingTestCase(TestCase):
     def test_load_corpus_telugu(self):
         corpus = self.corpus.load_corpus('chatterbot.corpus.telugu')
 
-        self.assertTrue(len(corpus))
\ No newline at end of file
+        self.assertTrue(len(corpus))
+
+class CorpusStreamingTestCase(TestCase):
+
+    def setUp(self):
+        import tempfile
+
+        self.corpus = Corpus()
+        self.directory = tempfile.mkdtemp()
+        self.conversations = [
+            [u'Hello', u'Hi'],
+            [u'How are you?', u'I am good, thank you.', u'That is "great"!']
+        ]
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.directory)
+
+    def write_file(self, file_name, text):
+        import gzip
+        import io
+
+        path = os.path.join(self.directory, file_name)
+
+        if file_name.endswith('.gz'):
+            with gzip.open(path, 'wb') as data_file:
+                data_file.write(text.encode('utf-8'))
+        else:
+            with io.open(path, 'w', encoding='utf-8') as data_file:
+                data_file.write(text)
+
+        return path
+
+    def test_read_json_conversations_in_small_chunks(self):
+        from chatterbot.corpus.corpus import read_json_conversations
+        import io
+
+        for file_path in self.corpus.list_corpus_files('chatterbot.corpus'):
+            data = self.corpus.read_corpus(file_path)
+            expected = [
+                conversation for key in data for conversation in data[key]
+            ]
+
+            with io.open(file_path, encoding='utf-8') as data_file:
+                conversations = list(read_json_conversations(data_file, chunk_size=7))
+
+            self.assertEqual(conversations, expected)
+
+    def test_read_json_conversations_invalid_data(self):
+        from chatterbot.corpus.corpus import read_json_conversations
+        import io
+
+        with self.assertRaises(ValueError):
+            list(read_json_conversations(io.StringIO(u'{"a": [["Hi"], ["Hel')))
+
+    def test_read_jsonl_corpus(self):
+        import json
+
+        path = self.write_file('test.corpus.jsonl', u'\n'.join(
+            json.dumps(conversation) for conversation in self.conversations
+        ))
+
+        self.assertEqual(list(self.corpus.read_conversations(path)), self.conversations)
+
+    def test_read_gzip_json_corpus(self):
+        import json
+
+        path = self.write_file(
+            'test.corpus.json.gz', json.dumps({'test': self.conversations})
+        )
+
+        self.assertEqual(list(self.corpus.read_conversations(path)), self.conversations)
+
+    def test_read_gzip_jsonl_corpus(self):
+        import json
+
+        path = self.write_file('test.corpus.jsonl.gz', u'\n'.join(
+            json.dumps(conversation) for conversation in self.conversations
+        ))
+
+        self.assertEqual(list(self.corpus.read_conversations(path)), self.conversations)
+
+    def test_list_corpus_files_with_extension(self):
+        path = self.write_file('test.corpus.jsonl.gz', u'')
+
+        files = self.corpus.list_corpus_files(path[:-len('.corpus.jsonl.gz')])
+
+        self.assertEqual(files, [path])
+
+    def test_list_corpus_files_in_directory(self):
+        self.write_file('a.corpus.json', u'{}')
+        self.write_file('b.corpus.jsonl.gz', u'')
+        self.write_file('c.txt', u'')
+
+        files = self.corpus.list_corpus_files(self.directory)
+
+        self.assertEqual(
+            [os.path.basename(path) for path in files],
+            ['a.corpus.json', 'b.corpus.jsonl.gz']
+        )
+
+    def test_list_corpus_files_with_file_path(self):
+        path = self.write_file('test.corpus.jsonl', u'')
+
+        self.assertEqual(self.corpus.list_corpus_files(path), [path])
+
+    def test_iter_conversations(self):
+        conversations = self.corpus.iter_conversations('chatterbot.corpus.english.greetings')
+
+        self.assertEqual(next(conversations), ['Hello', 'Hi'])
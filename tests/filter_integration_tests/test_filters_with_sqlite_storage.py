@@ -0,0 +1,119 @@
+from tests.base_case import ChatBotSqliteTestCase
+
+
+class RepetitiveResponseFilterTestCase(ChatBotSqliteTestCase):
+
+    def test_filter_selection(self):
+        from chatterbot.filters import RepetitiveResponseFilter
+        from chatterbot.trainers import ListTrainer
+
+        self.chatbot.filters = (RepetitiveResponseFilter(), )
+        self.chatbot.set_trainer(ListTrainer)
+
+        self.chatbot.train([
+            'Hello',
+            'Hi',
+            'Hello',
+            'Hi',
+            'Hello',
+            'Hi, how are you?',
+            'I am good.'
+        ])
+
+        first_response = self.chatbot.get_response('Hello')
+        second_response = self.chatbot.get_response('Hello')
+
+        self.assertEqual(first_response.text, 'Hi')
+        self.assertEqual(second_response.text, 'Hi, how are you?')
+
+    def test_filter_selection_per_session(self):
+        from chatterbot.filters import RepetitiveResponseFilter
+        from chatterbot.trainers import ListTrainer
+
+        self.chatbot.filters = (RepetitiveResponseFilter(), )
+        self.chatbot.set_trainer(ListTrainer)
+
+        self.chatbot.train([
+            'Hello',
+            'Hi',
+            'Hello',
+            'Hi',
+            'Hello',
+            'Hi, how are you?',
+            'I am good.'
+        ])
+
+        first_response = self.chatbot.get_response('Hello', session_id='a')
+        second_response = self.chatbot.get_response('Hello', session_id='b')
+
+        self.assertEqual(first_response.text, 'Hi')
+        self.assertEqual(second_response.text, 'Hi')
+
+
+class ThreadedRepetitiveResponseFilterTestCase(ChatBotSqliteTestCase):
+
+    def get_kwargs(self):
+        kwargs = super(ThreadedRepetitiveResponseFilterTestCase, self).get_kwargs()
+        kwargs['logic_adapter_threads'] = 2
+        return kwargs
+
+    def tearDown(self):
+        self.chatbot.logic.close()
+        super(ThreadedRepetitiveResponseFilterTestCase, self).tearDown()
+
+    def test_filter_selection(self):
+        """
+        The query generated by the filters is used by
+        logic adapters that are run in other threads.
+        """
+        from chatterbot.filters import RepetitiveResponseFilter
+        from chatterbot.trainers import ListTrainer
+
+        self.chatbot.filters = (RepetitiveResponseFilter(), )
+        self.chatbot.set_trainer(ListTrainer)
+
+        self.chatbot.train([
+            'Hello',
+            'Hi',
+            'Hello',
+            'Hi',
+            'Hello',
+            'Hi, how are you?',
+            'I am good.'
+        ])
+
+        first_response = self.chatbot.get_response('Hello')
+        second_response = self.chatbot.get_response('Hello')
+
+        self.assertEqual(first_response.text, 'Hi')
+        self.assertEqual(second_response.text, 'Hi, how are you?')
+
+
+class CustomFilterTestCase(ChatBotSqliteTestCase):
+
+    def test_filter_without_session_id(self):
+        """
+        Filters that were written before sessions were added
+        only accept the chat bot, and are still supported.
+        """
+        from chatterbot.filters import Filter
+        from chatterbot.trainers import ListTrainer
+
+        class ExcludeGreetingFilter(Filter):
+
+            def filter_selection(self, chatterbot):
+                return chatterbot.storage.base_query.statement_text_not_in(['Hi'])
+
+        self.chatbot.filters = (ExcludeGreetingFilter(), )
+        self.chatbot.set_trainer(ListTrainer)
+
+        self.chatbot.train([
+            'Hello',
+            'Hi',
+            'Hello',
+            'Hi, how are you?'
+        ])
+
+        response = self.chatbot.get_response('Hello')
+
+        self.assertEqual(response.text, 'Hi, how are you?')
@@ -91,7 +91,7 @@ class ClosestMatchAdapterTests(TestCase):
         In this case a random response will be returned, but the confidence
         should be zero because it is a random choice.
         """
-        self.adapter.context.storage.update = MagicMock()
+        self.adapter.context.storage.bulk_update = MagicMock()
         self.adapter.context.storage.filter = MagicMock(
             return_value=[]
         )
@@ -103,3 +103,111 @@ class ClosestMatchAdapterTests(TestCase):
 
         self.assertEqual(confidence, 0)
         self.assertEqual(match.text, "Random")
+
+
+    def test_candidates_iterated_once(self):
+        from chatterbot.conversation.comparisons import levenshtein_distance
+
+        # Compare each statement separately instead of as a list
+        self.adapter.compare_statements = lambda statement, other: levenshtein_distance(
+            statement, other
+        )
+
+        self.adapter.context.storage.iter_response_statements = Mock(
+            return_value=iter([
+                Statement("Who do you love?"),
+                Statement("What... is your quest?")
+            ])
+        )
+
+        confidence, match = self.adapter.get(Statement("What is your quest?"))
+
+        self.assertEqual("What... is your quest?", match)
+
+    def test_comparison_extra_data_keys(self):
+        self.adapter.context.storage.iter_response_statements = Mock(return_value=[])
+
+        self.adapter.get_candidates(Statement("What is your quest?"))
+
+        self.adapter.context.storage.iter_response_statements.assert_called_with(())
+
+
+class ClosestMatchAdapterIndexTests(TestCase):
+
+    def setUp(self):
+        from chatterbot.utils.indexes import NgramIndex
+
+        self.adapter = ClosestMatchAdapter(candidate_index=NgramIndex)
+
+        context = MockContext()
+        context.storage.get_response_statements = MagicMock(return_value=[
+            Statement("What... is your quest?"),
+            Statement("What is the meaning of life?")
+        ])
+        context.storage.find_response_statements = lambda texts: [
+            Statement(text) for text in texts
+        ]
+
+        self.adapter.set_context(context)
+
+    def test_index_registered_with_storage(self):
+        index = self.adapter.context.storage.indexes[self.adapter.candidate_index]
+
+        self.assertIn("What... is your quest?", index)
+        self.assertIn("What is the meaning of life?", index)
+
+    def test_get_closest_statement_from_candidates(self):
+        statement = Statement("What is your quest?")
+
+        confidence, match = self.adapter.get(statement)
+
+        self.assertEqual("What... is your quest?", match)
+
+    def test_candidate_limit(self):
+        self.adapter.candidate_limit = 1
+
+        candidates = self.adapter.get_candidates(Statement("What is your quest?"))
+
+        self.assertEqual(len(candidates), 1)
+
+    def test_index_updated(self):
+        self.adapter.context.storage.index_statement(
+            Statement("Bye", in_response_to=[Response("See you later")])
+        )
+        self.adapter.context.storage.unindex_statement("What... is your quest?")
+
+        index = self.adapter.context.storage.indexes[self.adapter.candidate_index]
+
+        self.assertIn("See you later", index)
+        self.assertNotIn("What... is your quest?", index)
+
+
+class ClosestMatchAdapterComparisonFunctionTests(TestCase):
+
+    def test_pairwise_comparison_function(self):
+        """
+        Comparison functions that do not have a batch method
+        should be called once for each possible choice.
+        """
+        confidences = [0.2, 0.9, 0.4]
+        calls = []
+
+        def compare(statement, other_statement):
+            calls.append(other_statement)
+            return confidences[len(calls) - 1]
+
+        adapter = ClosestMatchAdapter(statement_comparison_function=compare)
+        adapter.set_context(MockContext())
+
+        possible_choices = [
+            Statement("A", in_response_to=[Response("B")]),
+            Statement("B", in_response_to=[Response("C")]),
+            Statement("C", in_response_to=[Response("A")]),
+        ]
+        adapter.context.storage.filter = MagicMock(return_value=possible_choices)
+
+        confidence, match = adapter.get(Statement("B"))
+
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(confidence, 0.9)
+        self.assertEqual(match, "B")
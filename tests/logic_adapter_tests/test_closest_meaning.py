@@ -70,7 +70,7 @@ class ClosestMeaningAdapterTests(TestCase):
         In this case a random response will be returned, but the confidence
         should be zero because it is a random choice.
         """
-        self.adapter.context.storage.update = MagicMock()
+        self.adapter.context.storage.bulk_update = MagicMock()
         self.adapter.context.storage.filter = MagicMock(
             return_value=[]
         )
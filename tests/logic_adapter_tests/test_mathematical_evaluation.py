@@ -16,6 +16,18 @@ class MathematicalEvaluationTests(TestCase):
         statement = Statement('What is your favorite song?')
         self.assertFalse(self.adapter.can_process(statement))
 
+    def test_can_process_result_reused(self):
+        from mock import patch
+
+        statement = Statement('What is 10 + 10 + 10?')
+
+        with patch.object(self.adapter, 'evaluate', wraps=self.adapter.evaluate) as evaluate:
+            self.adapter.can_process(statement)
+            confidence, response = self.adapter.process(statement)
+
+        self.assertEqual(evaluate.call_count, 1)
+        self.assertEqual(response.text, '( 10 + ( 10 + 10 ) ) = 30')
+
     def test_is_integer(self):
         self.assertTrue(self.adapter.is_integer(42))
 
@@ -22,6 +22,14 @@ class TestAdapterC(LogicAdapter):
         return 0.7, Statement('Good night.')
 
 
+class SlowAdapter(LogicAdapter):
+
+    def process(self, statement):
+        import time
+        time.sleep(0.5)
+        return 1, Statement('Sorry for the wait.')
+
+
 class MultiLogicAdapterTestCase(ChatBotTestCase):
 
     def setUp(self):
@@ -72,4 +80,181 @@ class MultiLogicAdapterTestCase(ChatBotTestCase):
 
         # Test that all sub adapters have the context set
         for sub_adapter in adapter.adapters:
-            self.assertEqual(sub_adapter.context, self.chatbot)
\ No newline at end of file
+            self.assertEqual(sub_adapter.context, self.chatbot)
+
+
+class ThreadedMultiLogicAdapterTestCase(ChatBotTestCase):
+
+    def setUp(self):
+        super(ThreadedMultiLogicAdapterTestCase, self).setUp()
+        self.adapter = MultiLogicAdapter(logic_adapter_threads=4)
+        self.adapter.set_context(self.chatbot)
+
+    def tearDown(self):
+        self.adapter.close()
+        super(ThreadedMultiLogicAdapterTestCase, self).tearDown()
+
+    def test_sub_adapter_agreement(self):
+        self.adapter.add_adapter(TestAdapterA())
+        self.adapter.add_adapter(TestAdapterB())
+        self.adapter.add_adapter(TestAdapterC())
+
+        confidence, statement = self.adapter.process(Statement('Howdy!'))
+
+        self.assertEqual(confidence, 0.5)
+        self.assertEqual(statement, 'Good morning.')
+
+    def test_adapter_results_in_adapter_order(self):
+        adapters = [TestAdapterC(), TestAdapterA(), TestAdapterB()]
+        for adapter in adapters:
+            self.adapter.add_adapter(adapter)
+
+        results = self.adapter.get_adapter_results(Statement('Howdy!'))
+
+        self.assertEqual([adapter for adapter, result in results], adapters)
+
+    def test_slow_adapter_timeout(self):
+        self.adapter.add_adapter(SlowAdapter(process_timeout=0.1))
+        self.adapter.add_adapter(TestAdapterA())
+
+        confidence, statement = self.adapter.process(Statement('Howdy!'))
+
+        self.assertEqual(confidence, 0.2)
+        self.assertEqual(statement, 'Good morning.')
+
+    def test_slow_adapter_skipped_while_running(self):
+        slow_adapter = SlowAdapter(process_timeout=0.1)
+        self.adapter.add_adapter(slow_adapter)
+        self.adapter.add_adapter(TestAdapterA())
+
+        self.adapter.process(Statement('Howdy!'))
+        results = self.adapter.get_adapter_results(Statement('Howdy!'))
+
+        self.assertEqual(results[0], (slow_adapter, None, ))
+        self.assertIn(slow_adapter, self.adapter.unfinished)
+
+    def test_slow_adapter_run_after_finishing(self):
+        slow_adapter = SlowAdapter(process_timeout=0.1)
+        self.adapter.add_adapter(slow_adapter)
+
+        self.adapter.process(Statement('Howdy!'))
+        self.adapter.unfinished[slow_adapter].wait()
+
+        slow_adapter.process_timeout = None
+        confidence, statement = self.adapter.process(Statement('Howdy!'))
+
+        self.assertEqual(statement, 'Sorry for the wait.')
+
+    def test_slow_adapter_without_timeout(self):
+        self.adapter.add_adapter(SlowAdapter())
+        self.adapter.add_adapter(TestAdapterA())
+
+        confidence, statement = self.adapter.process(Statement('Howdy!'))
+
+        self.assertEqual(confidence, 1)
+        self.assertEqual(statement, 'Sorry for the wait.')
+
+
+class ConfidentAdapter(LogicAdapter):
+
+    def process(self, statement):
+        return 1, Statement('I am sure.')
+
+
+class EveningAdapter(LogicAdapter):
+
+    def process(self, statement):
+        return 0.5, Statement('Good evening.')
+
+
+class ScheduledMultiLogicAdapterTestCase(ChatBotTestCase):
+
+    def setUp(self):
+        super(ScheduledMultiLogicAdapterTestCase, self).setUp()
+        self.adapter = MultiLogicAdapter(confidence_threshold=0.9)
+        self.adapter.set_context(self.chatbot)
+
+    def test_stops_at_confidence_threshold(self):
+        confident_adapter = ConfidentAdapter()
+        other_adapter = TestAdapterA()
+        self.adapter.add_adapter(confident_adapter)
+        self.adapter.add_adapter(other_adapter)
+
+        confidence, statement = self.adapter.process(Statement('Howdy!'))
+
+        self.assertEqual(confidence, 1)
+        self.assertEqual(statement, 'I am sure.')
+        self.assertIn(confident_adapter, self.adapter.costs)
+        self.assertNotIn(other_adapter, self.adapter.costs)
+
+    def test_runs_all_adapters_below_threshold(self):
+        self.adapter.add_adapter(TestAdapterA())
+        self.adapter.add_adapter(TestAdapterB())
+        self.adapter.add_adapter(TestAdapterC())
+
+        confidence, statement = self.adapter.process(Statement('Howdy!'))
+
+        self.assertEqual(confidence, 0.5)
+        self.assertEqual(statement, 'Good morning.')
+
+    def test_cheapest_adapter_runs_first(self):
+        expensive_adapter = TestAdapterA()
+        cheap_adapter = TestAdapterB()
+        self.adapter.add_adapter(expensive_adapter)
+        self.adapter.add_adapter(cheap_adapter)
+
+        self.adapter.costs[expensive_adapter] = 0.5
+        self.adapter.costs[cheap_adapter] = 0.1
+
+        self.assertEqual(
+            self.adapter.get_scheduled_adapters(),
+            [cheap_adapter, expensive_adapter]
+        )
+
+    def test_results_in_adapter_order(self):
+        """
+        Responses with the same confidence are chosen in the order that
+        the adapters were added, not in the order that they were run.
+        """
+        first_adapter = TestAdapterB()
+        second_adapter = EveningAdapter()
+        self.adapter.add_adapter(first_adapter)
+        self.adapter.add_adapter(second_adapter)
+
+        self.adapter.costs[first_adapter] = 0.5
+        self.adapter.costs[second_adapter] = 0.1
+
+        results = self.adapter.get_adapter_results(Statement('Howdy!'))
+        confidence, statement = self.adapter.process(Statement('Howdy!'))
+
+        self.assertEqual([adapter for adapter, result in results], [first_adapter, second_adapter])
+        self.assertEqual(statement, 'Good morning.')
+
+    def test_unmeasured_adapter_runs_first(self):
+        measured_adapter = TestAdapterA()
+        new_adapter = TestAdapterB()
+        self.adapter.add_adapter(measured_adapter)
+        self.adapter.add_adapter(new_adapter)
+
+        self.adapter.costs[measured_adapter] = 0.1
+
+        self.assertEqual(self.adapter.get_scheduled_adapters()[0], new_adapter)
+
+    def test_record_cost(self):
+        adapter = TestAdapterA()
+
+        self.adapter.record_cost(adapter, 1.0)
+        self.adapter.record_cost(adapter, 2.0, weight=0.5)
+
+        self.assertEqual(self.adapter.costs[adapter], 1.5)
+
+    def test_order_kept_without_threshold(self):
+        adapter = MultiLogicAdapter()
+        first_adapter = TestAdapterA()
+        second_adapter = TestAdapterB()
+        adapter.add_adapter(first_adapter)
+        adapter.add_adapter(second_adapter)
+
+        adapter.costs[first_adapter] = 0.5
+
+        self.assertEqual(adapter.get_scheduled_adapters(), [first_adapter, second_adapter])
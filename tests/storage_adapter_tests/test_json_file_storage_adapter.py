@@ -221,6 +221,38 @@ class JsonFileStorageAdapterTestCase(JsonAdapterTestCase):
         self.assertIn("This is a phone.", responses)
         self.assertIn("A what?", responses)
 
+    def test_get_response_statements_reads_file_once(self):
+        from mock import patch
+
+        self.adapter.update(Statement("Hello", in_response_to=[Response("Hi")]))
+        self.adapter.update(Statement("Hey", in_response_to=[Response("Hello")]))
+        self.adapter.get_response_statements()
+
+        database = self.adapter.database
+        with patch.object(database, 'read_data', wraps=database.read_data) as read_data:
+            responses = self.adapter.get_response_statements()
+
+        self.assertEqual(len(responses), 2)
+        self.assertEqual(read_data.call_count, 1)
+
+    def test_get_response_statements_after_update(self):
+        self.adapter.update(Statement("Hi"))
+        self.adapter.get_response_statements()
+
+        self.adapter.update(Statement("Hello", in_response_to=[Response("Hi")]))
+        responses = self.adapter.get_response_statements()
+
+        self.assertEqual(len(responses), 1)
+        self.assertIn("Hi", responses)
+
+    def test_get_response_statements_after_remove(self):
+        self.adapter.update(Statement("Hello", in_response_to=[Response("Hi")]))
+        self.adapter.get_response_statements()
+
+        self.adapter.remove("Hello")
+
+        self.assertEqual(self.adapter.get_response_statements(), [])
+
 
 class JsonFileStorageAdapterFilterTestCase(JsonAdapterTestCase):
 
@@ -34,6 +34,67 @@ class MongoAdapterTestCase(TestCase):
         self.adapter.drop()
 
 
+class MongoOperationsTestCase(TestCase):
+    """
+    Tests for the operations that the Mongo storage adapters share,
+    which do not need a connection to a database.
+    """
+
+    def test_get_new_responses(self):
+        from chatterbot.adapters.storage.mongodb import get_occurrences, get_new_responses
+
+        extra_data, occurrences = get_occurrences([
+            Statement('Hi', in_response_to=[Response('Hello'), Response('Hey')])
+        ])
+        documents = [{'text': 'Hi', 'in_response_to': [{'text': 'Hello'}]}]
+
+        self.assertEqual(get_new_responses(occurrences, documents), [('Hi', 'Hey', )])
+
+    def test_learned_responders_counted(self):
+        from chatterbot.adapters.storage.mongodb import get_learned_responder_operations
+        from mock import MagicMock
+
+        result = MagicMock(modified_count=1)
+
+        operations, recount = get_learned_responder_operations(
+            result, [None], [('Hi', 'Hello', )]
+        )
+
+        self.assertEqual(len(operations), 1)
+        self.assertEqual(recount, [])
+
+    def test_learned_responders_recounted(self):
+        from chatterbot.adapters.storage.mongodb import get_learned_responder_operations
+        from mock import MagicMock
+
+        result = MagicMock(modified_count=0)
+
+        operations, recount = get_learned_responder_operations(
+            result, [None], [('Hi', 'Hello', )]
+        )
+
+        self.assertEqual(operations, [])
+        self.assertEqual(recount, ['Hello'])
+
+    def test_iter_responder_count_operations(self):
+        from chatterbot.adapters.storage.mongodb import iter_responder_count_operations
+
+        operations = list(iter_responder_count_operations(
+            [{'_id': 'Hello', 'count': 2}], ['Hello', 'Hey']
+        ))
+
+        self.assertEqual(
+            [operation._doc for operation in operations],
+            [
+                {
+                    '$set': {'responder_count': 2},
+                    '$setOnInsert': {'in_response_to': [], 'extra_data': {}}
+                },
+                {'$set': {'responder_count': 0}}
+            ]
+        )
+
+
 class MongoDatabaseAdapterTestCase(MongoAdapterTestCase):
 
     def test_count_returns_zero(self):
@@ -238,6 +299,213 @@ class MongoDatabaseAdapterTestCase(MongoAdapterTestCase):
         self.assertIn("This is a phone.", responses)
         self.assertIn("A what?", responses)
 
+    def test_iter_response_statements_projection(self):
+        self.adapter.update(Statement(
+            "This is a phone.",
+            extra_data={'lemmas': ['phone'], 'notes': 'A large value'}
+        ))
+        self.adapter.update(Statement("A what?", in_response_to=[Response("This is a phone.")]))
+
+        statements = list(self.adapter.iter_response_statements(('lemmas', )))
+
+        self.assertEqual(len(statements), 1)
+        self.assertEqual(statements[0].text, "This is a phone.")
+        self.assertEqual(statements[0].extra_data, {'lemmas': ['phone']})
+        self.assertFalse(statements[0].loaded)
+
+        statements[0].load_remaining()
+
+        self.assertEqual(statements[0].extra_data['notes'], 'A large value')
+
+
+class MongoAdapterResponderCountTestCase(MongoAdapterTestCase):
+
+    def get_responder_count(self, text):
+        document = self.adapter.statements.find_one({'text': text})
+        return document.get('responder_count', 0)
+
+    def test_update_counts_responders(self):
+        self.adapter.update(Statement("Hi", in_response_to=[Response("Hello")]))
+        self.adapter.update(Statement("Hey", in_response_to=[Response("Hello")]))
+
+        self.assertEqual(self.get_responder_count("Hello"), 2)
+        self.assertEqual(self.get_responder_count("Hi"), 0)
+
+    def test_count_response_statements(self):
+        self.adapter.update(Statement("Hi", in_response_to=[Response("Hello")]))
+        self.adapter.update(Statement("Hey", in_response_to=[Response("Hello")]))
+
+        self.assertEqual(self.adapter.count_response_statements(), 1)
+
+    def test_update_same_response_counted_once(self):
+        statement = Statement("Hi", in_response_to=[Response("Hello")])
+        self.adapter.update(statement)
+
+        statement.add_response(Response("Hello"))
+        self.adapter.update(statement)
+
+        self.assertEqual(self.get_responder_count("Hello"), 1)
+
+    def test_update_removed_response(self):
+        statement = Statement("Hi", in_response_to=[Response("Hello")])
+        self.adapter.update(statement)
+
+        statement.remove_response("Hello")
+        self.adapter.update(statement)
+
+        self.assertEqual(self.get_responder_count("Hello"), 0)
+        self.assertEqual(self.adapter.get_response_statements(), [])
+
+    def test_bulk_update_counts_responders(self):
+        self.adapter.bulk_update([
+            Statement("Hi", in_response_to=[Response("Hello")]),
+            Statement("Hi", in_response_to=[Response("Hello")]),
+            Statement("Hey", in_response_to=[Response("Hello")])
+        ])
+
+        self.assertEqual(self.get_responder_count("Hello"), 2)
+
+    def test_remove_responder(self):
+        self.adapter.update(Statement("Hi", in_response_to=[Response("Hello")]))
+        self.adapter.remove("Hi")
+
+        self.assertEqual(self.get_responder_count("Hello"), 0)
+
+    def test_responder_count_not_in_extra_data(self):
+        self.adapter.update(Statement("Hi", in_response_to=[Response("Hello")]))
+
+        statement = self.adapter.find("Hello")
+
+        self.assertEqual(statement.extra_data, {})
+
+    def test_migrate(self):
+        self.adapter.statements.insert_many([
+            {'text': 'Hi', 'in_response_to': [{'text': 'Hello', 'occurrence': 1}], 'extra_data': {}},
+            {'text': 'Hey', 'in_response_to': [{'text': 'Hello', 'occurrence': 2}], 'extra_data': {}},
+        ])
+
+        self.adapter.migrate()
+
+        self.assertEqual(self.get_responder_count("Hello"), 2)
+        self.assertEqual(self.get_responder_count("Hi"), 0)
+        self.assertEqual(self.adapter.get_response_statements(), [Statement("Hello")])
+
+
+class MongoAdapterBulkUpdateTestCase(MongoAdapterTestCase):
+
+    def test_bulk_update_adds_statements(self):
+        self.adapter.bulk_update([
+            Statement("Hi", in_response_to=[Response("Hello")]),
+            Statement("Hey")
+        ])
+
+        self.assertEqual(self.adapter.count(), 3)
+        self.assertIn("Hello", self.adapter.find("Hi").in_response_to)
+
+    def test_bulk_update_adds_occurrence(self):
+        self.adapter.update(Statement("Hi", in_response_to=[Response("Hello")]))
+
+        self.adapter.bulk_update([
+            Statement("Hi", in_response_to=[Response("Hello", occurrence=2)])
+        ])
+
+        self.assertEqual(self.adapter.find("Hi").in_response_to[0].occurrence, 3)
+
+    def test_bulk_update_adds_occurrence_of_repeated_statement(self):
+        self.adapter.bulk_update([
+            Statement("Hi", in_response_to=[Response("Hello")]),
+            Statement("Hi", in_response_to=[Response("Hello")])
+        ])
+
+        statement = self.adapter.find("Hi")
+
+        self.assertEqual(len(statement.in_response_to), 1)
+        self.assertEqual(statement.in_response_to[0].occurrence, 2)
+
+    def test_bulk_update_keeps_saved_responses(self):
+        self.adapter.update(Statement("Hi", in_response_to=[Response("Hello")]))
+
+        self.adapter.bulk_update([
+            Statement("Hi", in_response_to=[Response("Hey")])
+        ])
+
+        self.assertEqual(len(self.adapter.find("Hi").in_response_to), 2)
+
+    def test_bulk_update_merges_extra_data(self):
+        self.adapter.update(Statement("Hi", extra_data={"a": 1}))
+
+        self.adapter.bulk_update([Statement("Hi", extra_data={"b": 2})])
+
+        self.assertEqual(self.adapter.find("Hi").extra_data, {"a": 1, "b": 2})
+
+    def test_bulk_update_read_only(self):
+        self.adapter.read_only = True
+
+        self.adapter.bulk_update([Statement("Hi")])
+
+        self.assertEqual(self.adapter.count(), 0)
+
+    def test_count_responders(self):
+        self.adapter.bulk_update([
+            Statement("Hi", in_response_to=[Response("Hello")]),
+            Statement("Hey", in_response_to=[Response("Hello")])
+        ])
+        self.adapter.statements.update_one(
+            {'text': 'Hello'}, {'$set': {'responder_count': 5}}
+        )
+
+        self.adapter.count_responders(['Hello'])
+
+        document = self.adapter.statements.find_one({'text': 'Hello'})
+
+        self.assertEqual(document['responder_count'], 2)
+
+
+class MongoAdapterTenantTestCase(MongoAdapterTestCase):
+
+    def setUp(self):
+        super(MongoAdapterTenantTestCase, self).setUp()
+
+        self.first_tenant = MongoDatabaseAdapter(database='test_db', tenant='first')
+        self.second_tenant = MongoDatabaseAdapter(database='test_db', tenant='second')
+
+    def test_client_is_shared(self):
+        self.assertIs(self.first_tenant.client, self.adapter.client)
+        self.assertIs(self.second_tenant.client, self.adapter.client)
+
+    def test_pool_size_uses_separate_client(self):
+        adapter = MongoDatabaseAdapter(database='test_db', max_pool_size=5)
+
+        self.assertIsNot(adapter.client, self.adapter.client)
+        self.assertIs(
+            adapter.client,
+            MongoDatabaseAdapter(database='test_db', max_pool_size=5).client
+        )
+
+    def test_statements_are_separate(self):
+        self.first_tenant.update(Statement('Hi'))
+
+        self.assertEqual(self.first_tenant.count(), 1)
+        self.assertEqual(self.second_tenant.count(), 0)
+        self.assertIsNone(self.second_tenant.find('Hi'))
+
+    def test_indexes_created_when_used(self):
+        self.first_tenant.count()
+
+        index_names = self.first_tenant.collection.index_information()
+
+        self.assertIn('text_1', index_names)
+        self.assertIn('responder_count_1', index_names)
+
+    def test_drop_tenant(self):
+        self.first_tenant.update(Statement('Hi'))
+        self.second_tenant.update(Statement('Hi'))
+
+        self.first_tenant.drop()
+
+        self.assertEqual(self.first_tenant.count(), 0)
+        self.assertEqual(self.second_tenant.count(), 1)
+
 
 class MongoAdapterFilterTestCase(MongoAdapterTestCase):
 
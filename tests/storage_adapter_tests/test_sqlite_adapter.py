@@ -0,0 +1,567 @@
+from unittest import TestCase
+from chatterbot.adapters.storage import SqliteStorageAdapter
+from chatterbot.conversation import Statement, Response
+
+
+class SqliteAdapterTestCase(TestCase):
+
+    def setUp(self):
+        """
+        Instantiate the adapter.
+        """
+        from random import randint
+
+        # Generate a random name for the database
+        database_name = str(randint(0, 9000))
+
+        self.adapter = SqliteStorageAdapter(
+            database=database_name + '.sqlite3'
+        )
+
+    def tearDown(self):
+        """
+        Remove the test database.
+        """
+        self.adapter.drop()
+
+
+class SqliteStorageAdapterTestCase(SqliteAdapterTestCase):
+
+    def test_count_returns_zero(self):
+        """
+        The count method should return a value of 0
+        when nothing has been saved to the database.
+        """
+        self.assertEqual(self.adapter.count(), 0)
+
+    def test_count_returns_value(self):
+        """
+        The count method should return a value of 1
+        when one item has been saved to the database.
+        """
+        statement = Statement("Test statement")
+        self.adapter.update(statement)
+        self.assertEqual(self.adapter.count(), 1)
+
+    def test_statement_not_found(self):
+        """
+        Test that None is returned by the find method
+        when a matching statement is not found.
+        """
+        self.assertEqual(self.adapter.find("Non-existant"), None)
+
+    def test_statement_found(self):
+        """
+        Test that a matching statement is returned
+        when it exists in the database.
+        """
+        statement = Statement("New statement")
+        self.adapter.update(statement)
+
+        found_statement = self.adapter.find("New statement")
+        self.assertNotEqual(found_statement, None)
+        self.assertEqual(found_statement.text, statement.text)
+
+    def test_update_adds_new_statement(self):
+        statement = Statement("New statement")
+        self.adapter.update(statement)
+
+        statement_found = self.adapter.find("New statement")
+        self.assertNotEqual(statement_found, None)
+        self.assertEqual(statement_found.text, statement.text)
+
+    def test_update_modifies_existing_statement(self):
+        statement = Statement("New statement")
+        self.adapter.update(statement)
+
+        # Check the initial values
+        found_statement = self.adapter.find(statement.text)
+        self.assertEqual(
+            len(found_statement.in_response_to), 0
+        )
+
+        # Update the statement value
+        statement.add_response(
+            Response("New response")
+        )
+        self.adapter.update(statement)
+
+        # Check that the values have changed
+        found_statement = self.adapter.find(statement.text)
+        self.assertEqual(
+            len(found_statement.in_response_to), 1
+        )
+
+    def test_usable_after_drop(self):
+        self.adapter.update(Statement("Hi", in_response_to=[Response("Hello")]))
+
+        self.adapter.drop()
+
+        self.assertEqual(self.adapter.count(), 0)
+
+        self.adapter.update(Statement("Hi"))
+
+        self.assertEqual(self.adapter.count(), 1)
+
+    def test_get_random_returns_statement(self):
+        statement = Statement("New statement")
+        self.adapter.update(statement)
+
+        random_statement = self.adapter.get_random()
+        self.assertEqual(random_statement.text, statement.text)
+
+    def test_get_random_empty_database(self):
+        with self.assertRaises(self.adapter.EmptyDatabaseException):
+            self.adapter.get_random()
+
+    def test_get_random_statements_excludes_removed_statements(self):
+        for number in range(0, 10):
+            self.adapter.update(Statement(str(number)))
+
+        for number in range(0, 10, 2):
+            self.adapter.remove(str(number))
+
+        texts = set(statement.text for statement in self.adapter.get_random_statements(50))
+
+        self.assertTrue(texts)
+        self.assertTrue(texts.issubset(set(['1', '3', '5', '7', '9'])))
+
+    def test_find_returns_nested_responses(self):
+        response_list = [
+            Response("Yes"),
+            Response("No")
+        ]
+        statement = Statement(
+            "Do you like this?",
+            in_response_to=response_list
+        )
+        self.adapter.update(statement)
+
+        result = self.adapter.find(statement.text)
+
+        self.assertIn("Yes", result.in_response_to)
+        self.assertIn("No", result.in_response_to)
+
+    def test_multiple_responses_added_on_update(self):
+        statement = Statement(
+            "You are welcome.",
+            in_response_to=[
+                Response("Thank you."),
+                Response("Thanks.")
+            ]
+        )
+        self.adapter.update(statement)
+        result = self.adapter.find(statement.text)
+
+        self.assertEqual(len(result.in_response_to), 2)
+        self.assertIn(statement.in_response_to[0], result.in_response_to)
+        self.assertIn(statement.in_response_to[1], result.in_response_to)
+
+    def test_update_saves_statement_with_multiple_responses(self):
+        statement = Statement(
+            "You are welcome.",
+            in_response_to=[
+                Response("Thank you."),
+                Response("Thanks."),
+            ]
+        )
+        self.adapter.update(statement)
+        response = self.adapter.find(statement.text)
+
+        self.assertEqual(len(response.in_response_to), 2)
+
+    def test_getting_and_updating_statement(self):
+        statement = Statement("Hi")
+        self.adapter.update(statement)
+
+        statement.add_response(Response("Hello"))
+        statement.add_response(Response("Hello"))
+        self.adapter.update(statement)
+
+        response = self.adapter.find(statement.text)
+
+        self.assertEqual(len(response.in_response_to), 1)
+        self.assertEqual(response.in_response_to[0].occurrence, 2)
+
+
+    def test_remove(self):
+        text = "Sometimes you have to run before you can walk."
+        statement = Statement(text)
+        self.adapter.update(statement)
+        self.adapter.remove(statement.text)
+        result = self.adapter.find(text)
+
+        self.assertIsNone(result)
+
+    def test_remove_response(self):
+        text = "Sometimes you have to run before you can walk."
+        statement = Statement(
+            "A test flight is not recommended at this design phase.",
+            in_response_to=[Response(text)]
+        )
+        self.adapter.update(statement)
+        self.adapter.remove(statement.text)
+        results = self.adapter.filter(in_response_to__contains=text)
+
+        self.assertEqual(results, [])
+
+    def test_get_response_statements(self):
+        """
+        Test that we are able to get a list of only statements
+        that are known to be in response to another statement.
+        """
+        statement_list = [
+            Statement("What... is your quest?"),
+            Statement("This is a phone."),
+            Statement("A what?", in_response_to=[Response("This is a phone.")]),
+            Statement("A phone.", in_response_to=[Response("A what?")])
+        ]
+
+        for statement in statement_list:
+            self.adapter.update(statement)
+
+        responses = self.adapter.get_response_statements()
+
+        self.assertEqual(len(responses), 2)
+        self.assertIn("This is a phone.", responses)
+        self.assertIn("A what?", responses)
+
+    def test_find_response_statements(self):
+        self.adapter.update(Statement("A what?", in_response_to=[Response("This is a phone.")]))
+        self.adapter.update(Statement("A phone.", in_response_to=[Response("A what?")]))
+
+        results = self.adapter.find_response_statements(
+            ["A what?", "A phone.", "Missing", "This is a phone."]
+        )
+
+        self.assertEqual(results, ["A what?", "This is a phone."])
+
+
+class SqliteStorageAdapterIndexTestCase(SqliteAdapterTestCase):
+
+    def setUp(self):
+        from chatterbot.utils.indexes import NgramIndex
+
+        super(SqliteStorageAdapterIndexTestCase, self).setUp()
+
+        self.adapter.update(Statement("Hi", in_response_to=[Response("Hello there")]))
+        self.adapter.update(Statement("Hey", in_response_to=[Response("Hello friend")]))
+
+        self.index = self.adapter.add_index(NgramIndex)
+
+    def test_search_index(self):
+        from chatterbot.utils.indexes import NgramIndex
+
+        results = self.adapter.search_index(NgramIndex, Statement("Hello there"))
+
+        self.assertEqual(results[0], "Hello there")
+        self.assertEqual(len(results), 2)
+
+    def test_search_index_removes_statement_without_responders(self):
+        from chatterbot.utils.indexes import NgramIndex
+
+        self.adapter.update(Statement("Hi"))
+
+        results = self.adapter.search_index(NgramIndex, Statement("Hello there"))
+
+        self.assertEqual(results, ["Hello friend"])
+        self.assertNotIn("Hello there", self.index)
+
+    def test_count_response_statements(self):
+        self.assertEqual(self.adapter.count_response_statements(), 2)
+
+    def test_search_index_finds_statement_saved_by_other_adapter(self):
+        from chatterbot.utils.indexes import NgramIndex
+
+        other_adapter = SqliteStorageAdapter(database=self.adapter.database_path)
+        other_adapter.update(Statement("Sunny", in_response_to=[Response("Hello weather")]))
+
+        results = self.adapter.search_index(NgramIndex, Statement("Hello weather"))
+
+        self.assertEqual(results[0], "Hello weather")
+        self.assertIn("Hello weather", self.index)
+
+    def test_search_index_forgets_statement_removed_by_other_adapter(self):
+        from chatterbot.utils.indexes import NgramIndex
+
+        other_adapter = SqliteStorageAdapter(database=self.adapter.database_path)
+        other_adapter.remove("Hi")
+
+        results = self.adapter.search_index(NgramIndex, Statement("Hello there"))
+
+        self.assertEqual(results, ["Hello friend"])
+        self.assertNotIn("Hello there", self.index)
+
+    def test_drop_clears_indexes(self):
+        self.adapter.drop()
+
+        self.assertEqual(len(self.index), 0)
+
+
+class SqliteStorageAdapterFilterTestCase(SqliteAdapterTestCase):
+
+    def setUp(self):
+        super(SqliteStorageAdapterFilterTestCase, self).setUp()
+
+        self.statement1 = Statement(
+            "Testing...",
+            in_response_to=[
+                Response("Why are you counting?")
+            ]
+        )
+        self.statement2 = Statement(
+            "Testing one, two, three.",
+            in_response_to=[
+                Response("Testing...")
+            ]
+        )
+
+    def test_filter_text_no_matches(self):
+        self.adapter.update(self.statement1)
+        results = self.adapter.filter(text="Howdy")
+
+        self.assertEqual(len(results), 0)
+
+    def test_filter_in_response_to_no_matches(self):
+        self.adapter.update(self.statement1)
+
+        results = self.adapter.filter(
+            in_response_to=[Response("Maybe")]
+        )
+        self.assertEqual(len(results), 0)
+
+    def test_filter_equal_results(self):
+        statement1 = Statement(
+            "Testing...",
+            in_response_to=[]
+        )
+        statement2 = Statement(
+            "Testing one, two, three.",
+            in_response_to=[]
+        )
+        self.adapter.update(statement1)
+        self.adapter.update(statement2)
+
+        results = self.adapter.filter(in_response_to=[])
+        self.assertEqual(len(results), 2)
+        self.assertIn(statement1, results)
+        self.assertIn(statement2, results)
+
+    def test_filter_contains_result(self):
+        self.adapter.update(self.statement1)
+        self.adapter.update(self.statement2)
+
+        results = self.adapter.filter(
+            in_response_to__contains="Why are you counting?"
+        )
+        self.assertEqual(len(results), 1)
+        self.assertIn(self.statement1, results)
+
+    def test_filter_contains_no_result(self):
+        self.adapter.update(self.statement1)
+
+        results = self.adapter.filter(
+            in_response_to__contains="How do you do?"
+        )
+        self.assertEqual(results, [])
+
+    def test_filter_multiple_parameters(self):
+        self.adapter.update(self.statement1)
+        self.adapter.update(self.statement2)
+
+        results = self.adapter.filter(
+            text="Testing...",
+            in_response_to__contains="Why are you counting?"
+        )
+
+        self.assertEqual(len(results), 1)
+        self.assertIn(self.statement1, results)
+
+    def test_filter_multiple_parameters_no_results(self):
+        self.adapter.update(self.statement1)
+        self.adapter.update(self.statement2)
+
+        results = self.adapter.filter(
+            text="Test",
+            in_response_to__contains="Not an existing response."
+        )
+
+        self.assertEqual(len(results), 0)
+
+    def test_filter_no_parameters(self):
+        """
+        If no parameters are passed to the filter,
+        then all statements should be returned.
+        """
+        statement1 = Statement("Testing...")
+        statement2 = Statement("Testing one, two, three.")
+        self.adapter.update(statement1)
+        self.adapter.update(statement2)
+
+        results = self.adapter.filter()
+
+        self.assertEqual(len(results), 2)
+
+    def test_filter_returns_statement_with_multiple_responses(self):
+        statement = Statement(
+            "You are welcome.",
+            in_response_to=[
+                Response("Thanks."),
+                Response("Thank you.")
+            ]
+        )
+        self.adapter.update(statement)
+        response = self.adapter.filter(
+            in_response_to__contains="Thanks."
+        )
+
+        # Get the first response
+        response = response[0]
+
+        self.assertEqual(len(response.in_response_to), 2)
+
+    def test_response_list_in_results(self):
+        """
+        If a statement with response values is found using
+        the filter method, they should be returned as
+        response objects.
+        """
+        statement = Statement(
+            "The first is to help yourself, the second is to help others.",
+            in_response_to=[
+                Response("Why do people have two hands?")
+            ]
+        )
+        self.adapter.update(statement)
+        found = self.adapter.filter(text=statement.text)
+
+        self.assertEqual(len(found[0].in_response_to), 1)
+        self.assertEqual(type(found[0].in_response_to[0]), Response)
+
+
+class ReadOnlySqliteStorageAdapterTestCase(SqliteAdapterTestCase):
+
+    def test_update_does_not_add_new_statement(self):
+        self.adapter.read_only = True
+
+        statement = Statement("New statement")
+        self.adapter.update(statement)
+
+        statement_found = self.adapter.find("New statement")
+        self.assertEqual(statement_found, None)
+
+    def test_update_does_not_modify_existing_statement(self):
+        statement = Statement("New statement")
+        self.adapter.update(statement)
+
+        self.adapter.read_only = True
+
+        statement.add_response(
+            Response("New response")
+        )
+
+        self.adapter.update(statement)
+
+        statement_found = self.adapter.find("New statement")
+        self.assertEqual(statement_found.text, statement.text)
+        self.assertEqual(
+            len(statement_found.in_response_to), 0
+        )
+
+
+class SqliteStorageAdapterTransactionTestCase(SqliteAdapterTestCase):
+
+    def test_updates_saved_in_transaction(self):
+        with self.adapter.transaction():
+            self.adapter.update(Statement("Hi"))
+            self.adapter.update(Statement("Hello", in_response_to=[Response("Hi")]))
+
+        self.assertEqual(self.adapter.count(), 2)
+        self.assertEqual(self.adapter.transaction_depth, 0)
+
+    def test_transaction_rolled_back_on_error(self):
+        with self.assertRaises(ValueError):
+            with self.adapter.transaction():
+                self.adapter.update(Statement("Hi"))
+                raise ValueError()
+
+        self.assertEqual(self.adapter.count(), 0)
+
+    def test_remove_deletes_responses(self):
+        self.adapter.update(Statement("Hello", in_response_to=[Response("Hi")]))
+        self.adapter.remove("Hello")
+
+        count = self.adapter.connection.execute('SELECT COUNT(*) FROM response').fetchone()[0]
+
+        self.assertEqual(count, 0)
+
+
+class SqliteStorageAdapterBaseQueryTestCase(SqliteAdapterTestCase):
+
+    def test_base_query_excludes_statements(self):
+        self.adapter.update(Statement("Hi"))
+        self.adapter.update(Statement("Hello"))
+
+        self.adapter.base_query = self.adapter.base_query.statement_text_not_in(["Hi"])
+
+        self.assertIsNone(self.adapter.find("Hi"))
+        self.assertEqual(len(self.adapter.filter()), 1)
+
+    def test_base_query_is_not_shared_between_threads(self):
+        from threading import Thread
+
+        self.adapter.update(Statement("Hi"))
+
+        self.adapter.base_query = self.adapter.base_query.statement_text_not_in(["Hi"])
+
+        results = []
+        thread = Thread(target=lambda: results.append(self.adapter.find("Hi")))
+        thread.start()
+        thread.join()
+
+        self.assertEqual(results, [Statement("Hi")])
+        self.assertIsNone(self.adapter.find("Hi"))
+
+
+class SqliteStorageAdapterBulkUpdateTestCase(SqliteAdapterTestCase):
+
+    def test_bulk_update_adds_statements(self):
+        self.adapter.bulk_update([
+            Statement("Hi", in_response_to=[Response("Hello")]),
+            Statement("Hey")
+        ])
+
+        self.assertEqual(self.adapter.count(), 3)
+        self.assertIn("Hello", self.adapter.find("Hi").in_response_to)
+
+    def test_bulk_update_adds_occurrence(self):
+        self.adapter.update(Statement("Hi", in_response_to=[Response("Hello")]))
+
+        self.adapter.bulk_update([
+            Statement("Hi", in_response_to=[Response("Hello", occurrence=2)])
+        ])
+
+        self.assertEqual(self.adapter.find("Hi").in_response_to[0].occurrence, 3)
+
+    def test_bulk_update_keeps_saved_responses(self):
+        self.adapter.update(Statement("Hi", in_response_to=[Response("Hello")]))
+
+        self.adapter.bulk_update([
+            Statement("Hi", in_response_to=[Response("Hey")])
+        ])
+
+        self.assertEqual(len(self.adapter.find("Hi").in_response_to), 2)
+
+    def test_bulk_update_merges_extra_data(self):
+        self.adapter.update(Statement("Hi", extra_data={"a": 1}))
+
+        self.adapter.bulk_update([Statement("Hi", extra_data={"b": 2})])
+
+        self.assertEqual(self.adapter.find("Hi").extra_data, {"a": 1, "b": 2})
+
+    def test_bulk_update_read_only(self):
+        self.adapter.read_only = True
+
+        self.adapter.bulk_update([Statement("Hi")])
+
+        self.assertEqual(self.adapter.count(), 0)
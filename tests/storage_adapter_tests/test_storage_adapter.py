@@ -45,3 +45,94 @@ class StorageAdapterTestCase(TestCase):
     def test_drop(self):
         with self.assertRaises(StorageAdapter.AdapterMethodNotImplementedError):
             self.adapter.drop()
+
+
+class StorageAdapterAnnotatorTestCase(TestCase):
+
+    def setUp(self):
+        super(StorageAdapterAnnotatorTestCase, self).setUp()
+        self.adapter = StorageAdapter()
+
+    def annotator(self, statement):
+        statement.add_extra_data('length', len(statement.text))
+
+    def test_add_annotator(self):
+        self.adapter.add_annotator(self.annotator)
+        self.adapter.add_annotator(self.annotator)
+
+        self.assertEqual(len(self.adapter.annotators), 1)
+
+    def test_annotate(self):
+        statement = Statement('Hello')
+
+        self.adapter.add_annotator(self.annotator)
+        self.adapter.annotate(statement)
+
+        self.assertEqual(statement.extra_data['length'], 5)
+
+    def test_backfill(self):
+        from mock import MagicMock
+
+        statements = [Statement('Hello'), Statement('Hi')]
+
+        self.adapter.filter = MagicMock(return_value=statements)
+        self.adapter.update = MagicMock()
+
+        self.adapter.backfill()
+
+        self.assertEqual(self.adapter.update.call_count, 2)
+
+
+class StorageAdapterBulkUpdateTestCase(TestCase):
+
+    def setUp(self):
+        super(StorageAdapterBulkUpdateTestCase, self).setUp()
+        self.adapter = StorageAdapter()
+
+    def test_merge_statement_data_not_saved(self):
+        statement = Statement('Hi', in_response_to=[Response('Hello')])
+
+        data = self.adapter.merge_statement_data(None, statement)
+
+        self.assertEqual(data['text'], 'Hi')
+        self.assertEqual(data['in_response_to'], [{'text': 'Hello', 'occurrence': 1}])
+
+    def test_merge_statement_data_adds_occurrence(self):
+        saved = Statement('Hi', in_response_to=[
+            Response('Hello', occurrence=2),
+            Response('Hey')
+        ], extra_data={'a': 1})
+        statement = Statement('Hi', in_response_to=[
+            Response('Hello', occurrence=3),
+            Response('Howdy')
+        ], extra_data={'b': 2})
+
+        data = self.adapter.merge_statement_data(saved, statement)
+
+        self.assertEqual(data['in_response_to'], [
+            {'text': 'Hello', 'occurrence': 5},
+            {'text': 'Hey', 'occurrence': 1},
+            {'text': 'Howdy', 'occurrence': 1}
+        ])
+        self.assertEqual(data['extra_data'], {'a': 1, 'b': 2})
+
+    def test_merge_statement_data_does_not_modify_saved_data(self):
+        saved = {'text': 'Hi', 'in_response_to': [{'text': 'Hello', 'occurrence': 1}]}
+
+        self.adapter.merge_statement_data(saved, Statement('Hi', in_response_to=[Response('Hello')]))
+
+        self.assertEqual(saved['in_response_to'][0]['occurrence'], 1)
+
+    def test_bulk_update(self):
+        from mock import MagicMock
+
+        self.adapter.find = MagicMock(
+            return_value=Statement('Hi', in_response_to=[Response('Hello')])
+        )
+        self.adapter.update = MagicMock()
+
+        self.adapter.bulk_update([Statement('Hi', in_response_to=[Response('Hello')])])
+
+        statement = self.adapter.update.call_args[0][0]
+
+        self.assertEqual(statement.in_response_to[0].occurrence, 2)
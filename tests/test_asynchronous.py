@@ -0,0 +1,7 @@
+import sys
+from unittest import SkipTest
+
+if sys.version_info < (3, 5):
+    raise SkipTest('The asyncio support requires Python 3.5 or later.')
+
+from .async_cases import *
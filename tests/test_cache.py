@@ -0,0 +1,141 @@
+from unittest import TestCase
+from chatterbot.utils.cache import LRUCache, ResponseCache
+from chatterbot.conversation import Statement, Response
+
+
+class LRUCacheTests(TestCase):
+
+    def setUp(self):
+        self.cache = LRUCache(maxsize=2)
+
+    def test_set(self):
+        self.cache.set('a', 1)
+        self.assertIn('a', self.cache)
+
+    def test_get(self):
+        self.cache.set('a', 1)
+        self.assertEqual(self.cache.get('a'), 1)
+
+    def test_get_missing_key(self):
+        self.assertIsNone(self.cache.get('a'))
+        self.assertEqual(self.cache.get('a', 0), 0)
+
+    def test_maxsize(self):
+        self.cache.set('a', 1)
+        self.cache.set('b', 2)
+        self.cache.set('c', 3)
+
+        self.assertEqual(len(self.cache), 2)
+        self.assertNotIn('a', self.cache)
+
+    def test_least_recently_used_removed(self):
+        self.cache.set('a', 1)
+        self.cache.set('b', 2)
+        self.cache.get('a')
+        self.cache.set('c', 3)
+
+        self.assertIn('a', self.cache)
+        self.assertNotIn('b', self.cache)
+
+    def test_remove(self):
+        self.cache.set('a', 1)
+        self.cache.remove('a')
+        self.assertNotIn('a', self.cache)
+
+    def test_clear(self):
+        self.cache.set('a', 1)
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+
+
+class ResponseCacheTests(TestCase):
+
+    def setUp(self):
+        self.cache = ResponseCache(maxsize=2)
+
+    def test_get_key_normalizes_text(self):
+        self.assertEqual(
+            self.cache.get_key('Hello  there '),
+            self.cache.get_key('hello there')
+        )
+
+    def test_get_key_base_query(self):
+        self.assertNotEqual(
+            self.cache.get_key('Hello', 'a'),
+            self.cache.get_key('Hello', 'b')
+        )
+
+    def test_hits_and_misses(self):
+        key = self.cache.get_key('Hello')
+
+        self.cache.get(key)
+        self.cache.set(key, 'value', 'Hi')
+        self.cache.get(key)
+
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_maxsize(self):
+        self.cache.set(self.cache.get_key('a'), 1, 'x')
+        self.cache.set(self.cache.get_key('b'), 2, 'y')
+        self.cache.set(self.cache.get_key('c'), 3, 'z')
+
+        self.assertEqual(len(self.cache), 2)
+        self.assertNotIn(self.cache.get_key('a'), self.cache)
+        self.assertNotIn('x', self.cache.keys_by_response)
+
+    def test_timeout(self):
+        cache = ResponseCache(timeout=-1)
+        key = cache.get_key('Hello')
+        cache.set(key, 'value', 'Hi')
+
+        self.assertIsNone(cache.get(key))
+        self.assertEqual(len(cache), 0)
+
+    def test_statement_updated_removes_entries_holding_statement(self):
+        key = self.cache.get_key('Hello')
+        self.cache.set(key, 'value', 'Hi')
+
+        self.cache.statement_updated(Statement('Hi'))
+
+        self.assertNotIn(key, self.cache)
+
+    def test_statement_updated_removes_entries_for_responses(self):
+        key = self.cache.get_key('Hello')
+        self.cache.set(key, 'value', 'Hi')
+
+        self.cache.statement_updated(
+            Statement('How are you?', in_response_to=[Response('hello')])
+        )
+
+        self.assertNotIn(key, self.cache)
+
+    def test_statement_updated_removes_entries_for_matched_statements(self):
+        key = self.cache.get_key('Hello!!')
+        self.cache.set(key, 'value', 'Hi', ['Hello'])
+
+        self.cache.statement_updated(
+            Statement('Good day.', in_response_to=[Response('hello')])
+        )
+
+        self.assertNotIn(key, self.cache)
+        self.assertEqual(self.cache.keys_by_match, {})
+
+    def test_statement_updated_keeps_entry_for_statement_input(self):
+        key = self.cache.get_key('Hello')
+        self.cache.set(key, 'value', 'Hi')
+
+        self.cache.statement_updated(Statement('Hello'))
+
+        self.assertIn(key, self.cache)
+
+    def test_statement_removed(self):
+        key = self.cache.get_key('Hello')
+        self.cache.set(key, 'value', 'Hi')
+
+        self.cache.statement_removed('Hello')
+
+        self.assertNotIn(key, self.cache)
+        self.assertEqual(self.cache.keys_by_input, {})
+        self.assertEqual(self.cache.keys_by_response, {})
+        self.assertEqual(self.cache.keys_by_match, {})
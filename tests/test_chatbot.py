@@ -1,4 +1,4 @@
-from .base_case import ChatBotTestCase
+from .base_case import ChatBotTestCase, ChatBotSqliteTestCase
 from chatterbot.conversation import Statement, Response
 
 
@@ -164,6 +164,33 @@ class ChatterBotResponseTests(ChatBotTestCase):
 
         self.assertIsNotNone(exists)
 
+class ChatterBotFeatureTests(ChatBotSqliteTestCase):
+
+    def setUp(self):
+        super(ChatterBotFeatureTests, self).setUp()
+
+        self.chatbot.storage.update(Statement('Hello', in_response_to=[Response('Hi')]))
+
+    def test_response_features_removed(self):
+        """
+        The features cached by comparison functions are saved with the
+        input statement, but are not returned with the response.
+        """
+        self.chatbot.get_response('Hi')
+
+        input_statement = Statement('Good morning', extra_data={'test': 1})
+        input_statement.set_feature('lemmas', ['morning'])
+
+        response = self.chatbot.get_response(input_statement)
+        statement, last_response = self.chatbot.recent_statements[-1]
+
+        saved_statement = self.chatbot.storage.find('Good morning')
+
+        self.assertEqual(saved_statement.get_feature('lemmas'), ['morning'])
+        self.assertEqual(statement.extra_data, {'test': 1})
+        self.assertNotIn(Statement.features_key, response.extra_data)
+
+
 class ChatBotConfigFileTestCase(ChatBotTestCase):
 
     def setUp(self):
@@ -187,4 +214,120 @@ class ChatBotConfigFileTestCase(ChatBotTestCase):
         from chatterbot import ChatBot
         self.chatbot = ChatBot.from_config(self.config_file_path)
 
-        self.assertEqual(self.chatbot.name, self.data['name'])
\ No newline at end of file
+        self.assertEqual(self.chatbot.name, self.data['name'])
+
+class ChatterBotResponseCacheTests(ChatBotSqliteTestCase):
+
+    def get_kwargs(self):
+        kwargs = super(ChatterBotResponseCacheTests, self).get_kwargs()
+        kwargs['response_cache_size'] = 10
+        return kwargs
+
+    def setUp(self):
+        super(ChatterBotResponseCacheTests, self).setUp()
+
+        self.chatbot.storage.update(
+            Statement('Hi there!', in_response_to=[Response('Hello')])
+        )
+
+    def test_cache_disabled_by_default(self):
+        from chatterbot import ChatBot
+
+        chatbot = ChatBot('Test Bot', **super(ChatterBotResponseCacheTests, self).get_kwargs())
+
+        self.assertIsNone(chatbot.response_cache)
+        chatbot.storage.drop()
+
+    def test_repeated_input_uses_cache(self):
+        self.chatbot.get_response('Hello')
+        response = self.chatbot.get_response('hello')
+
+        self.assertEqual(response, 'Hi there!')
+        self.assertEqual(self.chatbot.response_cache.hits, 1)
+        self.assertEqual(self.chatbot.response_cache.misses, 1)
+
+    def test_cache_entry_removed_on_update(self):
+        self.chatbot.get_response('Hello')
+
+        self.chatbot.storage.update(
+            Statement('Good day.', in_response_to=[Response('Hello')])
+        )
+
+        self.assertEqual(len(self.chatbot.response_cache), 0)
+
+    def test_cache_entry_removed_on_update_of_matched_statement(self):
+        self.chatbot.get_response('Hello!!')
+        cache_key = self.chatbot.response_cache.get_key(
+            'Hello!!', self.chatbot.storage.get_base_query_key()
+        )
+        self.assertIn(cache_key, self.chatbot.response_cache)
+
+        self.chatbot.storage.update(
+            Statement('Good day.', in_response_to=[Response('Hello')])
+        )
+
+        self.assertNotIn(cache_key, self.chatbot.response_cache)
+
+    def test_cache_entry_removed_on_remove(self):
+        self.chatbot.get_response('Hello')
+        self.chatbot.storage.remove('Hi there!')
+
+        self.assertEqual(len(self.chatbot.response_cache), 0)
+
+    def test_uncacheable_adapter_response_not_cached(self):
+        for adapter in self.chatbot.logic.adapters:
+            adapter.cache_responses = False
+
+        self.chatbot.get_response('Hello')
+
+        self.assertEqual(len(self.chatbot.response_cache), 0)
+
+    def test_response_without_confidence_not_cached(self):
+        from mock import MagicMock
+
+        self.chatbot.logic.get_result = MagicMock(
+            return_value=(0, Statement('Hi there!'), self.chatbot.logic.adapters, )
+        )
+
+        self.chatbot.get_response('Hello')
+
+        self.assertEqual(len(self.chatbot.response_cache), 0)
+
+
+class ChatterBotSessionTests(ChatBotSqliteTestCase):
+
+    def setUp(self):
+        super(ChatterBotSessionTests, self).setUp()
+
+        self.chatbot.storage.update(
+            Statement('Hi there!', in_response_to=[Response('Hello')])
+        )
+
+    def test_session_conversation(self):
+        self.chatbot.get_response('Hello', session_id='a')
+
+        self.assertEqual(self.chatbot.get_last_input_statement('a'), 'Hello')
+        self.assertEqual(self.chatbot.get_last_response_statement('a'), 'Hi there!')
+        self.assertTrue(self.chatbot.recent_statements.empty())
+
+    def test_sessions_kept_separate(self):
+        self.chatbot.get_response('Hello', session_id='a')
+        self.chatbot.get_response('How are you?', session_id='b')
+
+        self.assertEqual(self.chatbot.get_last_input_statement('a'), 'Hello')
+        self.assertEqual(self.chatbot.get_last_input_statement('b'), 'How are you?')
+
+    def test_learns_response_within_session(self):
+        self.chatbot.get_response('Hello', session_id='a')
+        self.chatbot.get_response('Good morning.', session_id='b')
+        self.chatbot.get_response('How are you?', session_id='a')
+
+        statement = self.chatbot.storage.find('How are you?')
+
+        self.assertEqual(statement.in_response_to, [Response('Hi there!')])
+
+    def test_default_session(self):
+        self.chatbot.get_response('Hello')
+
+        self.assertEqual(self.chatbot.get_last_input_statement(), 'Hello')
+        self.assertIs(self.chatbot.get_session(), self.chatbot.default_session)
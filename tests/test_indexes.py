@@ -0,0 +1,175 @@
+from unittest import TestCase
+from mock import patch
+from chatterbot.utils.indexes import StatementIndex, NgramIndex, MinHashIndex, PolarityIndex
+from chatterbot.conversation import Statement
+
+
+class StatementIndexTestCase(TestCase):
+
+    def test_get_features_not_implemented(self):
+        index = StatementIndex()
+
+        with self.assertRaises(NotImplementedError):
+            index.add('Hello')
+
+
+class NgramIndexTestCase(TestCase):
+
+    def setUp(self):
+        self.index = NgramIndex()
+
+    def test_get_features(self):
+        features = self.index.get_features('Hi')
+
+        self.assertIn(' hi', features)
+        self.assertIn('hi ', features)
+        self.assertIn(('hi', ), features)
+
+    def test_add(self):
+        self.index.add('Hello')
+
+        self.assertIn('Hello', self.index)
+        self.assertEqual(len(self.index), 1)
+
+    def test_remove(self):
+        self.index.add('Hello')
+        self.index.remove('Hello')
+
+        self.assertNotIn('Hello', self.index)
+        self.assertEqual(self.index.postings, {})
+
+    def test_refresh(self):
+        self.index.add('Hello')
+        self.index.add('Hi')
+
+        self.index.refresh([Statement('Hi'), Statement('Good morning')])
+
+        self.assertEqual(sorted(self.index.documents), ['Good morning', 'Hi'])
+
+    def test_remove_missing_text(self):
+        self.index.remove('Hello')
+        self.assertEqual(len(self.index), 0)
+
+    def test_populate(self):
+        self.index.populate([Statement('Hello'), Statement('Hi')])
+
+        self.assertTrue(self.index.populated)
+        self.assertEqual(len(self.index), 2)
+
+    def test_search_ranks_closest_match_first(self):
+        self.index.populate([
+            Statement('Who do you love?'),
+            Statement('What is the meaning of life?'),
+            Statement('What... is your quest?'),
+            Statement('I hear you are going on a quest?')
+        ])
+
+        results = self.index.search('What is your quest?', limit=2)
+
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[0], 'What... is your quest?')
+
+    def test_search_no_overlap(self):
+        self.index.add('xxx')
+
+        self.assertEqual(self.index.search('yyy'), [])
+
+
+def split_lemmas(statement):
+    return sorted(set(statement.text.lower().split()))
+
+
+class MinHashIndexTestCase(TestCase):
+
+    def setUp(self):
+        self.index = MinHashIndex()
+
+    def test_signature_length(self):
+        signature = self.index.get_signature(['cat', 'hungry'])
+        self.assertEqual(len(signature), self.index.bands * self.index.rows)
+
+    def test_signature_is_deterministic(self):
+        other_index = MinHashIndex()
+
+        self.assertEqual(
+            self.index.get_signature(['cat', 'hungry']),
+            other_index.get_signature(['hungry', 'cat'])
+        )
+
+    @patch('chatterbot.conversation.comparisons.get_lemmas', split_lemmas)
+    def test_get_features(self):
+        features = self.index.get_features('cat hungry')
+        self.assertEqual(len(features), self.index.bands)
+
+    @patch('chatterbot.conversation.comparisons.get_lemmas', split_lemmas)
+    def test_get_features_no_lemmas(self):
+        self.assertEqual(self.index.get_features(''), set())
+
+    @patch('chatterbot.conversation.comparisons.get_lemmas', split_lemmas)
+    def test_search(self):
+        self.index.populate([
+            Statement('young cat hungry'),
+            Statement('dog park weather')
+        ])
+
+        results = self.index.search('cat very hungry')
+
+        self.assertEqual(results, ['young cat hungry'])
+
+
+    def test_populate_uses_saved_lemmas(self):
+        with patch('chatterbot.conversation.comparisons.get_lemmas', split_lemmas):
+            expected = self.index.get_features('cat hungry')
+
+        with patch('nltk.pos_tag') as pos_tag:
+            self.index.populate([
+                Statement('The young cat', extra_data={'_features': {'lemmas': ['cat', 'hungry']}})
+            ])
+
+        self.assertFalse(pos_tag.called)
+        self.assertEqual(self.index.documents['The young cat'], expected)
+
+
+class PolarityIndexTestCase(TestCase):
+
+    def setUp(self):
+        self.index = PolarityIndex()
+        self.index.populate([
+            Statement('Terrible', extra_data={'_features': {'sentiment_polarity': -1.0}}),
+            Statement('Fine', extra_data={'_features': {'sentiment_polarity': 0.0}}),
+            Statement('Good', extra_data={'_features': {'sentiment_polarity': 0.7}}),
+            Statement('Great', extra_data={'_features': {'sentiment_polarity': 0.8}})
+        ])
+
+    def test_populate_uses_saved_polarity(self):
+        self.assertTrue(self.index.populated)
+        self.assertEqual(self.index.documents['Good'], 0.7)
+
+    def test_entries_sorted(self):
+        self.assertEqual(
+            [text for polarity, text in self.index.entries],
+            ['Terrible', 'Fine', 'Good', 'Great']
+        )
+
+    def test_insert(self):
+        self.index.insert('Okay', 0.1)
+
+        self.assertEqual(self.index.entries[2], (0.1, 'Okay', ))
+
+    def test_remove(self):
+        self.index.remove('Good')
+
+        self.assertNotIn('Good', self.index)
+        self.assertNotIn((0.7, 'Good', ), self.index.entries)
+
+    @patch('chatterbot.utils.indexes.PolarityIndex.get_polarity', lambda self, statement: 0.72)
+    def test_search(self):
+        results = self.index.search('Nice', limit=3)
+
+        self.assertEqual(results, ['Good', 'Great', 'Fine'])
+
+    @patch('chatterbot.utils.indexes.PolarityIndex.get_polarity', lambda self, statement: -2)
+    def test_search_lowest(self):
+        results = self.index.search('Awful', limit=10)
+
+        self.assertEqual(results, ['Terrible', 'Fine', 'Good', 'Great'])
@@ -29,6 +29,13 @@ class MongoAdapterTestCase(TestCase):
         self.assertIn('text', query.value()['in_response_to']['$elemMatch'])
         self.assertEqual('Hey', query.value()['in_response_to']['$elemMatch']['text'])
 
+    def test_statement_response_list_contains_does_not_modify_query(self):
+        base_query = self.query.statement_response_list_contains('Hey')
+
+        base_query.statement_response_list_contains('Hello')
+
+        self.assertEqual(base_query.value()['in_response_to']['$elemMatch']['text'], 'Hey')
+
     def test_statement_response_list_equals(self):
         query = self.query.statement_response_list_equals([])
 
@@ -40,3 +47,25 @@ class MongoAdapterTestCase(TestCase):
 
         self.assertIn('text', query.value())
         self.assertEqual(query.value()['text'], 'testing')
+
+
+class SqliteQueryTestCase(TestCase):
+
+    def setUp(self):
+        from chatterbot.adapters.storage.sqlite import Query
+        self.query = Query()
+
+    def test_no_clauses(self):
+        self.assertEqual(self.query.clauses(), ([], []))
+
+    def test_statement_text_not_in(self):
+        query = self.query.statement_text_not_in(['One', 'Two'])
+        clauses, parameters = query.clauses()
+
+        self.assertEqual(clauses, ['statement.text NOT IN (?, ?)'])
+        self.assertEqual(parameters, ['One', 'Two'])
+
+    def test_statement_text_not_in_does_not_modify_query(self):
+        self.query.statement_text_not_in(['One'])
+
+        self.assertEqual(self.query.excluded_text, [])
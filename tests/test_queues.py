@@ -1,5 +1,5 @@
 from unittest import TestCase
-from chatterbot.utils.queues import ResponseQueue
+from chatterbot.utils.queues import ResponseQueue, IndexedDeque
 
 
 class ResponseQueueTests(TestCase):
@@ -30,3 +30,123 @@ class ResponseQueueTests(TestCase):
         self.assertNotIn(0, self.queue)
         self.assertIn(1, self.queue)
         self.assertIn(2, self.queue)
+
+    def test_len(self):
+        self.queue.append(0)
+        self.assertEqual(len(self.queue), 1)
+
+    def test_iterate(self):
+        self.queue.append(0)
+        self.queue.append(1)
+        self.assertEqual(list(self.queue), [0, 1])
+
+    def test_snapshot_not_changed_by_append(self):
+        self.queue.append(0)
+        snapshot = self.queue.snapshot()
+        self.queue.append(1)
+
+        self.assertEqual(snapshot, [0])
+
+    def test_getitem(self):
+        self.queue.append(0)
+        self.queue.append(1)
+        self.assertEqual(self.queue[-1], 1)
+
+    def test_flush(self):
+        self.queue.append(0)
+        self.queue.flush()
+
+        self.assertTrue(self.queue.empty())
+        self.assertNotIn(0, self.queue)
+
+    def test_contains_unhashable(self):
+        self.queue.append([0])
+        self.assertIn([0], self.queue)
+        self.assertNotIn([1], self.queue)
+
+    def test_pickle(self):
+        import pickle
+
+        self.queue.append(0)
+        queue = pickle.loads(pickle.dumps(self.queue))
+
+        self.assertIn(0, queue)
+        self.assertEqual(queue.maxsize, 2)
+
+    def test_append_from_threads(self):
+        from threading import Thread
+
+        queue = ResponseQueue(maxsize=50)
+
+        def append_items():
+            for item in range(1000):
+                queue.append(item)
+
+        threads = [Thread(target=append_items) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(queue), 50)
+        self.assertEqual(sum(queue.queue.counts.values()), 50)
+
+
+class IndexedDequeTests(TestCase):
+
+    def setUp(self):
+        self.deque = IndexedDeque(maxlen=3)
+
+    def test_counts_follow_items(self):
+        self.deque.extend([1, 2, 2, 3])
+
+        self.assertEqual(self.deque.counts, {2: 2, 3: 1})
+        self.assertNotIn(1, self.deque)
+
+    def test_pop(self):
+        self.deque.extend([1, 2])
+        self.deque.pop()
+        self.deque.popleft()
+
+        self.assertEqual(self.deque.counts, {})
+
+    def test_appendleft(self):
+        self.deque.extend([1, 2, 3])
+        self.deque.appendleft(0)
+
+        self.assertEqual(list(self.deque), [0, 1, 2])
+        self.assertNotIn(3, self.deque)
+
+    def test_remove(self):
+        self.deque.extend([1, 2])
+        self.deque.remove(1)
+
+        self.assertNotIn(1, self.deque)
+        self.assertIn(2, self.deque)
+
+    def test_setitem(self):
+        self.deque.extend([1, 2])
+        self.deque[0] = 5
+
+        self.assertNotIn(1, self.deque)
+        self.assertIn(5, self.deque)
+
+    def test_delitem(self):
+        self.deque.extend([1, 2])
+        del self.deque[0]
+
+        self.assertNotIn(1, self.deque)
+
+    def test_clear(self):
+        self.deque.extend([1, [2]])
+        self.deque.clear()
+
+        self.assertEqual(self.deque.counts, {})
+        self.assertEqual(self.deque.unhashable_count, 0)
+
+    def test_statement_found_by_text(self):
+        from chatterbot.conversation import Statement
+
+        self.deque.append(Statement('Hello'))
+
+        self.assertIn('Hello', self.deque)
@@ -0,0 +1,100 @@
+from unittest import TestCase
+from chatterbot.adapters.storage import JsonLogStorageAdapter
+from chatterbot.utils.sampling import RandomKeys
+from chatterbot.conversation import Statement, Response
+
+
+class RandomKeysTests(TestCase):
+
+    def setUp(self):
+        self.keys = RandomKeys(['a', 'b', 'c'])
+
+    def test_add(self):
+        self.keys.add('d')
+        self.assertIn('d', self.keys)
+        self.assertEqual(len(self.keys), 4)
+
+    def test_add_existing_key(self):
+        self.keys.add('a')
+        self.assertEqual(len(self.keys), 3)
+
+    def test_remove(self):
+        self.keys.remove('a')
+
+        self.assertNotIn('a', self.keys)
+        self.assertEqual(sorted(self.keys.keys), ['b', 'c'])
+        self.assertEqual(self.keys.positions, {'c': 0, 'b': 1})
+
+    def test_remove_last_key(self):
+        self.keys.remove('c')
+        self.assertEqual(self.keys.keys, ['a', 'b'])
+
+    def test_remove_missing_key(self):
+        self.keys.remove('d')
+        self.assertEqual(len(self.keys), 3)
+
+    def test_choice(self):
+        self.assertIn(self.keys.choice(), ['a', 'b', 'c'])
+
+    def test_choice_empty(self):
+        self.assertIsNone(RandomKeys().choice())
+
+    def test_sample(self):
+        sample = self.keys.sample(10)
+
+        self.assertEqual(len(sample), 10)
+        self.assertTrue(set(sample).issubset(set(['a', 'b', 'c'])))
+
+    def test_sample_empty(self):
+        self.assertEqual(RandomKeys().sample(10), [])
+
+
+class RandomStatementPoolTests(TestCase):
+
+    def setUp(self):
+        self.adapter = JsonLogStorageAdapter(
+            database='test-random-pool.jsonl',
+            random_statement_pool_size=10
+        )
+        self.pool = self.adapter.random_statement_pool
+
+        self.adapter.update(Statement('Hi', in_response_to=[Response('Hello')]))
+
+    def tearDown(self):
+        self.adapter.drop()
+
+    def test_get(self):
+        statement = self.adapter.get_random()
+
+        self.assertIn(statement.text, ['Hi', 'Hello'])
+
+    def test_get_fills_pool(self):
+        self.pool.get()
+
+        if self.pool.refill_thread is not None:
+            self.pool.refill_thread.join()
+
+        self.assertGreater(len(self.pool), 0)
+
+    def test_get_empty_database(self):
+        self.adapter.drop()
+
+        with self.assertRaises(self.adapter.EmptyDatabaseException):
+            self.adapter.get_random()
+
+    def test_removed_statement_discarded(self):
+        self.pool.fill()
+        self.adapter.remove('Hello')
+
+        texts = [statement.text for statement in self.pool.statements]
+
+        self.assertNotIn('Hello', texts)
+
+    def test_refill_in_background(self):
+        self.pool.refill_in_background()
+
+        thread = self.pool.refill_thread
+        if thread is not None:
+            thread.join()
+
+        self.assertEqual(len(self.pool), 10)
@@ -0,0 +1,104 @@
+from threading import Thread
+from chatterbot.conversation import Statement, Response
+from chatterbot.filters import RepetitiveResponseFilter
+from .base_case import ChatBotSqliteTestCase
+
+
+class ThreadSafetyTestMixin(object):
+    """
+    Get responses from a single chat bot in many threads at
+    once, and check that nothing the bot learned was lost.
+
+    Each conversation replies to the bot with 'Hi there!', which is
+    learned as a response to itself. The statement is then the closest
+    match to the input of the other conversations, so it is read and
+    saved by several threads at once.
+    """
+
+    thread_count = 8
+
+    conversations_per_thread = 10
+
+    def setUp(self):
+        super(ThreadSafetyTestMixin, self).setUp()
+
+        self.chatbot.storage.update(
+            Statement('Hi there!', in_response_to=[Response('Hello')])
+        )
+
+    def run_in_threads(self, target):
+        errors = []
+
+        def run(thread_number):
+            try:
+                target(thread_number)
+            except Exception as exception:
+                errors.append(exception)
+
+        threads = [
+            Thread(target=run, args=(thread_number, ))
+            for thread_number in range(0, self.thread_count)
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+
+    def have_conversations(self, thread_number):
+        for conversation in range(0, self.conversations_per_thread):
+            session_id = '{}-{}'.format(thread_number, conversation)
+
+            self.chatbot.get_response('Hello', session_id=session_id)
+            self.chatbot.get_response('Hi there!', session_id=session_id)
+
+    def test_response_occurrence_is_not_lost(self):
+        self.run_in_threads(self.have_conversations)
+
+        statement = self.chatbot.storage.find('Hi there!')
+        occurrences = dict(
+            (response.text, response.occurrence) for response in statement.in_response_to
+        )
+
+        self.assertEqual(occurrences, {
+            'Hello': 1,
+            'Hi there!': self.thread_count * self.conversations_per_thread
+        })
+
+    def test_sessions_are_not_mixed(self):
+        self.run_in_threads(self.have_conversations)
+
+        for thread_number in range(0, self.thread_count):
+            for conversation in range(0, self.conversations_per_thread):
+                session = self.chatbot.get_session('{}-{}'.format(thread_number, conversation))
+                inputs = [statement.text for statement, response in session.conversation]
+
+                self.assertEqual(inputs, ['Hello', 'Hi there!'])
+
+    def test_filters_in_each_thread(self):
+        self.chatbot.filters = (RepetitiveResponseFilter(), )
+
+        self.run_in_threads(self.have_conversations)
+
+        statement = self.chatbot.storage.find('Hi there!')
+        response = statement.in_response_to[statement.in_response_to.index('Hi there!')]
+
+        self.assertEqual(
+            response.occurrence,
+            self.thread_count * self.conversations_per_thread
+        )
+
+
+class SqliteThreadSafetyTestCase(ThreadSafetyTestMixin, ChatBotSqliteTestCase):
+    pass
+
+
+class JsonLogThreadSafetyTestCase(ThreadSafetyTestMixin, ChatBotSqliteTestCase):
+
+    def get_kwargs(self):
+        kwargs = super(JsonLogThreadSafetyTestCase, self).get_kwargs()
+        kwargs['storage_adapter'] = 'chatterbot.adapters.storage.JsonLogStorageAdapter'
+        return kwargs
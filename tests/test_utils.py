@@ -112,3 +112,26 @@ class CleanTests(TestCase):
         normal_text = "Kluft skrams infor pa federal electoral groe"
 
         self.assertEqual(clean_text, normal_text)
+
+
+class ProgressBarTests(TestCase):
+
+    def get_output(self, *args):
+        from chatterbot.utils.progress import print_progress_bar
+        from mock import patch
+        from io import StringIO
+
+        with patch('sys.stdout', new_callable=StringIO) as stdout:
+            print_progress_bar(*args)
+
+        return stdout.getvalue()
+
+    def test_partial_progress(self):
+        output = self.get_output(u'Training', 1, 4, 4)
+
+        self.assertEqual(output, u'\rTraining: [#   ] 25%')
+
+    def test_complete_progress(self):
+        output = self.get_output(u'Training', 4, 4, 4)
+
+        self.assertEqual(output, u'\rTraining: [####] 100%\n')
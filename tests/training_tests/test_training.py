@@ -1,3 +1,4 @@
+from unittest import TestCase
 from tests.base_case import ChatBotTestCase
 from chatterbot.trainers import ListTrainer
 
@@ -7,3 +8,97 @@ class TrainingTests(ChatBotTestCase):
     def test_trainer_not_set(self):
         with self.assertRaises(ListTrainer.TrainerInitializationException):
             self.chatbot.train()
+
+
+class TrainingBatchTests(TestCase):
+
+    def setUp(self):
+        from chatterbot.trainers import TrainingBatch
+        self.batch = TrainingBatch()
+
+    def test_add_conversation(self):
+        self.batch.add_conversation(['Hi', 'Hello', 'How are you?'])
+
+        self.assertEqual(len(self.batch), 3)
+        statements = self.batch.get_statements()
+
+        self.assertEqual(statements[0].in_response_to, [])
+        self.assertIn('Hi', statements[1].in_response_to)
+
+    def test_duplicate_responses_merged(self):
+        self.batch.add_conversation(['Hi', 'Hello', 'Hi', 'Hello'])
+
+        statement = self.batch.get_statements()[1]
+
+        self.assertEqual(len(self.batch), 2)
+        self.assertEqual(statement.in_response_to[0].occurrence, 2)
+
+    def test_save(self):
+        from mock import MagicMock
+
+        storage = MagicMock()
+        self.batch.add_conversation(['Hi', 'Hello'])
+        self.batch.save(storage)
+
+        self.assertEqual(len(storage.bulk_update.call_args[0][0]), 2)
+        self.assertEqual(len(self.batch), 0)
+
+    def test_save_empty_batch(self):
+        from mock import MagicMock
+
+        storage = MagicMock()
+        self.batch.save(storage)
+
+        self.assertFalse(storage.bulk_update.called)
+
+    def test_build_training_batches(self):
+        from chatterbot.trainers import build_training_batches
+        from chatterbot.corpus import Corpus
+
+        file_path = Corpus().list_corpus_files('chatterbot.corpus.english.greetings')[0]
+
+        conversations = list(Corpus().read_conversations(file_path))
+        longest = max(len(conversation) for conversation in conversations)
+
+        batches = build_training_batches(file_path, 10)
+
+        for conversation in conversations:
+            self.batch.add_conversation(conversation)
+
+        self.assertTrue(len(batches) > 1)
+        self.assertTrue(all(len(batch) < 10 + longest for batch in batches))
+        texts = []
+        for batch in batches:
+            texts.extend(text for text in batch.responses if text not in texts)
+
+        self.assertEqual(list(self.batch.responses.keys()), texts)
+
+
+class ParallelCorpusTrainingTests(TestCase):
+
+    def setUp(self):
+        import tempfile
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.directory)
+
+    def get_saved_statements(self, **kwargs):
+        from chatterbot.adapters.storage import SqliteStorageAdapter
+        from chatterbot.trainers import ChatterBotCorpusTrainer
+        import os
+
+        storage = SqliteStorageAdapter(
+            database=os.path.join(self.directory, '{}.db'.format(len(os.listdir(self.directory))))
+        )
+        trainer = ChatterBotCorpusTrainer(storage, training_batch_size=50, **kwargs)
+        trainer.train('chatterbot.corpus.english')
+
+        return [statement.serialize() for statement in storage.filter()]
+
+    def test_parallel_training_matches_sequential_training(self):
+        sequential = self.get_saved_statements()
+
+        self.assertEqual(sequential, self.get_saved_statements(training_processes=2))
+        self.assertEqual(sequential, self.get_saved_statements(training_processes=3))